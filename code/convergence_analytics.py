@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Vectorized convergence analytics on pivoted (run, timestep) trajectories.
+
+Every function takes arrays shaped (..., run, timestep), so one cell or a
+stack of cells (mechanism, run, timestep) is reduced with the same array
+operations; summarize_mode stacks all mechanisms of a mode and computes the
+paper statistics for them in one pass.
+"""
+
+from dataclasses import dataclass
+from typing import Dict
+
+import numpy as np
+
+from trajectory_data import TrajectoryCell
+
+MONOTONIC_TOLERANCE = 0.001  # Allowed per-step decrease (numerical noise)
+
+
+@dataclass
+class ConvergenceSummary:
+    """Convergence statistics of one (mode, mechanism) cell."""
+    initial_alpha: float
+    final_alpha: float
+    final_alpha_std: float
+    improvement_pct: float
+    initial_friction: float
+    final_friction: float
+    friction_reduction_pct: float
+    monotonic_pct: float
+    mean_convergence_time: float  # Time periods to the target fraction of final alpha
+
+
+def first_crossing_times(values, threshold, timesteps=None, not_reached=None):
+    """
+    First timestep at which each run reaches threshold (values >= threshold).
+
+    threshold broadcasts against values[..., 0] (e.g. one target per cell);
+    runs that never reach it get not_reached (default: number of timesteps).
+    """
+    values = np.asarray(values)
+    n_timesteps = values.shape[-1]
+    timesteps = np.arange(n_timesteps) if timesteps is None else np.asarray(timesteps)
+    not_reached = n_timesteps if not_reached is None else not_reached
+
+    reached = values >= np.asarray(threshold)[..., np.newaxis]
+    first = reached.argmax(axis=-1)
+    return np.where(reached.any(axis=-1), timesteps[first], not_reached)
+
+
+def time_to_fraction_of_final(alpha, fraction=0.9, timesteps=None, not_reached=None):
+    """Per-run first crossing of fraction × (mean final alpha across runs)."""
+    target = fraction * np.mean(alpha[..., -1], axis=-1, dtype=np.float64)
+    return first_crossing_times(alpha, target[..., np.newaxis], timesteps, not_reached)
+
+
+def monotonic_share(values, tolerance=MONOTONIC_TOLERANCE):
+    """Fraction of runs that never decrease by more than tolerance per step."""
+    monotonic = (np.diff(values, axis=-1) >= -tolerance).all(axis=-1)
+    return monotonic.mean(axis=-1)
+
+
+def relative_change(values):
+    """(final - initial) / initial of the across-run means."""
+    initial = np.mean(values[..., 0], axis=-1, dtype=np.float64)
+    final = np.mean(values[..., -1], axis=-1, dtype=np.float64)
+    return (final - initial) / initial
+
+
+def summarize(alpha, friction, fraction=0.9, timesteps=None, not_reached=None,
+              tolerance=MONOTONIC_TOLERANCE) -> Dict[str, np.ndarray]:
+    """All ConvergenceSummary fields for (..., run, timestep) arrays."""
+    return {
+        'initial_alpha': np.mean(alpha[..., 0], axis=-1, dtype=np.float64),
+        'final_alpha': np.mean(alpha[..., -1], axis=-1, dtype=np.float64),
+        'final_alpha_std': np.std(alpha[..., -1], axis=-1, ddof=1, dtype=np.float64),
+        'improvement_pct': 100 * relative_change(alpha),
+        'initial_friction': np.mean(friction[..., 0], axis=-1, dtype=np.float64),
+        'final_friction': np.mean(friction[..., -1], axis=-1, dtype=np.float64),
+        'friction_reduction_pct': -100 * relative_change(friction),
+        'monotonic_pct': 100 * monotonic_share(alpha, tolerance),
+        'mean_convergence_time': np.mean(
+            time_to_fraction_of_final(alpha, fraction, timesteps, not_reached), axis=-1),
+    }
+
+
+def summarize_mode(data: Dict[str, TrajectoryCell], fraction=0.9, not_reached=None,
+                   tolerance=MONOTONIC_TOLERANCE) -> Dict[str, ConvergenceSummary]:
+    """
+    ConvergenceSummary for every cell of a mode.
+
+    Cells with the same shape and timesteps (the usual case) are stacked
+    and reduced together; otherwise each cell is reduced on its own.
+    """
+    keys = list(data)
+    if not keys:
+        return {}
+
+    cells = [data[key] for key in keys]
+    same_grid = all(cell['alpha'].shape == cells[0]['alpha'].shape
+                    and np.array_equal(cell.timesteps, cells[0].timesteps) for cell in cells)
+    if same_grid:
+        fields = summarize(np.stack([cell['alpha'] for cell in cells]),
+                           np.stack([cell['friction'] for cell in cells]),
+                           fraction, cells[0].timesteps, not_reached, tolerance)
+        return {key: ConvergenceSummary(**{name: float(values[i]) for name, values in fields.items()})
+                for i, key in enumerate(keys)}
+
+    return {key: ConvergenceSummary(**{
+                name: float(value) for name, value in summarize(
+                    cell['alpha'], cell['friction'], fraction, cell.timesteps,
+                    not_reached, tolerance).items()})
+            for key, cell in zip(keys, cells)}
@@ -7,11 +7,13 @@ Creates three key figures:
 3. Convergence speed comparison
 """
 
-import pandas as pd
 import matplotlib.pyplot as plt
 import numpy as np
 from pathlib import Path
 
+from trajectory_data import load_mode
+from convergence_analytics import summarize_mode
+
 # Publication-quality matplotlib settings
 plt.rcParams.update({
     'font.size': 11,
@@ -39,27 +41,17 @@ MECHANISMS = {
     'random_assignment': {'label': 'Random Assignment', 'color': '#9467bd'},
 }
 
+DATA_DIR = Path('/home/purrpower/Resurrexi/projects/need-work/consent-theory')
+
 def load_data(mode='learning'):
-    """Load all mechanism data for specified mode."""
-    data = {}
-    base_path = Path('/home/purrpower/Resurrexi/projects/need-work/consent-theory')
-
-    for mech_key in MECHANISMS.keys():
-        filename = f'dynamics_results_{mode}_{mech_key}.csv'
-        filepath = base_path / filename
-        if filepath.exists():
-            df = pd.read_csv(filepath)
-            data[mech_key] = df
-        else:
-            print(f"Warning: {filename} not found")
-
-    return data
-
-def compute_stats(df):
-    """Compute mean and 95% CI across runs for each timestep."""
-    grouped = df.groupby('timestep')['alpha'].agg(['mean', 'std', 'count'])
-    grouped['ci_95'] = 1.96 * grouped['std'] / np.sqrt(grouped['count'])
-    return grouped
+    """Load all mechanism data for specified mode (parsed once per process)."""
+    return load_mode(DATA_DIR, mode, MECHANISMS.keys())
+
+def compute_stats(values):
+    """Mean and 95% CI across runs for each timestep of a (run, timestep) array."""
+    mean = values.mean(axis=0, dtype=np.float64)
+    std = values.std(axis=0, ddof=1, dtype=np.float64)
+    return mean, 1.96 * std / np.sqrt(values.shape[0])
 
 def figure1_alpha_convergence():
     """Figure 1: Alpha trajectories with 95% CI for all mechanisms."""
@@ -71,19 +63,19 @@ def figure1_alpha_convergence():
         if mech_key not in data:
             continue
 
-        stats = compute_stats(data[mech_key])
-        timesteps = stats.index
+        cell = data[mech_key]
+        mean, ci_95 = compute_stats(cell['alpha'])
 
         # Plot mean line
-        ax.plot(timesteps, stats['mean'],
+        ax.plot(cell.timesteps, mean,
                 label=mech_data['label'],
                 color=mech_data['color'],
                 linewidth=2)
 
         # Plot 95% CI as shaded region
-        ax.fill_between(timesteps,
-                        stats['mean'] - stats['ci_95'],
-                        stats['mean'] + stats['ci_95'],
+        ax.fill_between(cell.timesteps,
+                        mean - ci_95,
+                        mean + ci_95,
                         color=mech_data['color'],
                         alpha=0.2)
 
@@ -97,7 +89,7 @@ def figure1_alpha_convergence():
 
     # Add annotation for DoCS final value
     if 'stakesweighted_docs' in data:
-        final_alpha = compute_stats(data['stakesweighted_docs']).iloc[-1]['mean']
+        final_alpha = compute_stats(data['stakesweighted_docs']['alpha'])[0][-1]
         ax.annotate(f'DoCS: α = {final_alpha:.3f}',
                    xy=(49, final_alpha), xytext=(42, final_alpha + 0.03),
                    arrowprops=dict(arrowstyle='->', color='black', lw=1),
@@ -122,24 +114,21 @@ def figure2_friction_reduction():
             continue
 
         mech_data = MECHANISMS[mech_key]
-        df = data[mech_key]
+        cell = data[mech_key]
 
         # Compute friction stats
-        grouped = df.groupby('timestep')['friction'].agg(['mean', 'std', 'count'])
-        grouped['ci_95'] = 1.96 * grouped['std'] / np.sqrt(grouped['count'])
-
-        timesteps = grouped.index
+        mean, ci_95 = compute_stats(cell['friction'])
 
         # Plot mean line
-        ax.plot(timesteps, grouped['mean'],
+        ax.plot(cell.timesteps, mean,
                 label=mech_data['label'],
                 color=mech_data['color'],
                 linewidth=2)
 
         # Plot 95% CI
-        ax.fill_between(timesteps,
-                        grouped['mean'] - grouped['ci_95'],
-                        grouped['mean'] + grouped['ci_95'],
+        ax.fill_between(cell.timesteps,
+                        mean - ci_95,
+                        mean + ci_95,
                         color=mech_data['color'],
                         alpha=0.2)
 
@@ -152,9 +141,9 @@ def figure2_friction_reduction():
 
     # Add annotation for DoCS friction reduction
     if 'stakesweighted_docs' in data:
-        df_docs = data['stakesweighted_docs']
-        initial_F = df_docs[df_docs['timestep'] == 0]['friction'].mean()
-        final_F = df_docs[df_docs['timestep'] == 49]['friction'].mean()
+        friction_docs = data['stakesweighted_docs']['friction']
+        initial_F = friction_docs[:, 0].mean(dtype=np.float64)
+        final_F = friction_docs[:, -1].mean(dtype=np.float64)
         reduction_pct = 100 * (initial_F - final_F) / initial_F
 
         ax.text(25, ax.get_ylim()[1] * 0.85,
@@ -170,24 +159,11 @@ def figure3_convergence_speed():
     """Figure 3: Time to 90% of final alpha (bar chart)."""
     data = load_data('learning')
 
-    convergence_times = {}
-
-    for mech_key, df in data.items():
-        # Compute final alpha (mean of last timestep across all runs)
-        final_alpha = df[df['timestep'] == 49]['alpha'].mean()
-        target_alpha = 0.9 * final_alpha
-
-        # For each run, find first timestep where alpha >= target
-        times = []
-        for run_id in df['run'].unique():
-            run_data = df[df['run'] == run_id].sort_values('timestep')
-            converged = run_data[run_data['alpha'] >= target_alpha]
-            if len(converged) > 0:
-                times.append(converged.iloc[0]['timestep'])
-            else:
-                times.append(50)  # Didn't converge
-
-        convergence_times[mech_key] = np.mean(times)
+    # Mean first timestep at which a run reaches 90% of its mechanism's final α
+    # (runs that never do count as the full horizon)
+    summaries = summarize_mode(data, fraction=0.9)
+    convergence_times = {mech_key: summary.mean_convergence_time
+                         for mech_key, summary in summaries.items()}
 
     # Create bar chart
     fig, ax = plt.subplots(figsize=(10, 6))
@@ -225,39 +201,16 @@ def print_statistics():
     print("KEY STATISTICS FOR PAPER REVISION")
     print("="*60)
 
-    for mech_key, df in data.items():
+    for mech_key, summary in summarize_mode(data).items():
         label = MECHANISMS[mech_key]['label']
 
-        # Final alpha
-        final_alpha = df[df['timestep'] == 49]['alpha'].mean()
-        final_alpha_std = df[df['timestep'] == 49]['alpha'].std()
-
-        # Initial alpha
-        initial_alpha = df[df['timestep'] == 0]['alpha'].mean()
-
-        # Alpha improvement
-        improvement_pct = 100 * (final_alpha - initial_alpha) / initial_alpha
-
-        # Final friction
-        final_friction = df[df['timestep'] == 49]['friction'].mean()
-        initial_friction = df[df['timestep'] == 0]['friction'].mean()
-        friction_reduction_pct = 100 * (initial_friction - final_friction) / initial_friction
-
-        # Monotonic convergence check
-        monotonic_count = 0
-        for run_id in df['run'].unique():
-            run_data = df[df['run'] == run_id].sort_values('timestep')
-            if (run_data['alpha'].diff().dropna() >= -0.001).all():  # Allow tiny decreases (numerical noise)
-                monotonic_count += 1
-        monotonic_pct = 100 * monotonic_count / df['run'].nunique()
-
         print(f"\n{label}:")
-        print(f"  Final α: {final_alpha:.4f} (±{final_alpha_std:.4f})")
-        print(f"  Initial α: {initial_alpha:.4f}")
-        print(f"  Improvement: +{improvement_pct:.1f}%")
-        print(f"  Final F: {final_friction:.2f}")
-        print(f"  Friction reduction: -{friction_reduction_pct:.1f}%")
-        print(f"  Monotonic runs: {monotonic_pct:.1f}%")
+        print(f"  Final α: {summary.final_alpha:.4f} (±{summary.final_alpha_std:.4f})")
+        print(f"  Initial α: {summary.initial_alpha:.4f}")
+        print(f"  Improvement: +{summary.improvement_pct:.1f}%")
+        print(f"  Final F: {summary.final_friction:.2f}")
+        print(f"  Friction reduction: -{summary.friction_reduction_pct:.1f}%")
+        print(f"  Monotonic runs: {summary.monotonic_pct:.1f}%")
 
     print("\n" + "="*60 + "\n")
 
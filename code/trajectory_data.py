@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Shared loader for dynamics_results_<mode>_<mechanism>.csv trajectories.
+
+Each CSV is parsed at most once per process and only for the columns asked
+for, with compact dtypes (int32 run, int16 timestep, float32 metrics).
+Metrics come back pivoted to (run, timestep) arrays, so figures index and
+reduce along axes instead of filtering 50k-row frames.
+"""
+
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Iterable, Tuple
+
+import numpy as np
+import pandas as pd
+
+COLUMN_DTYPES = {
+    'run': np.int32,
+    'timestep': np.int16,
+    'alpha': np.float32,
+    'friction': np.float32,
+    'population': np.float32,
+}
+
+
+@dataclass(frozen=True)
+class TrajectoryCell:
+    """Pivoted trajectories of one (mode, mechanism) cell (read-only arrays)."""
+    runs: np.ndarray              # Shape: (n_runs,)
+    timesteps: np.ndarray         # Shape: (n_timesteps,)
+    metrics: Dict[str, np.ndarray]  # Each (n_runs, n_timesteps)
+
+    def __getitem__(self, metric: str) -> np.ndarray:
+        return self.metrics[metric]
+
+    @property
+    def n_runs(self) -> int:
+        return len(self.runs)
+
+
+@lru_cache(maxsize=None)
+def _load_cell(path: str, metrics: Tuple[str, ...]) -> TrajectoryCell:
+    """Parse one CSV (cached per path and column set) and pivot it."""
+    df = pd.read_csv(path, usecols=['run', 'timestep', *metrics],
+                     dtype={name: COLUMN_DTYPES[name] for name in ('run', 'timestep', *metrics)})
+
+    runs, run_index = np.unique(df['run'].to_numpy(), return_inverse=True)
+    timesteps, timestep_index = np.unique(df['timestep'].to_numpy(), return_inverse=True)
+
+    pivoted = {}
+    for metric in metrics:
+        values = np.full((len(runs), len(timesteps)), np.nan, dtype=COLUMN_DTYPES[metric])
+        values[run_index, timestep_index] = df[metric].to_numpy()
+        values.flags.writeable = False
+        pivoted[metric] = values
+
+    runs.flags.writeable = False
+    timesteps.flags.writeable = False
+    return TrajectoryCell(runs=runs, timesteps=timesteps, metrics=pivoted)
+
+
+def load_cell(path, metrics: Iterable[str] = ('alpha', 'friction')) -> TrajectoryCell:
+    """
+    Load one CSV as pivoted (run, timestep) arrays.
+
+    Repeated calls with the same path and metrics return the cached cell;
+    its arrays are read-only because they are shared between callers.
+    """
+    return _load_cell(str(Path(path).resolve()), tuple(sorted(metrics)))
+
+
+def load_mode(base_path, mode: str, mechanism_keys: Iterable[str],
+              metrics: Iterable[str] = ('alpha', 'friction')) -> Dict[str, TrajectoryCell]:
+    """Load every available mechanism for a dynamic mode, keyed by file key."""
+    data = {}
+    for mech_key in mechanism_keys:
+        filename = f'dynamics_results_{mode}_{mech_key}.csv'
+        filepath = Path(base_path) / filename
+        if filepath.exists():
+            data[mech_key] = load_cell(filepath, metrics)
+        else:
+            print(f"Warning: {filename} not found")
+    return data
+
+
+def clear_cache():
+    """Drop all cached cells (e.g. after the CSVs were regenerated)."""
+    _load_cell.cache_clear()
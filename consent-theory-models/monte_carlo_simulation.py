@@ -22,6 +22,10 @@ import matplotlib.pyplot as plt
 from typing import Dict, List, Tuple
 from dataclasses import dataclass
 import warnings
+import zlib
+from scipy import stats
+from scipy.special import ndtri
+from scipy.stats import qmc
 warnings.filterwarnings('ignore')
 
 # Set random seed for reproducibility
@@ -33,6 +37,12 @@ N_RUNS = 1000          # Monte Carlo iterations per mechanism
 N_TIMESTEPS = 50       # Time periods for convergence analysis
 N_DOMAINS = 10         # Number of decision domains
 
+# Independently scrambled Sobol replicates per society batch (sampling='sobol')
+QMC_REPLICATES = 8
+
+# Largest dimension scipy's Sobol generator supports (2 + 4 n_agents ≤ this)
+SOBOL_MAX_DIMENSION = 21201
+
 @dataclass
 class SimulationResults:
     """Container for simulation outcomes"""
@@ -46,44 +56,209 @@ class SimulationResults:
     std_legitimacy: float
 
 
+# ==============================================================================
+# RANDOM STREAMS
+# ==============================================================================
+# Every function that draws random numbers takes an optional rng. Passing None
+# draws from the legacy global state seeded above; passing a Generator makes
+# the draw independent of everything else in the process. The legacy calls
+# used here (pareto, uniform, random, normal, choice, shuffle,
+# standard_normal) exist with the same signature on both.
+
+def resolve_rng(rng):
+    """Return rng, or the global np.random state if rng is None"""
+    return np.random if rng is None else rng
+
+
+def _stream_key(name: str) -> int:
+    """Stable 32-bit key for a mechanism or mode name (hash() is salted per process)"""
+    return zlib.crc32(name.encode('utf-8'))
+
+
+def run_rng(seed: int, mechanism_name: str, dynamic_mode: str, run: int) -> np.random.Generator:
+    """
+    Counter-based random stream for a single Monte Carlo run.
+
+    The stream is a Philox generator keyed by (seed, mechanism, mode, run),
+    so any run can be regenerated on its own without replaying the runs
+    before it, and sharded execution draws the same numbers as serial.
+
+    Args:
+        seed: Master seed
+        mechanism_name: ConsentMechanism.name
+        dynamic_mode: Dynamic mode ('static' for the static simulation)
+        run: Run index within the (mechanism, mode) cell
+
+    Returns:
+        Generator for this run
+    """
+    seed_seq = np.random.SeedSequence(
+        seed, spawn_key=(_stream_key(dynamic_mode), _stream_key(mechanism_name), run))
+    return np.random.Generator(np.random.Philox(seed_seq))
+
+
+def block_rng(seed: int, mechanism_name: str, dynamic_mode: str,
+              first_run: int, n_runs: int) -> np.random.Generator:
+    """
+    Random stream for a batch of runs [first_run, first_run + n_runs).
+
+    Batched engines draw every run of a block from one stream, so results
+    depend on the block boundaries but not on where the block is executed.
+    """
+    seed_seq = np.random.SeedSequence(
+        seed, spawn_key=(_stream_key(dynamic_mode), _stream_key(mechanism_name), first_run, n_runs))
+    return np.random.Generator(np.random.Philox(seed_seq))
+
+
+@dataclass
+class DecisionMetrics:
+    """Metrics for one decision, or arrays of them for a batch of populations"""
+    alpha: float
+    friction: float
+    performance: float
+    legitimacy: float
+
+
 class ConsentMechanism:
     """Base class for consent allocation mechanisms"""
 
+    # True if allocate_consent returns the same allocation on every call with
+    # the same inputs; static runners then evaluate such mechanisms only once
+    deterministic = False
+
+    # True if allocations depend on earlier observe() calls; engines that
+    # draw every period's consent up front then fall back to stepping
+    stateful = False
+
     def __init__(self, name: str):
         self.name = name
 
-    def allocate_consent(self, stakes: np.ndarray, wealth: np.ndarray = None) -> np.ndarray:
+    def reset(self):
+        """Forget anything learned from earlier runs; called when a run starts"""
+        pass
+
+    def observe(self, decisions, preferences: np.ndarray, stakes: np.ndarray):
+        """
+        Feedback after each decision, with the preferences and stakes the
+        decision is scored against. Stateless mechanisms ignore it.
+
+        Args:
+            decisions: Implemented policy, scalar or shape (n_runs,)
+            preferences: Agent ideal points, shape (N_AGENTS,) or (n_runs, N_AGENTS)
+            stakes: Agent stakes, same shape as preferences
+        """
+        pass
+
+    def allocate_consent(self, stakes: np.ndarray, wealth: np.ndarray = None,
+                         rng: np.random.Generator = None) -> np.ndarray:
         """
         Allocate consent power C_i across agents.
 
         Args:
             stakes: Array of shape (N_AGENTS,) representing agent stakes in domain
             wealth: Array of shape (N_AGENTS,) for plutocratic mechanism
+            rng: Random stream for stochastic mechanisms (global state if None)
 
         Returns:
             consent_power: Array of shape (N_AGENTS,) summing to 1.0
         """
         raise NotImplementedError
 
+    def allocate_consent_batch(self, stakes: np.ndarray, wealth: np.ndarray = None,
+                               rng: np.random.Generator = None,
+                               active: np.ndarray = None) -> np.ndarray:
+        """
+        Allocate consent power for many populations in one call.
+
+        Args:
+            stakes: Array of shape (n_runs, N_AGENTS), or (N_AGENTS,) for a single population
+            wealth: Array of the same shape as stakes
+            rng: Random stream for stochastic mechanisms (global state if None)
+            active: Optional boolean mask of the same shape. Inactive agents get
+                zero consent and the mechanism runs on the active ones only, so
+                populations may shrink without resizing arrays
+
+        Returns:
+            consent_power: Array of the same shape as stakes, each row summing
+            to 1.0 (0.0 for rows with no active agents)
+        """
+        if np.ndim(stakes) == 1:
+            wealth = None if wealth is None else wealth[np.newaxis, :]
+            active = None if active is None else active[np.newaxis, :]
+            return self.allocate_consent_batch(stakes[np.newaxis, :], wealth, rng, active)[0]
+        if active is None:
+            return self._allocate_batch(stakes, wealth, rng)
+        return self._allocate_masked(stakes, wealth, active, rng)
+
+    def _allocate_batch(self, stakes: np.ndarray, wealth: np.ndarray,
+                        rng: np.random.Generator = None) -> np.ndarray:
+        """Row-wise allocation for 2-D inputs; subclasses override with vectorized versions"""
+        if wealth is None:
+            return np.stack([self.allocate_consent(s, rng=rng) for s in stakes])
+        return np.stack([self.allocate_consent(s, w, rng=rng) for s, w in zip(stakes, wealth)])
+
+    def _allocate_masked(self, stakes: np.ndarray, wealth: np.ndarray, active: np.ndarray,
+                         rng: np.random.Generator = None) -> np.ndarray:
+        """Row-wise allocation over active agents; subclasses override with vectorized versions"""
+        consent = np.zeros(stakes.shape)
+        for row, mask in enumerate(active):
+            if mask.any():
+                consent[row, mask] = self.allocate_consent(
+                    stakes[row, mask], None if wealth is None else wealth[row, mask], rng=rng
+                )
+        return consent
+
+
+def _normalize_rows(weights: np.ndarray, active: np.ndarray = None) -> np.ndarray:
+    """
+    Row-wise normalisation to sum 1, falling back to equal shares for all-zero
+    rows. With an active mask, inactive weights are zeroed and the fallback
+    shares go to active agents only.
+    """
+    if active is not None:
+        weights = np.where(active, weights, 0.0)
+        totals = np.sum(weights, axis=1, keepdims=True)
+        equal_shares = active / np.maximum(np.sum(active, axis=1, keepdims=True), 1)
+        return np.where(totals == 0, equal_shares, weights / np.where(totals == 0, 1.0, totals))
+
+    n_agents = weights.shape[1]
+    totals = np.sum(weights, axis=1, keepdims=True)
+    safe_totals = np.where(totals == 0, 1.0, totals)
+    return np.where(totals == 0, 1.0 / n_agents, weights / safe_totals)
+
 
 class EqualVoice(ConsentMechanism):
     """One person one vote - pure democracy"""
 
+    deterministic = True
+
     def __init__(self):
         super().__init__("Equal Voice")
 
-    def allocate_consent(self, stakes: np.ndarray, wealth: np.ndarray = None) -> np.ndarray:
+    def allocate_consent(self, stakes: np.ndarray, wealth: np.ndarray = None,
+                         rng: np.random.Generator = None) -> np.ndarray:
         n = len(stakes)
         return np.ones(n) / n
 
+    def _allocate_batch(self, stakes: np.ndarray, wealth: np.ndarray,
+                        rng: np.random.Generator = None) -> np.ndarray:
+        return np.full(stakes.shape, 1.0 / stakes.shape[1])
+
+    def _allocate_masked(self, stakes: np.ndarray, wealth: np.ndarray, active: np.ndarray,
+                         rng: np.random.Generator = None) -> np.ndarray:
+        return active / np.maximum(np.sum(active, axis=1, keepdims=True), 1)
+
 
 class StakesWeighted(ConsentMechanism):
     """DoCS mechanism - consent proportional to stakes"""
 
+    deterministic = True
+
     def __init__(self):
         super().__init__("Stakes-Weighted DoCS")
 
-    def allocate_consent(self, stakes: np.ndarray, wealth: np.ndarray = None) -> np.ndarray:
+    def allocate_consent(self, stakes: np.ndarray, wealth: np.ndarray = None,
+                         rng: np.random.Generator = None) -> np.ndarray:
         # Normalize stakes to sum to 1
         stakes_sum = np.sum(stakes)
         if stakes_sum == 0:
@@ -91,20 +266,39 @@ class StakesWeighted(ConsentMechanism):
             return np.ones(len(stakes)) / len(stakes)
         return stakes / stakes_sum
 
+    def _allocate_batch(self, stakes: np.ndarray, wealth: np.ndarray,
+                        rng: np.random.Generator = None) -> np.ndarray:
+        return _normalize_rows(stakes)
+
+    def _allocate_masked(self, stakes: np.ndarray, wealth: np.ndarray, active: np.ndarray,
+                         rng: np.random.Generator = None) -> np.ndarray:
+        return _normalize_rows(stakes, active)
+
 
 class Plutocracy(ConsentMechanism):
     """Power proportional to wealth, independent of stakes"""
 
+    deterministic = True
+
     def __init__(self):
         super().__init__("Plutocracy")
 
-    def allocate_consent(self, stakes: np.ndarray, wealth: np.ndarray) -> np.ndarray:
+    def allocate_consent(self, stakes: np.ndarray, wealth: np.ndarray,
+                         rng: np.random.Generator = None) -> np.ndarray:
         # Consent follows wealth, not stakes in this domain
         wealth_sum = np.sum(wealth)
         if wealth_sum == 0:
             return np.ones(len(wealth)) / len(wealth)
         return wealth / wealth_sum
 
+    def _allocate_batch(self, stakes: np.ndarray, wealth: np.ndarray,
+                        rng: np.random.Generator = None) -> np.ndarray:
+        return _normalize_rows(wealth)
+
+    def _allocate_masked(self, stakes: np.ndarray, wealth: np.ndarray, active: np.ndarray,
+                         rng: np.random.Generator = None) -> np.ndarray:
+        return _normalize_rows(wealth, active)
+
 
 class RandomAssignment(ConsentMechanism):
     """Sortition - random single agent has all power"""
@@ -112,11 +306,33 @@ class RandomAssignment(ConsentMechanism):
     def __init__(self):
         super().__init__("Random Assignment")
 
-    def allocate_consent(self, stakes: np.ndarray, wealth: np.ndarray = None) -> np.ndarray:
+    def allocate_consent(self, stakes: np.ndarray, wealth: np.ndarray = None,
+                         rng: np.random.Generator = None) -> np.ndarray:
         n = len(stakes)
         consent = np.zeros(n)
         # Randomly select one agent
-        consent[np.random.randint(0, n)] = 1.0
+        consent[resolve_rng(rng).choice(n)] = 1.0
+        return consent
+
+    def _allocate_batch(self, stakes: np.ndarray, wealth: np.ndarray,
+                        rng: np.random.Generator = None) -> np.ndarray:
+        n_runs, n = stakes.shape
+        consent = np.zeros((n_runs, n))
+        # One draw per run in a single call
+        consent[np.arange(n_runs), resolve_rng(rng).choice(n, size=n_runs)] = 1.0
+        return consent
+
+    def _allocate_masked(self, stakes: np.ndarray, wealth: np.ndarray, active: np.ndarray,
+                         rng: np.random.Generator = None) -> np.ndarray:
+        n_runs, n = stakes.shape
+        n_active = np.sum(active, axis=1)
+        # Pick the k-th active agent of each row, k uniform on [0, n_active)
+        k = np.floor(resolve_rng(rng).random(n_runs) * n_active)
+        chosen = np.argmax(np.cumsum(active, axis=1) > k[:, np.newaxis], axis=1)
+
+        consent = np.zeros((n_runs, n))
+        consent[np.arange(n_runs), chosen] = 1.0
+        consent[n_active == 0] = 0.0
         return consent
 
 
@@ -127,55 +343,176 @@ class ExpertRule(ConsentMechanism):
         super().__init__("Expert Rule")
         self.elite_fraction = elite_fraction
 
-    def allocate_consent(self, stakes: np.ndarray, wealth: np.ndarray = None) -> np.ndarray:
+    def allocate_consent(self, stakes: np.ndarray, wealth: np.ndarray = None,
+                         rng: np.random.Generator = None) -> np.ndarray:
         n = len(stakes)
         n_elite = max(1, int(n * self.elite_fraction))
 
         # Elite selection based on random competence metric (uncorrelated with stakes)
-        competence = np.random.randn(n)
+        competence = resolve_rng(rng).standard_normal(n)
         elite_indices = np.argsort(competence)[-n_elite:]
 
         consent = np.zeros(n)
         consent[elite_indices] = 1.0 / n_elite
         return consent
 
+    def _allocate_batch(self, stakes: np.ndarray, wealth: np.ndarray,
+                        rng: np.random.Generator = None) -> np.ndarray:
+        n_runs, n = stakes.shape
+        n_elite = max(1, int(n * self.elite_fraction))
+
+        # Only membership of the top n_elite matters, so a partial sort suffices
+        competence = resolve_rng(rng).standard_normal((n_runs, n))
+        elite_indices = np.argpartition(competence, n - n_elite, axis=1)[:, n - n_elite:]
+
+        consent = np.zeros((n_runs, n))
+        np.put_along_axis(consent, elite_indices, 1.0 / n_elite, axis=1)
+        return consent
+
+    def _allocate_masked(self, stakes: np.ndarray, wealth: np.ndarray, active: np.ndarray,
+                         rng: np.random.Generator = None) -> np.ndarray:
+        n_runs, n = stakes.shape
+        n_elite = np.maximum(1, (np.sum(active, axis=1) * self.elite_fraction).astype(int))
+
+        # Inactive agents rank last; elite size varies by row, so rank fully
+        competence = np.where(active, resolve_rng(rng).standard_normal((n_runs, n)), -np.inf)
+        rank = np.empty((n_runs, n), dtype=np.int64)
+        np.put_along_axis(rank, np.argsort(-competence, axis=1), np.arange(n), axis=1)
+
+        elite = active & (rank < n_elite[:, np.newaxis])
+        return elite / n_elite[:, np.newaxis]
+
+
+class AdaptiveConsent(ConsentMechanism):
+    """Institution that learns its allocation from observed friction"""
+
+    stateful = True
+
+    def __init__(self, learning_rate: float = 0.1):
+        super().__init__("Adaptive Consent")
+        self.learning_rate = learning_rate
+        self.consent = None
+
+    def reset(self):
+        self.consent = None
+
+    def _current(self, shape: Tuple[int, ...]) -> np.ndarray:
+        """Current allocation in the requested shape, starting from equal voice"""
+        if self.consent is None or self.consent.size != np.prod(shape):
+            self.consent = np.full(shape, 1.0 / shape[-1])
+        return self.consent.reshape(shape).copy()
+
+    def allocate_consent(self, stakes: np.ndarray, wealth: np.ndarray = None,
+                         rng: np.random.Generator = None) -> np.ndarray:
+        return self._current(np.shape(stakes))
+
+    def _allocate_batch(self, stakes: np.ndarray, wealth: np.ndarray,
+                        rng: np.random.Generator = None) -> np.ndarray:
+        return self._current(stakes.shape)
+
+    def _allocate_masked(self, stakes: np.ndarray, wealth: np.ndarray, active: np.ndarray,
+                         rng: np.random.Generator = None) -> np.ndarray:
+        return _normalize_rows(self._current(stakes.shape), active)
+
+    def observe(self, decisions, preferences: np.ndarray, stakes: np.ndarray):
+        """
+        Projected subgradient step on F(d) = Σ s_j |d - x*_j|.
+
+        Raising c_i and renormalising moves d towards x*_i, so along the
+        simplex ∂F/∂c_i = F'(d) (x*_i - d) with F'(d) = Σ s_j sign(d - x*_j):
+        O(n) per decision, where finite differences need a perturbed decision
+        per agent. The step is scaled by 1 / (n Σ s_j) so the learning rate
+        carries over between population sizes.
+        """
+        n_agents = np.shape(preferences)[-1]
+        decisions = np.asarray(decisions)[..., np.newaxis]
+
+        slope = np.sum(stakes * np.sign(decisions - preferences), axis=-1, keepdims=True)
+        total_stakes = np.sum(stakes, axis=-1, keepdims=True)
+        step = self.learning_rate / (n_agents * np.where(total_stakes > 0, total_stakes, 1.0))
 
-def generate_heterogeneous_stakes(n_agents: int, distribution_type: str = 'mixed') -> np.ndarray:
+        consent = self._current(np.shape(preferences)) - step * slope * (preferences - decisions)
+        np.maximum(consent, 0.0, out=consent)
+        self.consent = _normalize_rows(consent.reshape(-1, n_agents)).reshape(np.shape(preferences))
+
+
+def generate_heterogeneous_stakes(n_agents: int, distribution_type: str = 'mixed',
+                                  rng: np.random.Generator = None) -> np.ndarray:
     """
     Generate realistic heterogeneous stakes distribution.
 
     Args:
         n_agents: Number of agents
         distribution_type: 'concentrated', 'uniform', 'mixed'
+        rng: Random stream (global state if None)
 
     Returns:
         stakes: Non-negative stakes summing to n_agents (for normalization)
     """
+    rng = resolve_rng(rng)
+
     if distribution_type == 'concentrated':
         # Power law: few high-stakes, many low-stakes (coastal property example)
         # More extreme heterogeneity
-        stakes = np.random.pareto(a=1.2, size=n_agents) + 0.05
+        stakes = rng.pareto(a=1.2, size=n_agents) + 0.05
         # Create explicit minority high-stakes group (20% of population with 70% of stakes)
         n_high = int(0.2 * n_agents)
         stakes[:n_high] *= 5.0  # High-stakes minority
     elif distribution_type == 'uniform':
         # Everyone affected similarly (monetary policy)
-        stakes = np.random.uniform(0.9, 1.1, size=n_agents)
+        stakes = rng.uniform(0.9, 1.1, size=n_agents)
     else:  # mixed
         # Combination: some domains concentrated, some uniform
         # 60% concentrated (where DoCS should shine), 40% uniform
-        if np.random.rand() > 0.4:
+        if rng.random() > 0.4:
             # Concentrated stakes with minority at high stakes
-            stakes = np.random.pareto(a=1.3, size=n_agents) + 0.05
+            stakes = rng.pareto(a=1.3, size=n_agents) + 0.05
             n_high = int(0.15 * n_agents)
             stakes[:n_high] *= 6.0
         else:
-            stakes = np.random.uniform(0.85, 1.15, size=n_agents)
+            stakes = rng.uniform(0.85, 1.15, size=n_agents)
 
     # Normalize to mean 1 for interpretability
     return stakes / np.mean(stakes)
 
 
+def generate_society(n_agents: int,
+                     rng: np.random.Generator = None) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Draw one society: mixed stakes, Pareto wealth, and preferences that are
+    normal or bimodal with equal probability.
+
+    Args:
+        n_agents: Number of agents
+        rng: Random stream (global state if None)
+
+    Returns:
+        stakes, wealth, preferences: Arrays of shape (n_agents,)
+    """
+    rng = resolve_rng(rng)
+
+    # Generate agent characteristics (fixed across time for this run)
+    stakes = generate_heterogeneous_stakes(n_agents, distribution_type='mixed', rng=rng)
+
+    # Wealth deliberately decoupled from stakes (Pearson r ≈ 0.1-0.3)
+    # Wealthy != high stakes in domain (plutocracy failure condition)
+    wealth = rng.pareto(a=1.16, size=n_agents) + 0.5  # Pareto wealth (Gini ≈ 0.4)
+    rng.shuffle(wealth)  # Break any accidental correlation with stakes
+
+    # Agent preferences (vary by domain but stable in time)
+    # Use bimodal distribution to create value conflicts
+    if rng.random() > 0.5:
+        preferences = rng.normal(0, 1, n_agents)
+    else:
+        # Bimodal: two clusters
+        cluster = rng.choice([0, 1], size=n_agents)
+        preferences = np.where(cluster == 0,
+                              rng.normal(-1.5, 0.5, n_agents),
+                              rng.normal(1.5, 0.5, n_agents))
+
+    return stakes, wealth, preferences
+
+
 def compute_friction(decision: float, preferences: np.ndarray, stakes: np.ndarray) -> float:
     """
     Compute friction F(d) = Σ s_i * |x_d - x*_i|
@@ -209,30 +546,7 @@ def compute_alpha(decision: float, preferences: np.ndarray, stakes: np.ndarray,
     Returns:
         alpha: Consent alignment in [0, 1]
     """
-    # Weighted decision (what consent-holders want)
-    weighted_decision = np.sum(consent * preferences)
-
-    # Friction from weighted decision
-    f_weighted = compute_friction(weighted_decision, preferences, stakes)
-
-    # Maximum possible friction (decision at extreme vs all preferences)
-    pref_min, pref_max = np.min(preferences), np.max(preferences)
-    pref_range = pref_max - pref_min
-    if pref_range == 0:
-        return 1.0  # Perfect alignment if no preference variation
-
-    # Worst-case friction (decision at one extreme)
-    f_max = max(
-        compute_friction(pref_min, preferences, stakes),
-        compute_friction(pref_max, preferences, stakes)
-    )
-
-    if f_max == 0:
-        return 1.0
-
-    # α = 1 - (friction / max_friction), bounded to [0, 1]
-    alpha = 1.0 - (f_weighted / f_max)
-    return np.clip(alpha, 0.0, 1.0)
+    return compute_metrics(decision, preferences, stakes, consent).alpha
 
 
 def compute_performance(decision: float, preferences: np.ndarray, stakes: np.ndarray) -> float:
@@ -249,31 +563,32 @@ def compute_performance(decision: float, preferences: np.ndarray, stakes: np.nda
     Returns:
         performance: Performance metric in [0, 1]
     """
-    # Actual friction from decision
-    f_actual = compute_friction(decision, preferences, stakes)
+    return compute_metrics(decision, preferences, stakes).performance
 
-    # Optimal decision minimizes friction (stakes-weighted median)
-    optimal_decision = weighted_median(preferences, stakes)
-    f_optimal = compute_friction(optimal_decision, preferences, stakes)
 
-    # Max friction
-    pref_min, pref_max = np.min(preferences), np.max(preferences)
-    f_max = max(
-        compute_friction(pref_min, preferences, stakes),
-        compute_friction(pref_max, preferences, stakes)
-    )
+# Above this size weighted_median switches from a full sort to quickselect
+WEIGHTED_SELECT_MIN_SIZE = 16384
 
-    if f_max == 0:
-        return 1.0
 
-    # Performance relative to optimal
-    performance = 1.0 - (f_actual / f_max)
-    return np.clip(performance, 0.0, 1.0)
+def weighted_median(values: np.ndarray, weights: np.ndarray,
+                    sorter: np.ndarray = None) -> float:
+    """
+    Compute weighted median: the smallest value at which the cumulative
+    weight reaches half the total.
 
+    Args:
+        values: Values to take the median of
+        weights: Non-negative weight per value
+        sorter: Optional indices that sort values (e.g. FrictionOracle.order),
+            reused instead of sorting again
 
-def weighted_median(values: np.ndarray, weights: np.ndarray) -> float:
-    """Compute weighted median"""
-    sorted_idx = np.argsort(values)
+    Returns:
+        median: Weighted median value
+    """
+    if sorter is None and len(values) >= WEIGHTED_SELECT_MIN_SIZE:
+        return _weighted_quickselect(values, weights, np.sum(weights) / 2.0)
+
+    sorted_idx = np.argsort(values) if sorter is None else sorter
     sorted_values = values[sorted_idx]
     sorted_weights = weights[sorted_idx]
 
@@ -284,6 +599,65 @@ def weighted_median(values: np.ndarray, weights: np.ndarray) -> float:
     return sorted_values[median_idx]
 
 
+def _weighted_quickselect(values: np.ndarray, weights: np.ndarray, target: float) -> float:
+    """
+    Smallest value whose cumulative weight reaches target, in expected O(n).
+
+    Each round partitions around the middle element and keeps only the side
+    that contains the target weight, so the working set halves every round.
+    """
+    weight_below = 0.0
+    while len(values) > 64:
+        k = len(values) // 2
+        idx = np.argpartition(values, k)
+        lower = idx[:k]
+
+        w_lower = weight_below + np.sum(weights[lower])
+        if w_lower >= target:
+            values, weights = values[lower], weights[lower]
+            continue
+
+        w_through_pivot = w_lower + weights[idx[k]]
+        if w_through_pivot >= target:
+            return values[idx[k]]
+
+        weight_below = w_through_pivot
+        upper = idx[k + 1:]
+        values, weights = values[upper], weights[upper]
+
+    # Small remainder: finish with a sort
+    sorted_idx = np.argsort(values)
+    cumsum = weight_below + np.cumsum(weights[sorted_idx])
+    median_idx = min(np.searchsorted(cumsum, target), len(values) - 1)
+    return values[sorted_idx][median_idx]
+
+
+def weighted_median_batch(values: np.ndarray, weights: np.ndarray,
+                          sorter: np.ndarray = None) -> np.ndarray:
+    """
+    Row-wise weighted median of (n_runs, n_agents) arrays.
+
+    One axis-wise sort serves every row, or none at all when the caller
+    passes a cached sort order.
+
+    Args:
+        values: Array of shape (n_runs, n_agents)
+        weights: Array of shape (n_runs, n_agents)
+        sorter: Optional (n_runs, n_agents) indices that sort each row of values
+
+    Returns:
+        medians: Array of shape (n_runs,)
+    """
+    if sorter is None:
+        sorter = np.argsort(values, axis=1)
+    sorted_values = np.take_along_axis(values, sorter, axis=1)
+    cumsum = np.cumsum(np.take_along_axis(weights, sorter, axis=1), axis=1)
+
+    # Row-wise searchsorted(cumsum, total / 2): count entries below the target
+    median_idx = np.sum(cumsum < cumsum[:, -1:] / 2.0, axis=1)
+    return sorted_values[np.arange(len(values)), median_idx]
+
+
 def compute_legitimacy(alpha: float, performance: float,
                        w_consent: float = 0.6, w_performance: float = 0.4) -> float:
     """
@@ -301,10 +675,699 @@ def compute_legitimacy(alpha: float, performance: float,
     return w_consent * alpha + w_performance * performance
 
 
+def _extreme_frictions(preferences: np.ndarray, stakes: np.ndarray,
+                       pref_min, pref_max, axis: int = -1):
+    """
+    Friction of a decision at either preference extreme.
+
+    Every agent lies on the same side of an extreme, so
+    F(pref_min) = Σ s_i x*_i - pref_min Σ s_i and F(pref_max) = pref_max Σ s_i - Σ s_i x*_i,
+    which needs one weighted sum instead of two passes over |x_d - x*_i|.
+    """
+    total_stakes = np.sum(stakes, axis=axis)
+    weighted_prefs = np.sum(stakes * preferences, axis=axis)
+    return weighted_prefs - pref_min * total_stakes, pref_max * total_stakes - weighted_prefs
+
+
+def compute_metrics(decision: float, preferences: np.ndarray, stakes: np.ndarray,
+                    consent: np.ndarray = None,
+                    w_consent: float = 0.6, w_performance: float = 0.4) -> DecisionMetrics:
+    """
+    Compute α, F, P and L for one decision in a single pass over the population.
+
+    The preference extremes and worst-case friction F_max are computed once
+    and shared by α and P. When consent is omitted, the decision is taken to
+    be the consent-weighted decision, so its friction is reused for α.
+
+    Args:
+        decision: Implemented policy
+        preferences: Agent ideal points
+        stakes: Agent stakes
+        consent: Consent power allocation C_i (optional, see above)
+        w_consent: Legitimacy weight for consent (default 0.6)
+        w_performance: Legitimacy weight for performance (default 0.4)
+
+    Returns:
+        DecisionMetrics with alpha, friction, performance and legitimacy
+    """
+    friction = compute_friction(decision, preferences, stakes)
+
+    if consent is None:
+        f_weighted = friction
+    else:
+        weighted_decision = np.sum(consent * preferences)
+        f_weighted = compute_friction(weighted_decision, preferences, stakes)
+
+    pref_min, pref_max = np.min(preferences), np.max(preferences)
+    if pref_max == pref_min:
+        # No preference variation: perfect alignment and performance
+        f_max = 0.0
+    else:
+        f_max = max(_extreme_frictions(preferences, stakes, pref_min, pref_max))
+
+    if f_max == 0:
+        alpha, performance = 1.0, 1.0
+    else:
+        alpha = np.clip(1.0 - (f_weighted / f_max), 0.0, 1.0)
+        performance = np.clip(1.0 - (friction / f_max), 0.0, 1.0)
+
+    return DecisionMetrics(
+        alpha=alpha,
+        friction=friction,
+        performance=performance,
+        legitimacy=compute_legitimacy(alpha, performance, w_consent, w_performance)
+    )
+
+
+# ==============================================================================
+# BATCHED ENGINE
+# ==============================================================================
+# Vectorized counterparts of the functions above. Populations of runs are held
+# as 2-D arrays of shape (n_runs, n_agents) and every run advances one timestep
+# per iteration, so the Python loop is over timesteps only.
+
+def generate_heterogeneous_stakes_batch(n_runs: int, n_agents: int,
+                                        distribution_type: str = 'mixed',
+                                        rng: np.random.Generator = None) -> np.ndarray:
+    """
+    Batched version of generate_heterogeneous_stakes.
+
+    Args:
+        n_runs: Number of independent societies
+        n_agents: Number of agents per society
+        distribution_type: 'concentrated', 'uniform', 'mixed'
+        rng: Random stream (global state if None)
+
+    Returns:
+        stakes: Array of shape (n_runs, n_agents), each row with mean 1
+    """
+    rng = resolve_rng(rng)
+
+    if distribution_type == 'concentrated':
+        stakes = rng.pareto(a=1.2, size=(n_runs, n_agents)) + 0.05
+        n_high = int(0.2 * n_agents)
+        stakes[:, :n_high] *= 5.0
+    elif distribution_type == 'uniform':
+        stakes = rng.uniform(0.9, 1.1, size=(n_runs, n_agents))
+    else:  # mixed
+        # Each run independently picks concentrated (60%) or uniform (40%)
+        concentrated = rng.random(n_runs) > 0.4
+        n_concentrated = int(np.sum(concentrated))
+        n_high = int(0.15 * n_agents)
+
+        stakes = np.empty((n_runs, n_agents))
+        stakes[concentrated] = rng.pareto(a=1.3, size=(n_concentrated, n_agents)) + 0.05
+        stakes[concentrated, :n_high] *= 6.0
+        stakes[~concentrated] = rng.uniform(0.85, 1.15,
+                                                  size=(n_runs - n_concentrated, n_agents))
+
+    return stakes / np.mean(stakes, axis=1, keepdims=True)
+
+
+def generate_society_batch(n_runs: int, n_agents: int,
+                           rng: np.random.Generator = None) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Draw stakes, wealth and preferences for n_runs societies at once.
+
+    Same distributions as generate_society: mixed stakes, Pareto wealth, and
+    preferences that are normal or bimodal with equal probability.
+
+    Returns:
+        stakes, wealth, preferences: Arrays of shape (n_runs, n_agents)
+    """
+    rng = resolve_rng(rng)
+    stakes = generate_heterogeneous_stakes_batch(n_runs, n_agents, distribution_type='mixed', rng=rng)
+
+    # Wealth draws are i.i.d., so the per-run shuffle of the scalar path is a no-op here
+    wealth = rng.pareto(a=1.16, size=(n_runs, n_agents)) + 0.5
+
+    unimodal = rng.random(n_runs) > 0.5
+    n_unimodal = int(np.sum(unimodal))
+    n_bimodal = n_runs - n_unimodal
+
+    preferences = np.empty((n_runs, n_agents))
+    preferences[unimodal] = rng.normal(0, 1, (n_unimodal, n_agents))
+    cluster = rng.choice([0, 1], size=(n_bimodal, n_agents))
+    preferences[~unimodal] = np.where(cluster == 0,
+                                      rng.normal(-1.5, 0.5, (n_bimodal, n_agents)),
+                                      rng.normal(1.5, 0.5, (n_bimodal, n_agents)))
+
+    return stakes, wealth, preferences
+
+
+def compute_friction_batch(decisions: np.ndarray, preferences: np.ndarray,
+                           stakes: np.ndarray) -> np.ndarray:
+    """
+    Batched compute_friction: one decision per population.
+
+    Any number of leading batch axes is allowed, e.g. (n_timesteps, n_runs);
+    stakes broadcast against preferences.
+
+    Args:
+        decisions: Array of shape (n_runs,)
+        preferences: Array of shape (n_runs, n_agents)
+        stakes: Array of shape (n_runs, n_agents)
+
+    Returns:
+        friction: Array of shape (n_runs,)
+    """
+    deviations = np.abs(decisions[..., np.newaxis] - preferences)
+    return np.sum(stakes * deviations, axis=-1)
+
+
+def compute_metrics_batch(decisions: np.ndarray, preferences: np.ndarray, stakes: np.ndarray,
+                          consent: np.ndarray = None,
+                          w_consent: float = 0.6, w_performance: float = 0.4,
+                          active: np.ndarray = None) -> DecisionMetrics:
+    """
+    Batched compute_metrics over (n_runs, n_agents) populations.
+
+    Zero preference range implies zero worst-case friction, so both degenerate
+    cases of the scalar version map to α = P = 1.0. Leading batch axes are
+    handled as in compute_friction_batch.
+
+    Args:
+        decisions: Array of shape (n_runs,)
+        preferences: Array of shape (n_runs, n_agents)
+        stakes: Array of shape (n_runs, n_agents)
+        consent: Array of shape (n_runs, n_agents), optional as in compute_metrics
+        active: Optional boolean mask of shape (n_runs, n_agents). Metrics
+            cover active agents only (inactive stakes count as zero and their
+            preferences are ignored); rows with none active get α = F = P = 0
+
+    Returns:
+        DecisionMetrics whose fields are arrays of shape (n_runs,)
+    """
+    if active is not None:
+        stakes = np.where(active, stakes, 0.0)
+
+    friction = compute_friction_batch(decisions, preferences, stakes)
+
+    if consent is None:
+        f_weighted = friction
+    else:
+        weighted_decisions = np.sum(consent * preferences, axis=-1)
+        f_weighted = compute_friction_batch(weighted_decisions, preferences, stakes)
+
+    if active is None:
+        pref_min, pref_max = np.min(preferences, axis=-1), np.max(preferences, axis=-1)
+    else:
+        empty = ~np.any(active, axis=-1)
+        pref_min = np.where(empty, 0.0, np.min(preferences, axis=-1, where=active, initial=np.inf))
+        pref_max = np.where(empty, 0.0, np.max(preferences, axis=-1, where=active, initial=-np.inf))
+    f_max = np.maximum(*_extreme_frictions(preferences, stakes, pref_min, pref_max, axis=-1))
+    degenerate = (pref_max == pref_min) | (f_max == 0)
+    safe_f_max = np.where(degenerate, 1.0, f_max)
+
+    alpha = np.where(degenerate, 1.0, np.clip(1.0 - f_weighted / safe_f_max, 0.0, 1.0))
+    performance = np.where(degenerate, 1.0, np.clip(1.0 - friction / safe_f_max, 0.0, 1.0))
+    if active is not None:
+        # Collapsed populations: nobody left to align with
+        alpha = np.where(empty, 0.0, alpha)
+        performance = np.where(empty, 0.0, performance)
+
+    return DecisionMetrics(
+        alpha=alpha,
+        friction=friction,
+        performance=performance,
+        legitimacy=compute_legitimacy(alpha, performance, w_consent, w_performance)
+    )
+
+
+def compute_alpha_batch(decisions: np.ndarray, preferences: np.ndarray, stakes: np.ndarray,
+                        consent: np.ndarray) -> np.ndarray:
+    """Batched compute_alpha; returns an array of shape (n_runs,)"""
+    return compute_metrics_batch(decisions, preferences, stakes, consent).alpha
+
+
+def compute_performance_batch(decisions: np.ndarray, preferences: np.ndarray,
+                              stakes: np.ndarray) -> np.ndarray:
+    """Batched compute_performance; returns an array of shape (n_runs,)"""
+    return compute_metrics_batch(decisions, preferences, stakes).performance
+
+
+# ==============================================================================
+# VARIANCE REDUCTION
+# ==============================================================================
+# Societies can also be built from a matrix of uniforms, one row per run,
+# through the inverse CDFs of the distributions used above. Choosing those
+# uniforms as antithetic pairs (u, 1 - u) or as scrambled Sobol points makes
+# runs negatively correlated or evenly spread, so means converge faster. Runs
+# are then no longer independent, and estimate_mean accounts for that.
+
+SAMPLING_METHODS = ('pseudo', 'antithetic', 'sobol')
+
+
+def society_dimension(n_agents: int) -> int:
+    """
+    Uniforms per society: stakes and preference regimes first (they drive
+    most of the between-run variance), then stakes, wealth, preference
+    clusters and preference values, n_agents each.
+    """
+    return 2 + 4 * n_agents
+
+
+def sobol_run_count(n_runs: int) -> int:
+    """
+    Smallest run count ≥ n_runs that sampling='sobol' accepts: QMC_REPLICATES
+    replicates of a power-of-two size, so every replicate is a balanced
+    Sobol net.
+    """
+    per_replicate = max(1, -(-n_runs // QMC_REPLICATES))
+    return QMC_REPLICATES * (1 << (per_replicate - 1).bit_length())
+
+
+def society_uniforms(n_runs: int, n_agents: int, sampling: str = 'pseudo',
+                     rng: np.random.Generator = None) -> np.ndarray:
+    """
+    Uniforms for n_runs societies.
+
+    Args:
+        n_runs: Number of societies
+        n_agents: Number of agents per society
+        sampling: 'pseudo' (independent), 'antithetic' (rows 2k and 2k + 1
+            are u and 1 - u) or 'sobol' (QMC_REPLICATES independently
+            scrambled Sobol sequences in consecutive blocks of rows; needs
+            n_runs == sobol_run_count(n_runs) and
+            society_dimension(n_agents) ≤ SOBOL_MAX_DIMENSION)
+        rng: Random stream (global state if None)
+
+    Returns:
+        uniforms: Array of shape (n_runs, society_dimension(n_agents)) in (0, 1)
+    """
+    rng = resolve_rng(rng)
+    dimension = society_dimension(n_agents)
+
+    if sampling == 'pseudo':
+        uniforms = rng.random((n_runs, dimension))
+    elif sampling == 'antithetic':
+        base = rng.random(((n_runs + 1) // 2, dimension))
+        uniforms = np.stack([base, 1.0 - base], axis=1).reshape(-1, dimension)[:n_runs]
+    elif sampling == 'sobol':
+        if dimension > SOBOL_MAX_DIMENSION:
+            raise ValueError(
+                f"sampling='sobol' supports at most {(SOBOL_MAX_DIMENSION - 2) // 4} agents "
+                f"(Sobol dimension 2 + 4 n_agents ≤ {SOBOL_MAX_DIMENSION}), got {n_agents}")
+        if n_runs != sobol_run_count(n_runs):
+            raise ValueError(
+                f"sampling='sobol' needs n_runs = {QMC_REPLICATES} x a power of two so each "
+                f"replicate is balanced (e.g. {sobol_run_count(n_runs)}), got {n_runs}")
+
+        log2_size = (n_runs // QMC_REPLICATES).bit_length() - 1
+        # The module-wide filter would hide scipy's QMC warnings; let them through here
+        with warnings.catch_warnings():
+            warnings.simplefilter('default')
+            uniforms = np.concatenate([
+                qmc.Sobol(dimension, scramble=True,
+                          seed=np.random.default_rng(int(rng.random() * 2**63))).random_base2(log2_size)
+                for _ in range(QMC_REPLICATES)
+            ])
+    else:
+        raise ValueError(f"Unknown sampling method: {sampling}")
+
+    # Keep the inverse CDFs finite
+    return np.clip(uniforms, 1e-12, 1.0 - 1e-12)
+
+
+def generate_society_from_uniforms(uniforms: np.ndarray,
+                                   n_agents: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Map uniforms to societies with the distributions of generate_society_batch.
+
+    Pareto (Lomax) draws use U^(-1/a) - 1, normals the inverse normal CDF.
+
+    Args:
+        uniforms: Array of shape (n_runs, society_dimension(n_agents))
+        n_agents: Number of agents per society
+
+    Returns:
+        stakes, wealth, preferences: Arrays of shape (n_runs, n_agents)
+    """
+    concentrated = uniforms[:, 0] > 0.4
+    unimodal = uniforms[:, 1] > 0.5
+    u_stakes, u_wealth, u_cluster, u_prefs = np.split(uniforms[:, 2:], 4, axis=1)
+
+    # Mixed stakes: concentrated Pareto with a high-stakes minority, or uniform
+    n_high = int(0.15 * n_agents)
+    pareto_stakes = u_stakes ** (-1 / 1.3) - 1 + 0.05
+    pareto_stakes[:, :n_high] *= 6.0
+    stakes = np.where(concentrated[:, np.newaxis], pareto_stakes, 0.85 + 0.3 * u_stakes)
+    stakes /= np.mean(stakes, axis=1, keepdims=True)
+
+    wealth = u_wealth ** (-1 / 1.16) - 1 + 0.5
+
+    # Normal, or bimodal with equal-sized clusters at ±1.5
+    z = ndtri(u_prefs)
+    bimodal = np.where(u_cluster < 0.5, -1.5, 1.5) + 0.5 * z
+    preferences = np.where(unimodal[:, np.newaxis], z, bimodal)
+
+    return stakes, wealth, preferences
+
+
+@dataclass
+class MeanEstimate:
+    """Monte Carlo mean with its standard error under the sampling design used"""
+    mean: float
+    std_error: float
+    ci_half_width: float  # 95% (t-based)
+    variance_reduction: float  # Plain-MC variance of the mean / this estimator's
+
+
+def estimate_mean(values: np.ndarray, sampling: str = 'pseudo',
+                  confidence: float = 0.95) -> MeanEstimate:
+    """
+    Mean of per-run values and its standard error for the given sampling.
+
+    Antithetic runs are averaged in pairs and Sobol runs per scrambled
+    replicate; the spread of those independent units gives the standard error.
+    variance_reduction compares it with s² / n, the variance of the mean had
+    the same runs been independent. Every run has the plain-MC marginal
+    distribution, so s² still estimates the per-run variance.
+
+    Args:
+        values: Per-run values, in the row order of society_uniforms
+        sampling: Sampling method the runs were generated with
+        confidence: CI level
+
+    Returns:
+        MeanEstimate
+    """
+    values = np.asarray(values, dtype=float)
+    n_runs = len(values)
+
+    if sampling == 'pseudo':
+        units = values
+    elif sampling == 'antithetic':
+        # An unpaired last run would bias the pair means; leave it out of the spread
+        units = values[:n_runs // 2 * 2].reshape(-1, 2).mean(axis=1)
+    elif sampling == 'sobol':
+        sizes = np.diff(np.linspace(0, n_runs, QMC_REPLICATES + 1).astype(int))
+        units = np.array([block.mean() for block in np.split(values, np.cumsum(sizes)[:-1])])
+    else:
+        raise ValueError(f"Unknown sampling method: {sampling}")
+
+    variance_of_mean = np.var(units, ddof=1) / len(units)
+    plain_variance_of_mean = np.var(values, ddof=1) / n_runs
+    std_error = np.sqrt(variance_of_mean)
+
+    return MeanEstimate(
+        mean=np.mean(values),
+        std_error=std_error,
+        ci_half_width=stats.t.ppf(0.5 + confidence / 2, len(units) - 1) * std_error,
+        variance_reduction=(plain_variance_of_mean / variance_of_mean
+                            if variance_of_mean > 0 else np.inf)
+    )
+
+
+# ==============================================================================
+# FRICTION ORACLE
+# ==============================================================================
+
+class FrictionOracle:
+    """
+    Precomputed friction index for populations whose preferences and stakes
+    are fixed (static mode, or any sweep over candidate decisions).
+
+    Preferences are sorted once and prefix sums of s_i and s_i * x*_i kept. With
+    k agents at or below x, W_k and S_k the corresponding prefix sums and W, S
+    the totals,
+
+        F(x) = x W_k - S_k + (S - S_k) - x (W - W_k)
+
+    so each query costs one binary search plus O(1) arithmetic.
+
+    Accepts a single population of shape (N_AGENTS,) or a batch of shape
+    (n_runs, N_AGENTS); query results follow the same leading shape.
+    """
+
+    def __init__(self, preferences: np.ndarray, stakes: np.ndarray):
+        self._single = np.ndim(preferences) == 1
+        preferences = np.atleast_2d(preferences)
+        stakes = np.atleast_2d(stakes)
+        n_runs, n_agents = preferences.shape
+
+        order = np.argsort(preferences, axis=1)
+        self.order = order[0] if self._single else order
+        self.sorted_preferences = np.take_along_axis(preferences, order, axis=1)
+        sorted_stakes = np.take_along_axis(stakes, order, axis=1)
+
+        # Prefix sums with a leading zero: entry k covers the k lowest preferences
+        zeros = np.zeros((n_runs, 1))
+        self._cum_stakes = np.concatenate([zeros, np.cumsum(sorted_stakes, axis=1)], axis=1)
+        self._cum_weighted = np.concatenate(
+            [zeros, np.cumsum(sorted_stakes * self.sorted_preferences, axis=1)], axis=1)
+
+        self.pref_min = self.sorted_preferences[:, 0]
+        self.pref_max = self.sorted_preferences[:, -1]
+        self.total_stakes = self._cum_stakes[:, -1]
+        total_weighted = self._cum_weighted[:, -1]
+
+        # Worst-case friction: decision at either extreme
+        self.f_max = np.where(
+            self.pref_max == self.pref_min, 0.0,
+            np.maximum(total_weighted - self.pref_min * self.total_stakes,
+                       self.pref_max * self.total_stakes - total_weighted))
+
+        # Shift each population into its own disjoint interval so a single
+        # searchsorted over the flattened array serves the whole batch.
+        # Queries are clipped to one unit beyond the global range, which never
+        # reaches a neighbouring interval.
+        self._lo = np.min(self.pref_min) - 1.0
+        self._hi = np.max(self.pref_max) + 1.0
+        self._offsets = np.arange(n_runs) * (self._hi - self._lo + 1.0)
+        self._keys = (self.sorted_preferences + self._offsets[:, np.newaxis]).ravel()
+        self._n_agents = n_agents
+
+    def _as_batch(self, values) -> np.ndarray:
+        """Reshape per-population queries to (n_runs, n_queries)"""
+        values = np.asarray(values, dtype=float)
+        if self._single:
+            return values.reshape(1, -1)
+        return values.reshape(len(self._offsets), -1)
+
+    def _as_output(self, values: np.ndarray, shape: Tuple[int, ...]):
+        values = values.reshape(shape)
+        return values[()] if values.ndim == 0 else values
+
+    def friction(self, decisions) -> np.ndarray:
+        """
+        Friction F(x) for one or many candidate decisions per population.
+
+        Args:
+            decisions: Scalar or array of decisions. For a batched oracle the
+                leading axis indexes populations, e.g. shape (n_runs,) or
+                (n_runs, n_queries).
+
+        Returns:
+            friction: Same shape as decisions
+        """
+        shape = np.shape(decisions)
+        if self._single and shape == ():
+            return self._friction_scalar(float(decisions))
+        x = self._as_batch(decisions)
+
+        shifted = np.clip(x, self._lo, self._hi) + self._offsets[:, np.newaxis]
+        counts = np.searchsorted(self._keys, shifted, side='right')
+        k = counts - (np.arange(len(self._offsets)) * self._n_agents)[:, np.newaxis]
+
+        rows = np.arange(len(self._offsets))[:, np.newaxis]
+        cum_stakes = self._cum_stakes[rows, k]
+        cum_weighted = self._cum_weighted[rows, k]
+        total_stakes = self._cum_stakes[:, -1:]
+        total_weighted = self._cum_weighted[:, -1:]
+
+        friction = (x * cum_stakes - cum_weighted
+                    + (total_weighted - cum_weighted) - x * (total_stakes - cum_stakes))
+        return self._as_output(friction, shape)
+
+    def _friction_scalar(self, x: float) -> float:
+        """Single query against a single population, without array overhead"""
+        k = int(np.searchsorted(self.sorted_preferences[0], x, side='right'))
+        cum_stakes = self._cum_stakes[0]
+        cum_weighted = self._cum_weighted[0]
+        return (x * cum_stakes[k] - cum_weighted[k]
+                + (cum_weighted[-1] - cum_weighted[k]) - x * (cum_stakes[-1] - cum_stakes[k]))
+
+    def weighted_median(self):
+        """Stakes-weighted median preference (the friction-minimising decision)"""
+        half = self.total_stakes / 2.0
+        idx = np.sum(self._cum_stakes[:, 1:] < half[:, np.newaxis], axis=1)
+        median = self.sorted_preferences[np.arange(len(idx)), idx]
+        return median[0] if self._single else median
+
+    def compute_metrics(self, decisions, weighted_decisions=None,
+                        w_consent: float = 0.6, w_performance: float = 0.4) -> DecisionMetrics:
+        """
+        compute_metrics against the indexed population(s).
+
+        Args:
+            decisions: Implemented policy, one per population
+            weighted_decisions: Consent-weighted decisions for α; defaults to decisions
+            w_consent: Legitimacy weight for consent (default 0.6)
+            w_performance: Legitimacy weight for performance (default 0.4)
+
+        Returns:
+            DecisionMetrics with scalar fields for a single population,
+            arrays of shape (n_runs,) for a batch
+        """
+        friction = self.friction(decisions)
+        if weighted_decisions is None:
+            f_weighted = friction
+        else:
+            f_weighted = self.friction(weighted_decisions)
+
+        if self._single and np.ndim(friction) == 0:
+            f_max = self.f_max[0]
+            if f_max == 0:
+                alpha, performance = 1.0, 1.0
+            else:
+                alpha = min(max(1.0 - f_weighted / f_max, 0.0), 1.0)
+                performance = min(max(1.0 - friction / f_max, 0.0), 1.0)
+            return DecisionMetrics(
+                alpha=alpha,
+                friction=friction,
+                performance=performance,
+                legitimacy=compute_legitimacy(alpha, performance, w_consent, w_performance)
+            )
+
+        f_max = self.f_max[0] if self._single else self.f_max
+        degenerate = f_max == 0
+        safe_f_max = np.where(degenerate, 1.0, f_max)
+        alpha = np.where(degenerate, 1.0, np.clip(1.0 - f_weighted / safe_f_max, 0.0, 1.0))
+        performance = np.where(degenerate, 1.0, np.clip(1.0 - friction / safe_f_max, 0.0, 1.0))
+
+        return DecisionMetrics(
+            alpha=alpha,
+            friction=friction,
+            performance=performance,
+            legitimacy=compute_legitimacy(alpha, performance, w_consent, w_performance)
+        )
+
+
+def run_mechanism_simulation_batched(mechanism: ConsentMechanism,
+                                     n_runs: int = N_RUNS,
+                                     n_agents: int = N_AGENTS,
+                                     n_timesteps: int = N_TIMESTEPS,
+                                     rng: np.random.Generator = None) -> SimulationResults:
+    """
+    Batched equivalent of run_mechanism_simulation.
+
+    Draws all societies up front and advances every run together, one timestep
+    per iteration. Statistically equivalent to the scalar path, but consumes
+    the random stream in a different order, so individual runs differ.
+
+    Args:
+        mechanism: Consent allocation mechanism
+        n_runs: Number of Monte Carlo iterations
+        n_agents: Population size
+        n_timesteps: Time periods for convergence
+        rng: Random stream for the whole batch (global state if None)
+
+    Returns:
+        SimulationResults with trajectories and summary statistics
+    """
+    stakes, wealth, preferences = generate_society_batch(n_runs, n_agents, rng=rng)
+
+    # Populations are fixed, so every period's friction is an O(log n) lookup
+    oracle = FrictionOracle(preferences, stakes)
+
+    return _evaluate_static_batch(mechanism, stakes, wealth, preferences, oracle, n_timesteps, rng)
+
+
+def _evaluate_static_batch(mechanism: ConsentMechanism, stakes: np.ndarray, wealth: np.ndarray,
+                           preferences: np.ndarray, oracle: FrictionOracle, n_timesteps: int,
+                           rng: np.random.Generator = None) -> SimulationResults:
+    """Evaluate one mechanism on a batch of already-drawn static societies"""
+    n_runs = stakes.shape[0]
+    alpha_traj = np.zeros((n_runs, n_timesteps))
+    friction_traj = np.zeros((n_runs, n_timesteps))
+    n_evaluations = 1 if mechanism.deterministic else n_timesteps
+    mechanism.reset()
+
+    for t in range(n_evaluations):
+        consent = mechanism.allocate_consent_batch(stakes, wealth, rng=rng)
+        decisions = np.sum(consent * preferences, axis=1)
+
+        # Decisions are already consent-weighted, so consent is not re-applied
+        metrics = oracle.compute_metrics(decisions)
+        alpha_traj[:, t] = metrics.alpha
+        friction_traj[:, t] = metrics.friction
+        mechanism.observe(decisions, preferences, stakes)
+
+    if n_evaluations < n_timesteps:
+        alpha_traj[:, 1:] = alpha_traj[:, :1]
+        friction_traj[:, 1:] = friction_traj[:, :1]
+
+    final_legitimacy = metrics.legitimacy
+
+    return SimulationResults(
+        mechanism_name=mechanism.name,
+        alpha_trajectory=alpha_traj,
+        friction_trajectory=friction_traj,
+        final_legitimacy=final_legitimacy,
+        mean_alpha=np.mean(alpha_traj[:, -1]),
+        mean_friction=np.mean(friction_traj[:, -1]),
+        mean_legitimacy=np.mean(final_legitimacy),
+        std_legitimacy=np.std(final_legitimacy)
+    )
+
+
+def run_common_random_numbers(mechanisms: List[ConsentMechanism],
+                              n_runs: int = N_RUNS,
+                              n_agents: int = N_AGENTS,
+                              n_timesteps: int = N_TIMESTEPS,
+                              seed: int = None,
+                              first_run: int = 0,
+                              sampling: str = 'pseudo') -> Dict[str, SimulationResults]:
+    """
+    Evaluate several mechanisms on the same societies (common random numbers).
+
+    Every run's society is drawn once and all mechanisms are evaluated on it,
+    sharing one FrictionOracle. Row r of every result therefore refers to the
+    same society, so mechanisms can be compared run by run: the paired
+    difference cancels the between-society variance that dominates
+    independent comparisons.
+
+    Args:
+        mechanisms: Consent allocation mechanisms to compare
+        n_runs: Number of Monte Carlo iterations
+        n_agents: Population size
+        n_timesteps: Time periods for convergence
+        seed: Master seed for the society and mechanism streams (global state if None)
+        first_run: Index of the first run, for simulating a shard
+        sampling: 'pseudo' draws societies as generate_society_batch;
+            'antithetic' or 'sobol' build them from society_uniforms (summarise
+            the runs with estimate_mean)
+
+    Returns:
+        results: SimulationResults per mechanism name, with run-aligned arrays
+    """
+    society_rng = np.random if seed is None else block_rng(seed, 'society', 'common',
+                                                           first_run, n_runs)
+    if sampling == 'pseudo':
+        stakes, wealth, preferences = generate_society_batch(n_runs, n_agents, rng=society_rng)
+    else:
+        uniforms = society_uniforms(n_runs, n_agents, sampling, rng=society_rng)
+        stakes, wealth, preferences = generate_society_from_uniforms(uniforms, n_agents)
+    oracle = FrictionOracle(preferences, stakes)
+
+    results = {}
+    for mechanism in mechanisms:
+        # Mechanisms keep their own streams so that only the societies are shared
+        rng = np.random if seed is None else block_rng(seed, mechanism.name, 'common',
+                                                       first_run, n_runs)
+        results[mechanism.name] = _evaluate_static_batch(mechanism, stakes, wealth, preferences,
+                                                         oracle, n_timesteps, rng)
+    return results
+
+
 def run_mechanism_simulation(mechanism: ConsentMechanism,
                              n_runs: int = N_RUNS,
                              n_agents: int = N_AGENTS,
-                             n_timesteps: int = N_TIMESTEPS) -> SimulationResults:
+                             n_timesteps: int = N_TIMESTEPS,
+                             engine: str = 'scalar',
+                             seed: int = None,
+                             first_run: int = 0) -> SimulationResults:
     """
     Run Monte Carlo simulation for a single mechanism.
 
@@ -313,52 +1376,62 @@ def run_mechanism_simulation(mechanism: ConsentMechanism,
         n_runs: Number of Monte Carlo iterations
         n_agents: Population size
         n_timesteps: Time periods for convergence
+        engine: 'scalar' (one run at a time) or 'batched' (all runs at once)
+        seed: Master seed. If given, run k draws from run_rng(seed, ..., k)
+            (scalar) or the batch from block_rng (batched); if None, from the
+            global random state
+        first_run: Index of the first run, for simulating a shard of a cell
 
     Returns:
         SimulationResults with trajectories and summary statistics
     """
+    if engine == 'batched':
+        rng = None if seed is None else block_rng(seed, mechanism.name, 'static', first_run, n_runs)
+        return run_mechanism_simulation_batched(mechanism, n_runs, n_agents, n_timesteps, rng=rng)
+    elif engine != 'scalar':
+        raise ValueError(f"Unknown engine: {engine}")
+
     alpha_traj = np.zeros((n_runs, n_timesteps))
     friction_traj = np.zeros((n_runs, n_timesteps))
     final_legitimacy = np.zeros(n_runs)
 
     for run in range(n_runs):
-        # Generate agent characteristics (fixed across time for this run)
-        stakes = generate_heterogeneous_stakes(n_agents, distribution_type='mixed')
-
-        # Wealth deliberately decoupled from stakes (Pearson r ≈ 0.1-0.3)
-        # Wealthy != high stakes in domain (plutocracy failure condition)
-        wealth = np.random.pareto(a=1.16, size=n_agents) + 0.5  # Pareto wealth (Gini ≈ 0.4)
-        np.random.shuffle(wealth)  # Break any accidental correlation with stakes
-
-        # Agent preferences (vary by domain but stable in time)
-        # Use bimodal distribution to create value conflicts
-        if np.random.rand() > 0.5:
-            preferences = np.random.normal(0, 1, n_agents)
-        else:
-            # Bimodal: two clusters
-            cluster = np.random.choice([0, 1], size=n_agents)
-            preferences = np.where(cluster == 0,
-                                  np.random.normal(-1.5, 0.5, n_agents),
-                                  np.random.normal(1.5, 0.5, n_agents))
+        # Legacy global state without a seed, otherwise this run's own stream
+        rng = np.random if seed is None else run_rng(seed, mechanism.name, 'static', first_run + run)
+
+        # Agent characteristics, fixed across time for this run
+        stakes, wealth, preferences = generate_society(n_agents, rng=rng)
+
+        # Nothing changes over time, so a deterministic mechanism needs a single
+        # evaluation; stochastic mechanisms are resampled every period against
+        # a friction index built once per run
+        n_evaluations = 1 if mechanism.deterministic else n_timesteps
+        oracle = FrictionOracle(preferences, stakes) if n_evaluations > 1 else None
+        mechanism.reset()
 
         # Run over time
-        for t in range(n_timesteps):
+        for t in range(n_evaluations):
             # Allocate consent power
-            consent = mechanism.allocate_consent(stakes, wealth)
+            consent = mechanism.allocate_consent(stakes, wealth, rng=rng)
 
             # Decision is consent-weighted preference
             decision = np.sum(consent * preferences)
 
-            # Compute metrics
-            alpha = compute_alpha(decision, preferences, stakes, consent)
-            friction = compute_friction(decision, preferences, stakes)
-            performance = compute_performance(decision, preferences, stakes)
+            # Compute metrics (decision is already consent-weighted)
+            if oracle is not None:
+                metrics = oracle.compute_metrics(decision)
+            else:
+                metrics = compute_metrics(decision, preferences, stakes)
+
+            alpha_traj[run, t] = metrics.alpha
+            friction_traj[run, t] = metrics.friction
+            mechanism.observe(decision, preferences, stakes)
 
-            alpha_traj[run, t] = alpha
-            friction_traj[run, t] = friction
+        if n_evaluations < n_timesteps:
+            alpha_traj[run, :] = metrics.alpha
+            friction_traj[run, :] = metrics.friction
 
-            if t == n_timesteps - 1:
-                final_legitimacy[run] = compute_legitimacy(alpha, performance)
+        final_legitimacy[run] = metrics.legitimacy
 
     # Summary statistics
     results = SimulationResults(
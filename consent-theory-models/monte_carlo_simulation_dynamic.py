@@ -9,12 +9,14 @@ Validates consent-weighted governance framework by comparing 5 mechanisms:
 3. Stakes-Weighted DoCS (power proportional to stakes in domain)
 4. Random Assignment (sortition baseline)
 5. Expert Rule (fixed elite decision-makers)
+(--adaptive adds 6. Adaptive Consent, which learns from observed friction)
 
-NOW SUPPORTS 4 DYNAMIC MODES:
+NOW SUPPORTS 5 DYNAMIC MODES:
 - static: Original fixed-population evaluation (baseline)
 - learning: Bayesian preference updating from observed outcomes
 - social: DeGroot opinion dynamics via social network
 - stakes: Endogenous stakes evolution based on decision impacts
+- exit: Dissatisfied agents leave the population
 
 Measures:
 - α(d,t): stakes-weighted consent alignment
@@ -31,8 +33,27 @@ from dataclasses import dataclass
 import warnings
 import argparse
 import csv
+import gzip
+import io
+from concurrent.futures import ProcessPoolExecutor
+from scipy import sparse as sp
+from scipy.sparse.csgraph import connected_components
+from scipy.sparse.linalg import splu
 warnings.filterwarnings('ignore')
 
+# Mechanisms and metrics are shared with the static simulation
+from monte_carlo_simulation import (
+    ConsentMechanism, EqualVoice, StakesWeighted, Plutocracy, RandomAssignment, ExpertRule,
+    AdaptiveConsent,
+    generate_heterogeneous_stakes, compute_friction, compute_alpha, compute_performance,
+    weighted_median, compute_legitimacy, compute_metrics, FrictionOracle,
+    generate_heterogeneous_stakes_batch, generate_society_batch,
+    compute_metrics_batch, compute_performance_batch,
+    resolve_rng, run_rng, block_rng
+)
+from streaming_stats import TrajectoryAggregate, RunningMoments
+from results_store import save_columns, load_columns
+
 # Set random seed for reproducibility
 np.random.seed(42)
 
@@ -41,6 +62,32 @@ N_AGENTS = 100          # Population size
 N_RUNS = 1000          # Monte Carlo iterations per mechanism
 N_TIMESTEPS = 50       # Time periods for convergence analysis
 N_DOMAINS = 10         # Number of decision domains
+SEED = 42              # Master seed for the mechanism x mode grid
+
+# Elements per block of runs in the batched learning-mode scan (keeps temporaries in cache)
+LEARNING_SCAN_BLOCK_SIZE = 1 << 17
+
+# Social mode switches from a dense to a sparse CSR network at this size
+SPARSE_NETWORK_MIN_AGENTS = 2000
+
+# Sparse DeGroot propagation returns the t → ∞ limit once the iterate is this
+# close to it (relative to its initial distance or the limit's magnitude),
+# checked every few matvecs
+DEGROOT_LIMIT_TOL = 1e-12
+DEGROOT_LIMIT_CHECK_STEPS = 16
+
+# Runs simulated at a time before folding into streaming aggregates
+AGGREGATE_BLOCK_RUNS = 256
+
+# Rows formatted per write when saving trajectories as CSV
+CSV_CHUNK_ROWS = 1 << 18
+
+# Fixed grid order. Random streams are keyed by mode and mechanism name, so a
+# cell draws the same numbers whichever subset of the grid is run.
+DYNAMIC_MODES = ['static', 'learning', 'social', 'stakes', 'exit']
+
+# Modes run by --dynamics all; exit mode is opt-in (--dynamics exit)
+DEFAULT_DYNAMIC_MODES = ['static', 'learning', 'social', 'stakes']
 
 @dataclass
 class SimulationResults:
@@ -54,476 +101,798 @@ class SimulationResults:
     mean_friction: float
     mean_legitimacy: float
     std_legitimacy: float
+    population_trajectory: np.ndarray = None  # Active agents, exit mode only
 
 
-class ConsentMechanism:
-    """Base class for consent allocation mechanisms"""
-
-    def __init__(self, name: str):
-        self.name = name
+# ==============================================================================
+# DYNAMIC MECHANISMS
+# ==============================================================================
 
-    def allocate_consent(self, stakes: np.ndarray, wealth: np.ndarray = None) -> np.ndarray:
-        """
-        Allocate consent power C_i across agents.
+def run_static_mode(mechanism: ConsentMechanism, n_agents: int, n_timesteps: int,
+                    rng: np.random.Generator = None) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Original static evaluation - no temporal dynamics.
+    Society generated once, metrics recorded over time (but nothing changes).
 
-        Args:
-            stakes: Array of shape (N_AGENTS,) representing agent stakes in domain
-            wealth: Array of shape (N_AGENTS,) for plutocratic mechanism
+    Returns:
+        alpha_trajectory, friction_trajectory
+    """
+    rng = resolve_rng(rng)
+    mechanism.reset()
 
-        Returns:
-            consent_power: Array of shape (N_AGENTS,) summing to 1.0
-        """
-        raise NotImplementedError
+    # Generate agent characteristics (fixed across time for this run)
+    stakes = generate_heterogeneous_stakes(n_agents, distribution_type='mixed', rng=rng)
 
+    # Wealth deliberately decoupled from stakes (Pearson r ≈ 0.1-0.3)
+    wealth = rng.pareto(a=1.16, size=n_agents) + 0.5
+    rng.shuffle(wealth)
 
-class EqualVoice(ConsentMechanism):
-    """One person one vote - pure democracy"""
+    # Agent preferences (vary by domain but stable in time)
+    if rng.random() > 0.5:
+        preferences = rng.normal(0, 1, n_agents)
+    else:
+        # Bimodal: two clusters
+        cluster = rng.choice([0, 1], size=n_agents)
+        preferences = np.where(cluster == 0,
+                              rng.normal(-1.5, 0.5, n_agents),
+                              rng.normal(1.5, 0.5, n_agents))
 
-    def __init__(self):
-        super().__init__("Equal Voice")
+    alpha_traj = np.zeros(n_timesteps)
+    friction_traj = np.zeros(n_timesteps)
 
-    def allocate_consent(self, stakes: np.ndarray, wealth: np.ndarray = None) -> np.ndarray:
-        n = len(stakes)
-        return np.ones(n) / n
+    # Run over time (nothing changes - static). A deterministic mechanism is
+    # evaluated once and broadcast; stochastic ones are resampled every period
+    # against a friction index built once for this society.
+    n_evaluations = 1 if mechanism.deterministic else n_timesteps
+    oracle = FrictionOracle(preferences, stakes) if n_evaluations > 1 else None
 
+    for t in range(n_evaluations):
+        consent = mechanism.allocate_consent(stakes, wealth, rng=rng)
+        decision = np.sum(consent * preferences)
 
-class StakesWeighted(ConsentMechanism):
-    """DoCS mechanism - consent proportional to stakes"""
+        if oracle is not None:
+            metrics = oracle.compute_metrics(decision)
+        else:
+            metrics = compute_metrics(decision, preferences, stakes)
+        alpha_traj[t] = metrics.alpha
+        friction_traj[t] = metrics.friction
+        mechanism.observe(decision, preferences, stakes)
 
-    def __init__(self):
-        super().__init__("Stakes-Weighted DoCS")
+    if n_evaluations < n_timesteps:
+        alpha_traj[1:] = alpha_traj[0]
+        friction_traj[1:] = friction_traj[0]
 
-    def allocate_consent(self, stakes: np.ndarray, wealth: np.ndarray = None) -> np.ndarray:
-        # Normalize stakes to sum to 1
-        stakes_sum = np.sum(stakes)
-        if stakes_sum == 0:
-            # Edge case: no stakes, fall back to equal
-            return np.ones(len(stakes)) / len(stakes)
-        return stakes / stakes_sum
+    return alpha_traj, friction_traj
 
 
-class Plutocracy(ConsentMechanism):
-    """Power proportional to wealth, independent of stakes"""
+class LearningScan:
+    """
+    Closed-form evaluation of the learning-mode Bayesian recurrence.
 
-    def __init__(self):
-        super().__init__("Plutocracy")
+    Prior precision starts at 1 and grows by s_i per observation, so after t
+    observations agent i has precision 1 + t s_i and posterior mean
 
-    def allocate_consent(self, stakes: np.ndarray, wealth: np.ndarray) -> np.ndarray:
-        # Consent follows wealth, not stakes in this domain
-        wealth_sum = np.sum(wealth)
-        if wealth_sum == 0:
-            return np.ones(len(wealth)) / len(wealth)
-        return wealth / wealth_sum
+        m_t = (m_0 + s_i Y_t) / (1 + t s_i),    Y_t = y_0 + ... + y_{t-1}
 
+    The decision is then d_t = A_t + B_t Y_t with A_t = Σ c_i m_0,i / (1 + t s_i)
+    and B_t = Σ c_i s_i / (1 + t s_i). A_t and B_t come from one vectorized
+    pass over the precision schedule, leaving a scan over a single running
+    total per population as the only sequential step.
 
-class RandomAssignment(ConsentMechanism):
-    """Sortition - random single agent has all power"""
+    Leading axes of prior_mean and stakes are batch axes, so the same object
+    serves one run (n_agents,) or many (n_runs, n_agents). Periods can be
+    evaluated all at once or in consecutive blocks.
+    """
 
-    def __init__(self):
-        super().__init__("Random Assignment")
+    def __init__(self, prior_mean: np.ndarray, stakes: np.ndarray):
+        """
+        Args:
+            prior_mean: Initial preferences m_0, shape (..., n_agents)
+            stakes: Observation precision s_i, same shape as prior_mean
+        """
+        self.prior_mean = prior_mean
+        self.stakes = stakes
+        self.period = 0
+        self.total = np.zeros(np.shape(stakes)[:-1])
+        # 1 / (1 + t s_i) at the current period
+        self._inv_precision = np.ones(np.shape(stakes))
+
+    def advance(self, consent: np.ndarray, noise: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Evaluate the next n_steps periods.
 
-    def allocate_consent(self, stakes: np.ndarray, wealth: np.ndarray = None) -> np.ndarray:
-        n = len(stakes)
-        consent = np.zeros(n)
-        # Randomly select one agent
-        consent[np.random.randint(0, n)] = 1.0
-        return consent
+        Args:
+            consent: Allocation per period, shape (n_steps, ..., n_agents)
+            noise: Outcome noise per period, shape (n_steps, ...)
 
+        Returns:
+            decisions: Shape (n_steps, ...)
+            preferences: Posterior means after each period's observation,
+                shape (n_steps, ..., n_agents)
+        """
+        n_steps = len(noise)
+        batch_shape = (1,) * np.ndim(self.stakes)
 
-class ExpertRule(ConsentMechanism):
-    """Fixed elite (top 10% by competence metric)"""
+        # Precision schedule for periods t .. t + n_steps, built in place
+        inv_precision = np.empty((n_steps + 1,) + np.shape(self.stakes))
+        inv_precision[0] = self._inv_precision
+        periods = np.arange(self.period + 1, self.period + n_steps + 1).reshape((-1,) + batch_shape)
+        np.multiply(periods, self.stakes, out=inv_precision[1:])
+        inv_precision[1:] += 1.0
+        np.reciprocal(inv_precision[1:], out=inv_precision[1:])
 
-    def __init__(self, elite_fraction: float = 0.1):
-        super().__init__("Expert Rule")
-        self.elite_fraction = elite_fraction
+        a_coef = np.einsum('...n,...n->...', consent, self.prior_mean * inv_precision[:-1])
+        b_coef = np.einsum('...n,...n->...', consent, self.stakes * inv_precision[:-1])
 
-    def allocate_consent(self, stakes: np.ndarray, wealth: np.ndarray = None) -> np.ndarray:
-        n = len(stakes)
-        n_elite = max(1, int(n * self.elite_fraction))
+        totals = np.empty((n_steps + 1,) + np.shape(self.total))
+        totals[0] = self.total
+        decisions = np.empty_like(totals[1:])
+        for k in range(n_steps):
+            decisions[k] = a_coef[k] + b_coef[k] * totals[k]
+            totals[k + 1] = totals[k] + decisions[k] + noise[k]
 
-        # Elite selection based on random competence metric (uncorrelated with stakes)
-        competence = np.random.randn(n)
-        elite_indices = np.argsort(competence)[-n_elite:]
+        preferences = (self.prior_mean + self.stakes * totals[1:, ..., np.newaxis]) * inv_precision[1:]
 
-        consent = np.zeros(n)
-        consent[elite_indices] = 1.0 / n_elite
-        return consent
+        self.period += n_steps
+        self.total = totals[-1]
+        self._inv_precision = inv_precision[-1]
+        return decisions, preferences
 
 
-def generate_heterogeneous_stakes(n_agents: int, distribution_type: str = 'mixed') -> np.ndarray:
+def run_learning_mode(mechanism: ConsentMechanism, n_agents: int, n_timesteps: int,
+                      rng: np.random.Generator = None) -> Tuple[np.ndarray, np.ndarray]:
     """
-    Generate realistic heterogeneous stakes distribution.
+    Bayesian preference updating from observed outcomes.
+    Agents update beliefs about optimal policy based on decision results.
 
-    Args:
-        n_agents: Number of agents
-        distribution_type: 'concentrated', 'uniform', 'mixed'
+    Consent does not depend on preferences in this mode, so allocations and
+    outcome noise are drawn first (in step order) and the whole trajectory
+    is evaluated by LearningScan. A stateful mechanism needs each outcome
+    before its next allocation, so the scan then advances one period at a time.
 
     Returns:
-        stakes: Non-negative stakes summing to n_agents (for normalization)
-    """
-    if distribution_type == 'concentrated':
-        # Power law: few high-stakes, many low-stakes (coastal property example)
-        # More extreme heterogeneity
-        stakes = np.random.pareto(a=1.2, size=n_agents) + 0.05
-        # Create explicit minority high-stakes group (20% of population with 70% of stakes)
-        n_high = int(0.2 * n_agents)
-        stakes[:n_high] *= 5.0  # High-stakes minority
-    elif distribution_type == 'uniform':
-        # Everyone affected similarly (monetary policy)
-        stakes = np.random.uniform(0.9, 1.1, size=n_agents)
-    else:  # mixed
-        # Combination: some domains concentrated, some uniform
-        # 60% concentrated (where DoCS should shine), 40% uniform
-        if np.random.rand() > 0.4:
-            # Concentrated stakes with minority at high stakes
-            stakes = np.random.pareto(a=1.3, size=n_agents) + 0.05
-            n_high = int(0.15 * n_agents)
-            stakes[:n_high] *= 6.0
-        else:
-            stakes = np.random.uniform(0.85, 1.15, size=n_agents)
+        alpha_trajectory, friction_trajectory
+    """
+    rng = resolve_rng(rng)
+    mechanism.reset()
 
-    # Normalize to mean 1 for interpretability
-    return stakes / np.mean(stakes)
+    # Initial conditions
+    stakes = generate_heterogeneous_stakes(n_agents, distribution_type='mixed', rng=rng)
+    wealth = rng.pareto(a=1.16, size=n_agents) + 0.5
+    rng.shuffle(wealth)
+    prior_mean = rng.normal(0, 1, n_agents)
+
+    if mechanism.stateful:
+        alpha_traj = np.zeros(n_timesteps)
+        friction_traj = np.zeros(n_timesteps)
+        scan = LearningScan(prior_mean, stakes)
+
+        for t in range(n_timesteps):
+            consent = mechanism.allocate_consent(stakes, wealth, rng=rng)
+            noise = rng.normal(0, 0.1)
+            decisions, preferences = scan.advance(consent[np.newaxis], np.array([noise]))
+
+            metrics = compute_metrics_batch(decisions, preferences, stakes, consent)
+            alpha_traj[t], friction_traj[t] = metrics.alpha[0], metrics.friction[0]
+            mechanism.observe(decisions[0], preferences[0], stakes)
+
+        return alpha_traj, friction_traj
+
+    consent = np.empty((n_timesteps, n_agents))
+    noise = np.empty(n_timesteps)
+    for t in range(n_timesteps):
+        consent[t] = mechanism.allocate_consent(stakes, wealth, rng=rng)
+        # Observe outcome (noisy signal of decision quality)
+        noise[t] = rng.normal(0, 0.1)
+
+    # BAYESIAN UPDATE: higher-stakes agents pay more attention, so the
+    # observation precision is stakes (see LearningScan)
+    decisions, preferences = LearningScan(prior_mean, stakes).advance(consent, noise)
 
+    metrics = compute_metrics_batch(decisions, preferences, stakes, consent)
+    return metrics.alpha, metrics.friction
 
-def compute_friction(decision: float, preferences: np.ndarray, stakes: np.ndarray) -> float:
+
+def erdos_renyi_network(n_agents: int, connection_prob: float,
+                        rng: np.random.Generator = None,
+                        n_blocks: int = 1) -> sp.csr_matrix:
     """
-    Compute friction F(d) = Σ s_i * |x_d - x*_i|
+    Row-normalised Erdős–Rényi network, generated directly in CSR form.
+
+    Each of the n(n-1) off-diagonal pairs, taken in row-major order, is an
+    edge with probability connection_prob. Gaps between consecutive edges
+    are geometric, so edges are drawn by skipping rather than by testing every
+    pair: O(E) time and memory instead of O(n²). Edges come out sorted, which
+    is exactly the CSR layout.
+
+    With n_blocks > 1, independent networks for n_blocks populations are laid
+    out along the diagonal of one block-diagonal matrix, so a single matvec
+    on the flattened (n_blocks, n_agents) preferences updates all of them.
 
     Args:
-        decision: Implemented policy x_d
-        preferences: Agent ideal points x*_i
-        stakes: Agent stakes s_i(d)
+        n_agents: Number of agents per population
+        connection_prob: Probability of a directed edge i -> j (i != j)
+        rng: Random stream (global state if None)
+        n_blocks: Number of independent populations
 
     Returns:
-        friction: Stakes-weighted total deviation
+        social_network: (n_blocks * n_agents) square CSR matrix, each non-empty
+            row summing to 1 (isolated agents have empty rows)
     """
-    deviations = np.abs(decision - preferences)
-    return np.sum(stakes * deviations)
+    rng = resolve_rng(rng)
+    n_block_slots = n_agents * (n_agents - 1)
+    n_slots = n_blocks * n_block_slots
 
+    if connection_prob <= 0 or n_slots == 0:
+        positions = np.zeros(0, dtype=np.int64)
+    else:
+        # Draw gaps in blocks sized to cover all slots with high probability
+        expected = n_slots * min(connection_prob, 1.0)
+        block_size = int(expected + 6 * np.sqrt(expected)) + 16
+        blocks = []
+        last = -1
+        while last < n_slots:
+            block = last + np.cumsum(rng.geometric(min(connection_prob, 1.0), size=block_size))
+            blocks.append(block[block < n_slots])
+            last = block[-1]
+        positions = np.concatenate(blocks)
+
+    # Slot k of row i skips the diagonal entry (i, i)
+    blocks = positions // max(n_block_slots, 1)
+    positions = positions - blocks * n_block_slots
+    rows = positions // max(n_agents - 1, 1)
+    cols = positions - rows * (n_agents - 1)
+    cols += cols >= rows
+
+    # Offset each population onto its own diagonal block
+    rows += blocks * n_agents
+    cols += blocks * n_agents
+
+    n_total = n_blocks * n_agents
+    degree = np.bincount(rows, minlength=n_total)
+    indptr = np.concatenate(([0], np.cumsum(degree)))
+    weights = np.repeat(1.0 / np.maximum(degree, 1), degree)
+
+    return sp.csr_matrix((weights, cols, indptr), shape=(n_total, n_total))
+
+
+def build_social_network(n_agents: int, connection_prob: float = 0.1,
+                         avg_degree: float = None, sparse: bool = None,
+                         rng: np.random.Generator = None):
+    """
+    Row-normalised Erdős–Rényi network for social mode.
+
+    Dense below SPARSE_NETWORK_MIN_AGENTS agents and sparse CSR above (see
+    erdos_renyi_network); pass sparse to force either. With avg_degree,
+    connection_prob is set to avg_degree / (n_agents - 1).
 
-def compute_alpha(decision: float, preferences: np.ndarray, stakes: np.ndarray,
-                  consent: np.ndarray) -> float:
+    Returns:
+        social_network: (n_agents, n_agents) ndarray or CSR matrix
     """
-    Compute consent alignment α(d) = 1 - F_weighted / F_max
+    rng = resolve_rng(rng)
 
-    Where F_weighted uses consent-weighted decision vs ideal preferences.
-    Higher α means better alignment between consent-holders and stakeholders.
+    if avg_degree is not None:
+        connection_prob = avg_degree / max(n_agents - 1, 1)
+    if sparse is None:
+        sparse = n_agents >= SPARSE_NETWORK_MIN_AGENTS
+
+    if sparse:
+        return erdos_renyi_network(n_agents, connection_prob, rng=rng)
+
+    social_network = rng.random((n_agents, n_agents)) < connection_prob
+    np.fill_diagonal(social_network, False)
+
+    # Normalize rows (equal influence from neighbors)
+    row_sums = social_network.sum(axis=1)
+    row_sums[row_sums == 0] = 1  # Avoid division by zero
+    return social_network / row_sums[:, np.newaxis]
 
-    Args:
-        decision: Implemented policy
-        preferences: Agent ideal points
-        stakes: Agent stakes
-        consent: Consent power allocation C_i
+
+def run_social_mode(mechanism: ConsentMechanism, n_agents: int, n_timesteps: int,
+                    influence_strength: float = 0.1,
+                    connection_prob: float = 0.1,
+                    avg_degree: float = None,
+                    sparse: bool = None,
+                    rng: np.random.Generator = None) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    DeGroot opinion dynamics via social network.
+    Preferences drift toward neighbors each period.
+
+    Network options are passed to build_social_network, e.g. avg_degree=10
+    for populations of a million agents.
 
     Returns:
-        alpha: Consent alignment in [0, 1]
+        alpha_trajectory, friction_trajectory
     """
-    # Weighted decision (what consent-holders want)
-    weighted_decision = np.sum(consent * preferences)
+    rng = resolve_rng(rng)
+    mechanism.reset()
 
-    # Friction from weighted decision
-    f_weighted = compute_friction(weighted_decision, preferences, stakes)
+    stakes = generate_heterogeneous_stakes(n_agents, distribution_type='mixed', rng=rng)
+    wealth = rng.pareto(a=1.16, size=n_agents) + 0.5
+    rng.shuffle(wealth)
+    preferences = rng.normal(0, 1, n_agents)
 
-    # Maximum possible friction (decision at extreme vs all preferences)
-    pref_min, pref_max = np.min(preferences), np.max(preferences)
-    pref_range = pref_max - pref_min
-    if pref_range == 0:
-        return 1.0  # Perfect alignment if no preference variation
+    # Social network: Erdős–Rényi random graph
+    social_network = build_social_network(n_agents, connection_prob, avg_degree, sparse, rng=rng)
 
-    # Worst-case friction (decision at one extreme)
-    f_max = max(
-        compute_friction(pref_min, preferences, stakes),
-        compute_friction(pref_max, preferences, stakes)
-    )
+    alpha_traj = np.zeros(n_timesteps)
+    friction_traj = np.zeros(n_timesteps)
 
-    if f_max == 0:
-        return 1.0
+    for t in range(n_timesteps):
+        consent = mechanism.allocate_consent(stakes, wealth, rng=rng)
+        decision = np.sum(consent * preferences)
+
+        # SOCIAL INFLUENCE: Move toward neighbors' preferences
+        neighbor_avg = social_network @ preferences
+        preferences = (
+            (1 - influence_strength) * preferences +
+            influence_strength * neighbor_avg
+        )
+
+        metrics = compute_metrics(decision, preferences, stakes, consent)
+        alpha_traj[t] = metrics.alpha
+        friction_traj[t] = metrics.friction
+        mechanism.observe(decision, preferences, stakes)
+
+    return alpha_traj, friction_traj
 
-    # α = 1 - (friction / max_friction), bounded to [0, 1]
-    alpha = 1.0 - (f_weighted / f_max)
-    return np.clip(alpha, 0.0, 1.0)
 
+class StakesKernel:
+    """
+    In-place stakes-mode update and metrics over preallocated buffers.
 
-def compute_performance(decision: float, preferences: np.ndarray, stakes: np.ndarray) -> float:
+    Preferences are fixed in this mode, so their extremes (and hence the
+    degenerate zero-range case of α) are found once. The deviations |d - x*_i|
+    drive the stakes update and are reused for friction. The decision is the
+    consent-weighted one, so F_weighted equals F and α = 1 - F / F_max.
+    Leading axes of preferences are batch axes, as in LearningScan.
     """
-    Compute performance P(d) = 1 - F_actual / F_max
 
-    Performance measures how close decision is to Pareto frontier (stakes-weighted optimum).
+    def __init__(self, preferences: np.ndarray, stakes_response: float = 0.05):
+        """
+        Args:
+            preferences: Agent ideal points, shape (..., n_agents)
+            stakes_response: Proportional stakes gain at zero deviation
+        """
+        self.preferences = preferences
+        self.stakes_response = stakes_response
+        self.pref_min = np.min(preferences, axis=-1)
+        self.pref_max = np.max(preferences, axis=-1)
+        self.flat = self.pref_max == self.pref_min
+
+        shape = np.shape(preferences)
+        self._deviation = np.empty(shape)
+        self._gain = np.empty(shape)
+        self._work = np.empty(shape)
+        self._mean = np.empty(shape[:-1] + (1,))
+
+    def decide(self, consent: np.ndarray) -> np.ndarray:
+        """Consent-weighted decision, shape (...)"""
+        np.multiply(consent, self.preferences, out=self._work)
+        return np.sum(self._work, axis=-1)
+
+    def step(self, decisions: np.ndarray, stakes: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Update stakes in place for the given decisions and score the result.
 
-    Args:
-        decision: Implemented policy
-        preferences: Agent ideal points
-        stakes: Agent stakes
+        Args:
+            decisions: Decisions from decide(), shape (...)
+            stakes: Current stakes, shape (..., n_agents); overwritten
+
+        Returns:
+            alpha, friction: Arrays of shape (...)
+        """
+        deviation, gain, work = self._deviation, self._gain, self._work
+
+        # Winners gain, losers lose: s += r s (1 - |d - x*|), floored and renormalised
+        np.subtract(decisions[..., np.newaxis], self.preferences, out=deviation)
+        np.abs(deviation, out=deviation)
+        np.subtract(1.0, deviation, out=gain)
+        np.multiply(self.stakes_response, stakes, out=work)
+        work *= gain
+        stakes += work
+        np.maximum(stakes, 0.01, out=stakes)
+        np.mean(stakes, axis=-1, keepdims=True, out=self._mean)
+        stakes /= self._mean
+
+        np.multiply(stakes, deviation, out=work)
+        friction = np.sum(work, axis=-1)
+
+        total_stakes = np.sum(stakes, axis=-1)
+        np.multiply(stakes, self.preferences, out=work)
+        weighted_prefs = np.sum(work, axis=-1)
+        f_max = np.maximum(weighted_prefs - self.pref_min * total_stakes,
+                           self.pref_max * total_stakes - weighted_prefs)
+
+        degenerate = self.flat | (f_max == 0)
+        alpha = np.where(degenerate, 1.0,
+                         np.clip(1.0 - friction / np.where(degenerate, 1.0, f_max), 0.0, 1.0))
+        return alpha, friction
+
+
+def run_stakes_mode(mechanism: ConsentMechanism, n_agents: int, n_timesteps: int,
+                    stakes_response: float = 0.05,
+                    rng: np.random.Generator = None) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Endogenous stakes evolution based on decision impacts.
+    Winners (whose preferences align with decisions) gain stakes; losers lose stakes.
 
     Returns:
-        performance: Performance metric in [0, 1]
+        alpha_trajectory, friction_trajectory
     """
-    # Actual friction from decision
-    f_actual = compute_friction(decision, preferences, stakes)
+    rng = resolve_rng(rng)
+    mechanism.reset()
 
-    # Optimal decision minimizes friction (stakes-weighted median)
-    optimal_decision = weighted_median(preferences, stakes)
-    f_optimal = compute_friction(optimal_decision, preferences, stakes)
+    stakes = generate_heterogeneous_stakes(n_agents, distribution_type='mixed', rng=rng)
+    wealth = rng.pareto(a=1.16, size=n_agents) + 0.5
+    rng.shuffle(wealth)
+    preferences = rng.normal(0, 1, n_agents)
 
-    # Max friction
-    pref_min, pref_max = np.min(preferences), np.max(preferences)
-    f_max = max(
-        compute_friction(pref_min, preferences, stakes),
-        compute_friction(pref_max, preferences, stakes)
-    )
+    alpha_traj = np.zeros(n_timesteps)
+    friction_traj = np.zeros(n_timesteps)
+    kernel = StakesKernel(preferences, stakes_response)
+
+    for t in range(n_timesteps):
+        consent = mechanism.allocate_consent(stakes, wealth, rng=rng)
+        decision = kernel.decide(consent)
+
+        # STAKES UPDATE: Winners gain, losers lose (in place)
+        alpha_traj[t], friction_traj[t] = kernel.step(decision, stakes)
+        mechanism.observe(decision, preferences, stakes)
+
+    return alpha_traj, friction_traj
+
+
+def _exit_dynamics(mechanism: ConsentMechanism, stakes: np.ndarray, wealth: np.ndarray,
+                   preferences: np.ndarray, n_timesteps: int, exit_threshold: float,
+                   satisfaction_decay: float, rng) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Exit-mode loop over populations of shape (..., n_agents).
 
-    if f_max == 0:
-        return 1.0
+    Agents who leave stay in the arrays under an active mask, so runs whose
+    populations shrink at different rates still advance together.
+    """
+    active = np.ones(np.shape(preferences), dtype=bool)
+    satisfaction = np.zeros(np.shape(preferences))
 
-    # Performance relative to optimal
-    performance = 1.0 - (f_actual / f_max)
-    return np.clip(performance, 0.0, 1.0)
+    batch_shape = np.shape(preferences)[:-1]
+    alpha_traj = np.zeros(batch_shape + (n_timesteps,))
+    friction_traj = np.zeros(batch_shape + (n_timesteps,))
+    population_traj = np.zeros(batch_shape + (n_timesteps,), dtype=np.int64)
 
+    for t in range(n_timesteps):
+        # Only active agents participate
+        consent = mechanism.allocate_consent_batch(stakes, wealth, rng=rng, active=active)
+        decisions = np.asarray(np.sum(consent * preferences, axis=-1))
 
-def weighted_median(values: np.ndarray, weights: np.ndarray) -> float:
-    """Compute weighted median"""
-    sorted_idx = np.argsort(values)
-    sorted_values = values[sorted_idx]
-    sorted_weights = weights[sorted_idx]
+        # Alignment among agents active at decision time
+        metrics = compute_metrics_batch(decisions, preferences, stakes, consent, active=active)
+        alpha_traj[..., t] = metrics.alpha
+        friction_traj[..., t] = metrics.friction
+        mechanism.observe(decisions, preferences, np.where(active, stakes, 0.0))
 
-    cumsum = np.cumsum(sorted_weights)
-    total = cumsum[-1]
+        # EXIT DECISION: satisfaction decays and falls with distance from the
+        # decision; agents leave for good once it drops below the threshold
+        deviation = np.abs(decisions[..., np.newaxis] - preferences)
+        np.subtract(satisfaction_decay * satisfaction, deviation, out=satisfaction, where=active)
+        active &= satisfaction > exit_threshold
+        population_traj[..., t] = np.sum(active, axis=-1)
 
-    median_idx = np.searchsorted(cumsum, total / 2.0)
-    return sorted_values[median_idx]
+    return alpha_traj, friction_traj, population_traj
 
 
-def compute_legitimacy(alpha: float, performance: float,
-                       w_consent: float = 0.6, w_performance: float = 0.4) -> float:
+def run_exit_mode(mechanism: ConsentMechanism, n_agents: int, n_timesteps: int,
+                  exit_threshold: float = -0.5, satisfaction_decay: float = 0.9,
+                  rng: np.random.Generator = None) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
     """
-    Compute legitimacy L = w1*α + w2*P
+    Entry/exit dynamics: agents exit if satisfaction drops below threshold.
 
-    Args:
-        alpha: Consent alignment
-        performance: Policy performance
-        w_consent: Weight for consent (default 0.6)
-        w_performance: Weight for performance (default 0.4)
+    Exited agents keep their slots with zero consent and zero stakes, and
+    α and F are measured over the agents who took part in each decision.
+    Once everyone has left, α = F = 0.
 
     Returns:
-        legitimacy: Combined legitimacy metric
+        alpha_trajectory, friction_trajectory, population_trajectory (active
+        agents after each period's exits)
     """
-    return w_consent * alpha + w_performance * performance
+    rng = resolve_rng(rng)
+    mechanism.reset()
+
+    stakes = generate_heterogeneous_stakes(n_agents, distribution_type='mixed', rng=rng)
+    wealth = rng.pareto(a=1.16, size=n_agents) + 0.5
+    rng.shuffle(wealth)
+    preferences = rng.normal(0, 1, n_agents)
+
+    return _exit_dynamics(mechanism, stakes, wealth, preferences, n_timesteps,
+                          exit_threshold, satisfaction_decay, rng)
 
 
 # ==============================================================================
-# DYNAMIC MECHANISMS
+# BATCHED DYNAMIC MECHANISMS
 # ==============================================================================
+# Same dynamics as above, advancing all runs together. Every array carries a
+# leading run axis: (n_runs, n_agents) per timestep, (n_runs, n_timesteps) out.
 
-def run_static_mode(mechanism: ConsentMechanism, n_agents: int, n_timesteps: int) -> Tuple[np.ndarray, np.ndarray]:
+def run_static_mode_batch(mechanism: ConsentMechanism, n_runs: int, n_agents: int,
+                          n_timesteps: int,
+                          rng: np.random.Generator = None) -> Tuple[np.ndarray, np.ndarray]:
     """
-    Original static evaluation - no temporal dynamics.
-    Society generated once, metrics recorded over time (but nothing changes).
+    Batched run_static_mode.
 
     Returns:
-        alpha_trajectory, friction_trajectory
+        alpha_trajectory, friction_trajectory: Arrays of shape (n_runs, n_timesteps)
     """
-    # Generate agent characteristics (fixed across time for this run)
-    stakes = generate_heterogeneous_stakes(n_agents, distribution_type='mixed')
+    rng = resolve_rng(rng)
+    mechanism.reset()
 
-    # Wealth deliberately decoupled from stakes (Pearson r ≈ 0.1-0.3)
-    wealth = np.random.pareto(a=1.16, size=n_agents) + 0.5
-    np.random.shuffle(wealth)
+    stakes, wealth, preferences = generate_society_batch(n_runs, n_agents, rng=rng)
 
-    # Agent preferences (vary by domain but stable in time)
-    if np.random.rand() > 0.5:
-        preferences = np.random.normal(0, 1, n_agents)
-    else:
-        # Bimodal: two clusters
-        cluster = np.random.choice([0, 1], size=n_agents)
-        preferences = np.where(cluster == 0,
-                              np.random.normal(-1.5, 0.5, n_agents),
-                              np.random.normal(1.5, 0.5, n_agents))
+    alpha_traj = np.zeros((n_runs, n_timesteps))
+    friction_traj = np.zeros((n_runs, n_timesteps))
+    n_evaluations = 1 if mechanism.deterministic else n_timesteps
+    oracle = FrictionOracle(preferences, stakes)
 
-    alpha_traj = np.zeros(n_timesteps)
-    friction_traj = np.zeros(n_timesteps)
+    for t in range(n_evaluations):
+        consent = mechanism.allocate_consent_batch(stakes, wealth, rng=rng)
+        decisions = np.sum(consent * preferences, axis=1)
 
-    # Run over time (nothing changes - static)
-    for t in range(n_timesteps):
-        consent = mechanism.allocate_consent(stakes, wealth)
-        decision = np.sum(consent * preferences)
+        metrics = oracle.compute_metrics(decisions)
+        alpha_traj[:, t] = metrics.alpha
+        friction_traj[:, t] = metrics.friction
+        mechanism.observe(decisions, preferences, stakes)
 
-        alpha_traj[t] = compute_alpha(decision, preferences, stakes, consent)
-        friction_traj[t] = compute_friction(decision, preferences, stakes)
+    if n_evaluations < n_timesteps:
+        alpha_traj[:, 1:] = alpha_traj[:, :1]
+        friction_traj[:, 1:] = friction_traj[:, :1]
 
     return alpha_traj, friction_traj
 
 
-def run_learning_mode(mechanism: ConsentMechanism, n_agents: int, n_timesteps: int) -> Tuple[np.ndarray, np.ndarray]:
+def run_learning_mode_batch(mechanism: ConsentMechanism, n_runs: int, n_agents: int,
+                            n_timesteps: int,
+                            rng: np.random.Generator = None) -> Tuple[np.ndarray, np.ndarray]:
     """
-    Bayesian preference updating from observed outcomes.
-    Agents update beliefs about optimal policy based on decision results.
+    Batched run_learning_mode.
+
+    All allocations and the full (timestep, run) outcome noise are drawn up
+    front, then each block of about LEARNING_SCAN_BLOCK_SIZE elements worth
+    of runs is evaluated over every timestep by one LearningScan. Blocking
+    over runs keeps the (timestep, runs, agents) temporaries small without
+    splitting the scan. Stateful mechanisms still advance one period at a time.
 
     Returns:
-        alpha_trajectory, friction_trajectory
+        alpha_trajectory, friction_trajectory: Arrays of shape (n_runs, n_timesteps)
     """
-    # Initial conditions
-    stakes = generate_heterogeneous_stakes(n_agents, distribution_type='mixed')
-    wealth = np.random.pareto(a=1.16, size=n_agents) + 0.5
-    np.random.shuffle(wealth)
-    preferences = np.random.normal(0, 1, n_agents)
-
-    # Bayesian priors
-    prior_mean = preferences.copy()
-    prior_precision = 1.0
-
-    alpha_traj = np.zeros(n_timesteps)
-    friction_traj = np.zeros(n_timesteps)
-
-    for t in range(n_timesteps):
-        consent = mechanism.allocate_consent(stakes, wealth)
-        decision = np.sum(consent * preferences)
+    rng = resolve_rng(rng)
+    mechanism.reset()
+
+    stakes = generate_heterogeneous_stakes_batch(n_runs, n_agents, distribution_type='mixed', rng=rng)
+    wealth = rng.pareto(a=1.16, size=(n_runs, n_agents)) + 0.5
+    prior_mean = rng.normal(0, 1, (n_runs, n_agents))
+
+    if mechanism.stateful:
+        alpha_traj = np.zeros((n_runs, n_timesteps))
+        friction_traj = np.zeros((n_runs, n_timesteps))
+        scan = LearningScan(prior_mean, stakes)
+
+        for t in range(n_timesteps):
+            consent = mechanism.allocate_consent_batch(stakes, wealth, rng=rng)
+            noise = rng.normal(0, 0.1, (1, n_runs))
+            decisions, preferences = scan.advance(consent[np.newaxis], noise)
+
+            metrics = compute_metrics_batch(decisions, preferences, stakes, consent)
+            alpha_traj[:, t], friction_traj[:, t] = metrics.alpha[0], metrics.friction[0]
+            mechanism.observe(decisions[0], preferences[0], stakes)
+
+        return alpha_traj, friction_traj
+
+    # A deterministic allocation is the same every period, so it is broadcast
+    # over timesteps instead of being materialised T times
+    if mechanism.deterministic:
+        consent = np.broadcast_to(mechanism.allocate_consent_batch(stakes, wealth, rng=rng),
+                                  (n_timesteps, n_runs, n_agents))
+    else:
+        consent = np.stack([mechanism.allocate_consent_batch(stakes, wealth, rng=rng)
+                            for _ in range(n_timesteps)])
+    # One noisy outcome per (period, run), observed by all of the run's agents
+    noise = rng.normal(0, 0.1, (n_timesteps, n_runs))
 
-        # Observe outcome (noisy signal of decision quality)
-        observed_outcome = decision + np.random.normal(0, 0.1)
-
-        # BAYESIAN UPDATE: Agents learn from observed outcomes
-        # Higher-stakes agents pay more attention
-        observation_precision = stakes
-        posterior_precision = prior_precision + observation_precision
-        posterior_mean = (
-            (prior_precision * prior_mean + observation_precision * observed_outcome)
-            / posterior_precision
-        )
+    alpha_traj = np.empty((n_runs, n_timesteps))
+    friction_traj = np.empty((n_runs, n_timesteps))
+    block = max(1, LEARNING_SCAN_BLOCK_SIZE // (n_timesteps * n_agents))
 
-        # Update preferences for next period
-        preferences = posterior_mean
-        prior_precision = posterior_precision
-        prior_mean = posterior_mean
+    for start in range(0, n_runs, block):
+        rows = slice(start, min(start + block, n_runs))
+        decisions, preferences = LearningScan(prior_mean[rows], stakes[rows]).advance(
+            consent[:, rows], noise[:, rows])
 
-        alpha_traj[t] = compute_alpha(decision, preferences, stakes, consent)
-        friction_traj[t] = compute_friction(decision, preferences, stakes)
+        metrics = compute_metrics_batch(decisions, preferences, stakes[rows], consent[:, rows])
+        alpha_traj[rows] = metrics.alpha.T
+        friction_traj[rows] = metrics.friction.T
 
     return alpha_traj, friction_traj
 
 
-def run_social_mode(mechanism: ConsentMechanism, n_agents: int, n_timesteps: int,
-                    influence_strength: float = 0.1) -> Tuple[np.ndarray, np.ndarray]:
+def run_social_mode_batch(mechanism: ConsentMechanism, n_runs: int, n_agents: int,
+                          n_timesteps: int,
+                          influence_strength: float = 0.1,
+                          connection_prob: float = 0.1,
+                          avg_degree: float = None,
+                          rng: np.random.Generator = None) -> Tuple[np.ndarray, np.ndarray]:
     """
-    DeGroot opinion dynamics via social network.
-    Preferences drift toward neighbors each period.
+    Batched run_social_mode.
+
+    All runs' networks form one block-diagonal sparse matrix, so the DeGroot
+    update for every run is a single sparse matvec per timestep.
 
     Returns:
-        alpha_trajectory, friction_trajectory
+        alpha_trajectory, friction_trajectory: Arrays of shape (n_runs, n_timesteps)
     """
-    stakes = generate_heterogeneous_stakes(n_agents, distribution_type='mixed')
-    wealth = np.random.pareto(a=1.16, size=n_agents) + 0.5
-    np.random.shuffle(wealth)
-    preferences = np.random.normal(0, 1, n_agents)
+    rng = resolve_rng(rng)
+    mechanism.reset()
 
-    # Social network: Erdős–Rényi random graph
-    connection_prob = 0.1
-    social_network = np.random.rand(n_agents, n_agents) < connection_prob
-    np.fill_diagonal(social_network, False)
+    stakes = generate_heterogeneous_stakes_batch(n_runs, n_agents, distribution_type='mixed', rng=rng)
+    wealth = rng.pareto(a=1.16, size=(n_runs, n_agents)) + 0.5
+    preferences = rng.normal(0, 1, (n_runs, n_agents))
 
-    # Normalize rows (equal influence from neighbors)
-    row_sums = social_network.sum(axis=1)
-    row_sums[row_sums == 0] = 1  # Avoid division by zero
-    social_network = social_network / row_sums[:, np.newaxis]
+    if avg_degree is not None:
+        connection_prob = avg_degree / max(n_agents - 1, 1)
+    social_network = erdos_renyi_network(n_agents, connection_prob, rng=rng, n_blocks=n_runs)
 
-    alpha_traj = np.zeros(n_timesteps)
-    friction_traj = np.zeros(n_timesteps)
+    alpha_traj = np.zeros((n_runs, n_timesteps))
+    friction_traj = np.zeros((n_runs, n_timesteps))
 
     for t in range(n_timesteps):
-        consent = mechanism.allocate_consent(stakes, wealth)
-        decision = np.sum(consent * preferences)
+        consent = mechanism.allocate_consent_batch(stakes, wealth, rng=rng)
+        decisions = np.sum(consent * preferences, axis=1)
 
-        # SOCIAL INFLUENCE: Move toward neighbors' preferences
-        neighbor_avg = social_network @ preferences
-        preferences = (
-            (1 - influence_strength) * preferences +
-            influence_strength * neighbor_avg
-        )
+        neighbor_avg = (social_network @ preferences.ravel()).reshape(n_runs, n_agents)
+        preferences = (1 - influence_strength) * preferences + influence_strength * neighbor_avg
 
-        alpha_traj[t] = compute_alpha(decision, preferences, stakes, consent)
-        friction_traj[t] = compute_friction(decision, preferences, stakes)
+        metrics = compute_metrics_batch(decisions, preferences, stakes, consent)
+        alpha_traj[:, t] = metrics.alpha
+        friction_traj[:, t] = metrics.friction
+        mechanism.observe(decisions, preferences, stakes)
 
     return alpha_traj, friction_traj
 
 
-def run_stakes_mode(mechanism: ConsentMechanism, n_agents: int, n_timesteps: int,
-                    stakes_response: float = 0.05) -> Tuple[np.ndarray, np.ndarray]:
+def run_stakes_mode_batch(mechanism: ConsentMechanism, n_runs: int, n_agents: int,
+                          n_timesteps: int,
+                          stakes_response: float = 0.05,
+                          rng: np.random.Generator = None) -> Tuple[np.ndarray, np.ndarray]:
     """
-    Endogenous stakes evolution based on decision impacts.
-    Winners (whose preferences align with decisions) gain stakes; losers lose stakes.
+    Batched run_stakes_mode.
 
     Returns:
-        alpha_trajectory, friction_trajectory
+        alpha_trajectory, friction_trajectory: Arrays of shape (n_runs, n_timesteps)
     """
-    stakes = generate_heterogeneous_stakes(n_agents, distribution_type='mixed')
-    wealth = np.random.pareto(a=1.16, size=n_agents) + 0.5
-    np.random.shuffle(wealth)
-    preferences = np.random.normal(0, 1, n_agents)
+    rng = resolve_rng(rng)
+    mechanism.reset()
 
-    alpha_traj = np.zeros(n_timesteps)
-    friction_traj = np.zeros(n_timesteps)
+    stakes = generate_heterogeneous_stakes_batch(n_runs, n_agents, distribution_type='mixed', rng=rng)
+    wealth = rng.pareto(a=1.16, size=(n_runs, n_agents)) + 0.5
+    preferences = rng.normal(0, 1, (n_runs, n_agents))
+
+    alpha_traj = np.zeros((n_runs, n_timesteps))
+    friction_traj = np.zeros((n_runs, n_timesteps))
+    kernel = StakesKernel(preferences, stakes_response)
 
     for t in range(n_timesteps):
-        consent = mechanism.allocate_consent(stakes, wealth)
-        decision = np.sum(consent * preferences)
+        consent = mechanism.allocate_consent_batch(stakes, wealth, rng=rng)
+        decisions = kernel.decide(consent)
+        alpha_traj[:, t], friction_traj[:, t] = kernel.step(decisions, stakes)
+        mechanism.observe(decisions, preferences, stakes)
 
-        # STAKES UPDATE: Winners gain, losers lose
-        deviation = np.abs(decision - preferences)
-        stakes_change = stakes_response * stakes * (1.0 - deviation)
-        stakes = stakes + stakes_change
-        stakes = np.maximum(stakes, 0.01)  # Floor at 0.01
-        stakes = stakes / np.mean(stakes)  # Renormalize
+    return alpha_traj, friction_traj
 
-        alpha_traj[t] = compute_alpha(decision, preferences, stakes, consent)
-        friction_traj[t] = compute_friction(decision, preferences, stakes)
 
-    return alpha_traj, friction_traj
+def run_exit_mode_batch(mechanism: ConsentMechanism, n_runs: int, n_agents: int,
+                        n_timesteps: int,
+                        exit_threshold: float = -0.5, satisfaction_decay: float = 0.9,
+                        rng: np.random.Generator = None) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Batched run_exit_mode.
+
+    Returns:
+        alpha_trajectory, friction_trajectory, population_trajectory: Arrays
+        of shape (n_runs, n_timesteps)
+    """
+    rng = resolve_rng(rng)
+    mechanism.reset()
+
+    stakes = generate_heterogeneous_stakes_batch(n_runs, n_agents, distribution_type='mixed', rng=rng)
+    wealth = rng.pareto(a=1.16, size=(n_runs, n_agents)) + 0.5
+    preferences = rng.normal(0, 1, (n_runs, n_agents))
+
+    return _exit_dynamics(mechanism, stakes, wealth, preferences, n_timesteps,
+                          exit_threshold, satisfaction_decay, rng)
 
 
 def run_mechanism_simulation(mechanism: ConsentMechanism,
                              dynamic_mode: str = 'static',
                              n_runs: int = N_RUNS,
                              n_agents: int = N_AGENTS,
-                             n_timesteps: int = N_TIMESTEPS) -> SimulationResults:
+                             n_timesteps: int = N_TIMESTEPS,
+                             engine: str = 'scalar',
+                             seed: int = None,
+                             first_run: int = 0,
+                             stream: str = None) -> SimulationResults:
     """
     Run Monte Carlo simulation for a single mechanism with specified dynamics.
 
     Args:
         mechanism: Consent allocation mechanism
-        dynamic_mode: 'static', 'learning', 'social', or 'stakes'
+        dynamic_mode: 'static', 'learning', 'social', 'stakes', or 'exit'
         n_runs: Number of Monte Carlo iterations
         n_agents: Population size
         n_timesteps: Time periods for convergence
+        engine: 'scalar' (one run at a time) or 'batched' (all runs at once)
+        seed: Master seed. If given, each run (or each batch, under the
+            batched engine) draws from its own counter-based stream; if None,
+            from the global random state
+        first_run: Index of the first run, for simulating a shard of a cell
+        stream: Name keying the seeded streams (default: the mechanism's name).
+            Mechanisms given the same stream draw the same societies run by
+            run, i.e. common random numbers
 
     Returns:
         SimulationResults with trajectories and summary statistics
     """
+    if engine not in ('scalar', 'batched'):
+        raise ValueError(f"Unknown engine: {engine}")
+    stream = stream or mechanism.name
+
     alpha_traj_all = np.zeros((n_runs, n_timesteps))
     friction_traj_all = np.zeros((n_runs, n_timesteps))
+    population_traj_all = np.zeros((n_runs, n_timesteps), dtype=np.int64) if dynamic_mode == 'exit' else None
     final_legitimacy = np.zeros(n_runs)
 
     # Select dynamic mode
     if dynamic_mode == 'learning':
-        runner = run_learning_mode
+        runner, batch_runner = run_learning_mode, run_learning_mode_batch
     elif dynamic_mode == 'social':
-        runner = run_social_mode
+        runner, batch_runner = run_social_mode, run_social_mode_batch
     elif dynamic_mode == 'stakes':
-        runner = run_stakes_mode
+        runner, batch_runner = run_stakes_mode, run_stakes_mode_batch
+    elif dynamic_mode == 'exit':
+        runner, batch_runner = run_exit_mode, run_exit_mode_batch
     else:  # static
-        runner = run_static_mode
+        runner, batch_runner = run_static_mode, run_static_mode_batch
+
+    # Without a seed everything draws from the legacy global state
+    if engine == 'batched':
+        rng = np.random if seed is None else block_rng(seed, stream, dynamic_mode,
+                                                       first_run, n_runs)
+        trajectories = batch_runner(mechanism, n_runs, n_agents, n_timesteps, rng=rng)
+        alpha_traj_all, friction_traj_all = trajectories[:2]
+        if population_traj_all is not None:
+            population_traj_all = trajectories[2]
+
+        # Final legitimacy (same placeholder performance as the scalar path)
+        preferences_final = rng.normal(0, 1, (n_runs, n_agents))
+        stakes_final = generate_heterogeneous_stakes_batch(n_runs, n_agents, rng=rng)
+        performance_final = compute_performance_batch(np.zeros(n_runs), preferences_final, stakes_final)
+        final_legitimacy = compute_legitimacy(alpha_traj_all[:, -1], performance_final)
 
-    for run in range(n_runs):
-        alpha_traj, friction_traj = runner(mechanism, n_agents, n_timesteps)
-
-        alpha_traj_all[run, :] = alpha_traj
-        friction_traj_all[run, :] = friction_traj
-
-        # Final legitimacy
-        alpha_final = alpha_traj[-1]
-        preferences_final = np.random.normal(0, 1, n_agents)  # Placeholder for performance calc
-        stakes_final = generate_heterogeneous_stakes(n_agents)
-        performance_final = compute_performance(0.0, preferences_final, stakes_final)
-        final_legitimacy[run] = compute_legitimacy(alpha_final, performance_final)
+    else:
+        for run in range(n_runs):
+            rng = np.random if seed is None else run_rng(seed, stream, dynamic_mode,
+                                                         first_run + run)
+            trajectories = runner(mechanism, n_agents, n_timesteps, rng=rng)
+            alpha_traj, friction_traj = trajectories[:2]
+
+            alpha_traj_all[run, :] = alpha_traj
+            friction_traj_all[run, :] = friction_traj
+            if population_traj_all is not None:
+                population_traj_all[run, :] = trajectories[2]
+
+            # Final legitimacy
+            alpha_final = alpha_traj[-1]
+            preferences_final = rng.normal(0, 1, n_agents)  # Placeholder for performance calc
+            stakes_final = generate_heterogeneous_stakes(n_agents, rng=rng)
+            performance_final = compute_performance(0.0, preferences_final, stakes_final)
+            final_legitimacy[run] = compute_legitimacy(alpha_final, performance_final)
 
     results = SimulationResults(
         mechanism_name=mechanism.name,
@@ -534,33 +903,1073 @@ def run_mechanism_simulation(mechanism: ConsentMechanism,
         mean_alpha=np.mean(alpha_traj_all[:, -1]),
         mean_friction=np.mean(friction_traj_all[:, -1]),
         mean_legitimacy=np.mean(final_legitimacy),
-        std_legitimacy=np.std(final_legitimacy)
+        std_legitimacy=np.std(final_legitimacy),
+        population_trajectory=population_traj_all
     )
 
     return results
 
 
-def save_results_csv(results: SimulationResults, output_path: str):
-    """Save trajectory results to CSV"""
+# ==============================================================================
+# STREAMING AGGREGATION
+# ==============================================================================
+# For very many runs only per-timestep summaries are kept: runs are simulated
+# a block at a time and folded into a TrajectoryAggregate, so memory is
+# O(n_timesteps) plus one block, whatever n_runs is.
+
+@dataclass
+class AggregateResults:
+    """Per-timestep summaries of a cell, in place of per-run trajectories"""
+    mechanism_name: str
+    dynamic_mode: str
+    stats: TrajectoryAggregate  # Series: alpha, friction, legitimacy (+ population in exit mode)
+
+    @property
+    def n_runs(self) -> int:
+        return self.stats.count
+
+    @property
+    def mean_alpha(self) -> float:
+        return self.stats.mean('alpha')[-1]
+
+    @property
+    def mean_friction(self) -> float:
+        return self.stats.mean('friction')[-1]
+
+    @property
+    def mean_legitimacy(self) -> float:
+        return self.stats.mean('legitimacy')[0]
+
+    @property
+    def std_legitimacy(self) -> float:
+        # Population std, as np.std in SimulationResults
+        return self.stats.std('legitimacy', ddof=0)[0]
+
+
+def run_mechanism_aggregate(mechanism: ConsentMechanism,
+                            dynamic_mode: str = 'static',
+                            n_runs: int = N_RUNS,
+                            n_agents: int = N_AGENTS,
+                            n_timesteps: int = N_TIMESTEPS,
+                            engine: str = 'scalar',
+                            seed: int = None,
+                            first_run: int = 0,
+                            block_runs: int = AGGREGATE_BLOCK_RUNS,
+                            reservoir_size: int = 0) -> AggregateResults:
+    """
+    run_mechanism_simulation folded into streaming per-timestep statistics.
+
+    Runs are simulated block_runs at a time. Under the scalar engine each run
+    keeps its own stream, so the statistics describe exactly the runs
+    run_mechanism_simulation would produce; under the batched engine each
+    block is one batch.
+
+    Args:
+        mechanism, dynamic_mode, n_runs, n_agents, n_timesteps, engine, seed,
+            first_run: As in run_mechanism_simulation
+        block_runs: Runs per block
+        reservoir_size: Whole runs to keep for plotting (0 for none)
+
+    Returns:
+        AggregateResults with means, variances, quantile sketches and
+        the optional reservoir
+    """
+    lengths = {'alpha': n_timesteps, 'friction': n_timesteps, 'legitimacy': 1}
+    if dynamic_mode == 'exit':
+        lengths['population'] = n_timesteps
+    stats = TrajectoryAggregate(lengths, reservoir_size=reservoir_size,
+                                seed=None if seed is None else (seed, first_run))
+
+    for start in range(0, n_runs, block_runs):
+        block = run_mechanism_simulation(mechanism, dynamic_mode=dynamic_mode,
+                                         n_runs=min(block_runs, n_runs - start),
+                                         n_agents=n_agents, n_timesteps=n_timesteps,
+                                         engine=engine, seed=seed, first_run=first_run + start)
+        series = {'alpha': block.alpha_trajectory, 'friction': block.friction_trajectory,
+                  'legitimacy': block.final_legitimacy}
+        if dynamic_mode == 'exit':
+            series['population'] = block.population_trajectory
+        stats.update(**series)
+
+    return AggregateResults(mechanism_name=mechanism.name, dynamic_mode=dynamic_mode, stats=stats)
+
+
+def save_aggregate_csv(results: AggregateResults, output_path: str,
+                       quantiles: Tuple[float, ...] = (0.05, 0.5, 0.95)):
+    """Save per-timestep mean, std, 95% CI half-width and quantiles to CSV"""
+    stats = results.stats
+    series = [name for name in stats.lengths if name != 'legitimacy']
+    n_timesteps = stats.lengths['alpha']
+
+    columns = {}
+    for name in series:
+        columns[f'{name}_mean'] = stats.mean(name)
+        columns[f'{name}_std'] = stats.std(name)
+        columns[f'{name}_ci95'] = stats.ci_half_width(name)
+        for q in quantiles:
+            columns[f'{name}_q{round(100 * q):02d}'] = stats.quantile(name, q)
+
     with open(output_path, 'w', newline='') as f:
         writer = csv.writer(f)
-        writer.writerow(['mechanism', 'dynamic_mode', 'run', 'timestep', 'alpha', 'friction'])
+        writer.writerow(['mechanism', 'dynamic_mode', 'timestep', 'n_runs'] + list(columns))
+        for t in range(n_timesteps):
+            writer.writerow([results.mechanism_name, results.dynamic_mode, t, stats.count] +
+                            [values[t] for values in columns.values()])
 
-        n_runs, n_timesteps = results.alpha_trajectory.shape
-        for run in range(n_runs):
-            for t in range(n_timesteps):
-                writer.writerow([
-                    results.mechanism_name,
-                    results.dynamic_mode,
-                    run,
-                    t,
-                    results.alpha_trajectory[run, t],
-                    results.friction_trajectory[run, t]
-                ])
+    print(f"✓ Saved aggregate results to {output_path}")
+
+
+# ==============================================================================
+# SEQUENTIAL STOPPING
+# ==============================================================================
+# Instead of a fixed N_RUNS, each cell is simulated in batches until its 95%
+# CI is narrower than a target, so runs go where mechanisms are hard to tell apart.
+
+@dataclass
+class PrecisionResult:
+    """Final-period estimates of one cell and the precision achieved"""
+    mechanism_name: str
+    dynamic_mode: str
+    n_runs: int
+    mean_alpha: float
+    alpha_ci: float  # CI half-width
+    mean_legitimacy: float
+    legitimacy_ci: float
+    diff_vs_equal_voice: float  # Paired difference in final α (NaN for Equal Voice)
+    diff_ci: float
+    converged: bool  # Target reached before max_runs
+
+
+def _run_precision_batch(task: Tuple) -> Tuple[np.ndarray, np.ndarray]:
+    """Final α and legitimacy of one mechanism's batch on the common stream"""
+    mechanism, dynamic_mode, first_run, n_runs, n_agents, n_timesteps, engine, seed = task
+    results = run_mechanism_simulation(mechanism, dynamic_mode=dynamic_mode, n_runs=n_runs,
+                                       n_agents=n_agents, n_timesteps=n_timesteps,
+                                       engine=engine, seed=seed, first_run=first_run,
+                                       stream='common')
+    return results.alpha_trajectory[:, -1], results.final_legitimacy
+
+
+def run_until_precise(mechanisms: List[ConsentMechanism],
+                      dynamic_mode: str = 'static',
+                      target_ci: float = 0.01,
+                      max_runs: int = 10 * N_RUNS,
+                      batch_runs: int = 100,
+                      criterion: str = 'mean',
+                      n_agents: int = N_AGENTS,
+                      n_timesteps: int = N_TIMESTEPS,
+                      engine: str = 'scalar',
+                      seed: int = SEED,
+                      confidence: float = 0.95,
+                      initial_runs: int = None,
+                      workers: int = 1) -> Dict[str, PrecisionResult]:
+    """
+    Simulate every mechanism in batches until its CI half-width is below target_ci.
+
+    All mechanisms draw from one shared stream per run, so run r starts from
+    the same society for each of them and differences can be paired. A cell
+    stops once, after a whole batch,
+
+        criterion='mean':   the CI half-widths on mean final α and on mean
+                            final legitimacy are both ≤ target_ci
+        criterion='paired': the CI half-width on the paired difference in
+                            final α vs Equal Voice is ≤ target_ci (Equal
+                            Voice itself uses 'mean')
+
+    or when max_runs is reached. Under either criterion Equal Voice keeps being
+    simulated while any other cell runs, so each cell's paired difference
+    uses all of its n_runs. Runs are generated in order, so the first n runs
+    of a cell are the same whatever the stopping point.
+
+    Args:
+        mechanisms: Mechanisms to simulate
+        dynamic_mode: Dynamic mode for every cell
+        target_ci: Target CI half-width (absolute)
+        max_runs: Run cap per cell
+        batch_runs: Runs simulated between checks (also the minimum)
+        criterion: 'mean' or 'paired'
+        n_agents, n_timesteps, engine, seed: As in run_mechanism_simulation
+        confidence: CI level
+        initial_runs: Runs in the first batch before any check (default: batch_runs)
+        workers: Worker processes; the mechanisms of a batch run in parallel,
+            with the same results as workers=1
+
+    Returns:
+        {mechanism_name: PrecisionResult}
+    """
+    if criterion not in ('mean', 'paired'):
+        raise ValueError(f"Unknown criterion: {criterion}")
+
+    reference = next((m for m in mechanisms if isinstance(m, EqualVoice)), EqualVoice())
+    moments = {m.name: {key: RunningMoments(1) for key in ('alpha', 'legitimacy', 'diff')}
+               for m in mechanisms}
+    active = list(mechanisms)
+    first_run = 0
+
+    def half_width(name, key):
+        return moments[name][key].ci_half_width(confidence)[0]
+
+    def precise(mechanism):
+        if criterion == 'paired' and mechanism is not reference:
+            return half_width(mechanism.name, 'diff') <= target_ci
+        return max(half_width(mechanism.name, 'alpha'),
+                   half_width(mechanism.name, 'legitimacy')) <= target_ci
+
+    executor = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+    try:
+        while active and first_run < max_runs:
+            n_runs = min(batch_runs if first_run else (initial_runs or batch_runs),
+                         max_runs - first_run)
+            # The reference also runs past its own stop so every diff covers all runs
+            paired = any(m is not reference for m in active)
+            batch = active + [reference] if paired and reference not in active else active
+
+            tasks = [(mechanism, dynamic_mode, first_run, n_runs, n_agents, n_timesteps, engine, seed)
+                     for mechanism in batch]
+            batch_finals = (executor.map(_run_precision_batch, tasks) if executor
+                            else map(_run_precision_batch, tasks))
+            finals = {mechanism.name: final for mechanism, final in zip(batch, batch_finals)}
+
+            for mechanism in active:
+                alpha, legitimacy = finals[mechanism.name]
+                moments[mechanism.name]['alpha'].update(alpha[:, np.newaxis])
+                moments[mechanism.name]['legitimacy'].update(legitimacy[:, np.newaxis])
+                if reference.name in finals and mechanism is not reference:
+                    moments[mechanism.name]['diff'].update((alpha - finals[reference.name][0])[:, np.newaxis])
+
+            first_run += n_runs
+            active = [m for m in active if not precise(m)]
+    finally:
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
+
+    return {
+        m.name: PrecisionResult(
+            mechanism_name=m.name,
+            dynamic_mode=dynamic_mode,
+            n_runs=moments[m.name]['alpha'].count,
+            mean_alpha=moments[m.name]['alpha'].mean[0],
+            alpha_ci=half_width(m.name, 'alpha'),
+            mean_legitimacy=moments[m.name]['legitimacy'].mean[0],
+            legitimacy_ci=half_width(m.name, 'legitimacy'),
+            diff_vs_equal_voice=moments[m.name]['diff'].mean[0] if m is not reference else np.nan,
+            diff_ci=half_width(m.name, 'diff') if m is not reference else np.nan,
+            converged=m not in active
+        )
+        for m in mechanisms
+    }
+
+
+def print_precision_table(results: Dict[str, PrecisionResult], target_ci: float):
+    """Print runs used and achieved CI half-widths per cell"""
+    print("\n" + "="*100)
+    print(f"SEQUENTIAL STOPPING (target 95% CI half-width {target_ci:g})")
+    print("="*100)
+    print(f"{'Mechanism':<25} {'Mode':<10} {'Runs':>7} {'Mean α':>9} {'± CI':>8} "
+          f"{'Mean L':>9} {'± CI':>8} {'Δα vs EV':>9} {'± CI':>8}")
+    print("-"*100)
+
+    for result in results.values():
+        flag = '' if result.converged else '  (max runs)'
+        print(f"{result.mechanism_name:<25} {result.dynamic_mode:<10} {result.n_runs:>7d} "
+              f"{result.mean_alpha:>9.4f} {result.alpha_ci:>8.4f} "
+              f"{result.mean_legitimacy:>9.4f} {result.legitimacy_ci:>8.4f} "
+              f"{result.diff_vs_equal_voice:>9.4f} {result.diff_ci:>8.4f}{flag}")
+
+    print("="*100)
+
+
+# ==============================================================================
+# LONG-HORIZON SOCIAL DYNAMICS
+# ==============================================================================
+# Social-mode preferences follow p_{t+1} = M p_t with the fixed matrix
+# M = (1 - λ)I + λW, so p_t = M^t p_0 and any timestep can be reached without
+# visiting the ones before it.
+
+class DeGrootPropagator:
+    """
+    Applies powers of M = (1 - λ)I + λW to preference vectors.
+
+    For a dense network the squares M, M², M⁴, ... are computed on demand and
+    cached, so advancing by Δ steps costs popcount(Δ) matvecs and reaching
+    t = 10⁶ needs 20 squarings. Squaring a sparse network fills it in, so
+    sparse networks advance by matvec until the iterate is within tol of the
+    t → ∞ limit, which is then returned: M is non-negative with row sums at
+    most 1, so later steps can only move the iterate closer to the limit.
+    Long horizons therefore cost as many matvecs as the network takes to
+    mix, not one per timestep.
+
+    Many independent populations propagate at once either as a stack of
+    dense networks (n_runs, n_agents, n_agents) with preferences
+    (n_runs, n_agents), or as a block-diagonal sparse network (see
+    erdos_renyi_network) on their flattened preferences.
+    """
+
+    def __init__(self, social_network, influence_strength: float = 0.1):
+        """
+        Args:
+            social_network: Row-normalised network W (ndarray, stack of
+                ndarrays, or sparse matrix)
+            influence_strength: λ, weight on the neighbour average
+        """
+        n_agents = social_network.shape[-1]
+        self.network = social_network
+        self.influence_strength = influence_strength
+        self.sparse = sp.issparse(social_network)
+
+        if self.sparse:
+            self.matrix = ((1 - influence_strength) * sp.identity(n_agents, format='csr') +
+                           influence_strength * social_network).tocsr()
+        else:
+            self.matrix = (1 - influence_strength) * np.eye(n_agents) + influence_strength * social_network
+        self._squares = [self.matrix]  # _squares[j] = M^(2^j)
+        self._limit_structure = None
+
+    def _square(self, j: int) -> np.ndarray:
+        while len(self._squares) <= j:
+            self._squares.append(self._squares[-1] @ self._squares[-1])
+        return self._squares[j]
+
+    def advance(self, preferences: np.ndarray, n_steps: int, tol: float = DEGROOT_LIMIT_TOL) -> np.ndarray:
+        """
+        Return M^n_steps @ preferences.
+
+        For a sparse network the result is within tol × max(|preferences - limit|,
+        |limit|) of the exact power (it is the limit itself once the iterate
+        gets that close).
+        """
+        if self.sparse:
+            limit = None
+            for step in range(n_steps):
+                if step % DEGROOT_LIMIT_CHECK_STEPS == DEGROOT_LIMIT_CHECK_STEPS - 1:
+                    if limit is None:
+                        limit = self.limit(preferences)
+                        # Relative to the initial distance, or to the limit's
+                        # magnitude when starting at (or within rounding of) it
+                        threshold = tol * max(np.max(np.abs(preferences - limit), initial=0.0),
+                                              np.max(np.abs(limit), initial=0.0),
+                                              np.finfo(float).tiny)
+                    if np.max(np.abs(preferences - limit), initial=0.0) <= threshold:
+                        return limit
+                preferences = self.matrix @ preferences
+            return preferences
+
+        j = 0
+        while n_steps:
+            if n_steps & 1:
+                preferences = self._apply(self._square(j), preferences)
+            n_steps >>= 1
+            j += 1
+        return preferences
+
+    def step_all(self, states: np.ndarray) -> np.ndarray:
+        """One step M @ p for each preference state along the leading axis, in one product"""
+        if self.sparse:
+            return (self.matrix @ states.reshape(len(states), -1).T).T.reshape(states.shape)
+        if np.ndim(self.matrix) == 2:
+            return states @ self.matrix.T
+        return np.moveaxis(self.matrix @ np.moveaxis(states, 0, -1), -1, 0)
+
+    @staticmethod
+    def _apply(matrix, preferences: np.ndarray) -> np.ndarray:
+        """matrix @ preferences, row by row for a stack of networks"""
+        if np.ndim(matrix) == 2:
+            return matrix @ preferences
+        return (matrix @ preferences[..., np.newaxis])[..., 0]
+
+    def powers(self, preferences: np.ndarray, steps, tol: float = DEGROOT_LIMIT_TOL) -> np.ndarray:
+        """
+        M^s @ preferences for every s in steps.
+
+        For dense networks every step is a column of one matmul: bit j of all
+        steps is applied with a single M^(2^j), so the whole set costs at most
+        log2(max(steps)) squarings and only one power is held at a time (the
+        squares are not cached). A run stops squaring once M^(2^(j+1)) is
+        within tol of M^(2^j): all higher powers are then the same limit
+        projector, which is applied once for the remaining bits. Sparse
+        networks advance through the sorted steps.
+
+        Returns:
+            Array of shape (len(steps),) + preferences.shape
+        """
+        steps = np.asarray(steps, dtype=np.int64)
+        if self.sparse:
+            results = np.empty((len(steps),) + np.shape(preferences))
+            t = 0
+            for index in np.argsort(steps, kind='stable'):
+                preferences = self.advance(preferences, int(steps[index]) - t)
+                t = int(steps[index])
+                results[index] = preferences
+            return results
+
+        shape = np.shape(preferences)
+        power = self.matrix if np.ndim(self.matrix) == 3 else self.matrix[np.newaxis]
+        # (run, agent, step) columns
+        columns = np.repeat(np.asarray(preferences, dtype=float).reshape(len(power), -1)[..., np.newaxis],
+                            len(steps), axis=-1)
+        active = np.arange(len(power))
+        remaining = steps.copy()
+
+        def apply(runs, matrices, selected):
+            if len(runs) == len(columns):
+                columns[..., selected] = matrices @ columns[..., selected]
+                return
+            block = columns[runs]
+            block[..., selected] = matrices @ block[..., selected]
+            columns[runs] = block
+
+        while len(active):
+            odd = (remaining & 1).astype(bool)
+            if np.any(odd):
+                apply(active, power, odd)
+            remaining >>= 1
+            pending = remaining > 0
+            if not np.any(pending):
+                break
+
+            squared = power @ power
+            scale = np.max(np.abs(power), axis=(1, 2))
+            change = squared - power
+            settled = np.max(np.abs(change, out=change), axis=(1, 2)) <= tol * scale
+            if np.any(settled):
+                apply(active[settled], squared[settled], pending)
+                active = active[~settled]
+                squared = squared[~settled]
+            power = squared
+
+        return np.moveaxis(columns, -1, 0).reshape((len(steps),) + shape)
+
+    @staticmethod
+    def stationary_distribution(network, tol: float = 1e-12, max_iter: int = 100000) -> np.ndarray:
+        """
+        Left eigenvector π of a row-stochastic, irreducible W (π ≥ 0, Σπ = 1).
+
+        π is also stationary for M, and every agent's preference converges to
+        π · p_0 on such a network.
+        """
+        n_agents = network.shape[0]
+
+        if n_agents < SPARSE_NETWORK_MIN_AGENTS:
+            # π (W - I) = 0 with Σπ = 1, solved in the least-squares sense
+            network = network.toarray() if sp.issparse(network) else network
+            system = np.vstack((network.T - np.eye(n_agents), np.ones((1, n_agents))))
+            rhs = np.concatenate((np.zeros(n_agents), [1.0]))
+            pi = np.clip(np.linalg.lstsq(system, rhs, rcond=None)[0], 0.0, None)
+            return pi / np.sum(pi)
+
+        # Power iteration on the lazy chain (I + W) / 2, which has the same π
+        network_t = sp.csr_matrix(network).T.tocsr()
+        pi = np.full(n_agents, 1.0 / n_agents)
+        for _ in range(max_iter):
+            pi_next = 0.5 * (pi + network_t @ pi)
+            if np.sum(np.abs(pi_next - pi)) < tol:
+                return pi_next
+            pi = pi_next
+        return pi
+
+    def _limit_parts(self, tol: float, max_iter: int):
+        """
+        Network-only part of the limit, computed once per propagator:
+        the closed classes with their stationary distributions, and the
+        transient agents with a factorised (I - W_TT)
+        """
+        if self._limit_structure is not None:
+            return self._limit_structure
+
+        if self.sparse or np.ndim(self.network) == 2:
+            network = sp.csr_matrix(self.network)
+        else:
+            # A stack of networks is the block-diagonal network of its runs
+            run, row, col = np.nonzero(self.network)
+            n_agents = self.network.shape[-1]
+            n_total = len(self.network) * n_agents
+            network = sp.csr_matrix((self.network[run, row, col],
+                                     (run * n_agents + row, run * n_agents + col)),
+                                    shape=(n_total, n_total))
+        n_components, labels = connected_components(network, directed=True, connection='strong')
+
+        edges = network.tocoo()
+        rows, cols, weights = edges.row, edges.col, edges.data
+        leaving = labels[rows] != labels[cols]
+        is_open = np.zeros(n_components, dtype=bool)
+        is_open[labels[rows[leaving]]] = True
+        closed = ~is_open[labels]
+
+        # Closed singletons have no neighbours (no self-loops) and stay at 0
+        sizes = np.bincount(labels, minlength=n_components)
+        order = np.argsort(labels, kind='stable')
+        starts = np.concatenate(([0], np.cumsum(sizes)))
+        closed_classes = np.flatnonzero(~is_open & (sizes > 1))
+        classes = []
+
+        # Small classes of equal size (e.g. one per run of a batch) get their
+        # π from one stacked solve of π (W - I) = 0 with the last equation
+        # replaced by Σπ = 1, which is non-singular for an irreducible class
+        small = closed_classes[sizes[closed_classes] < SPARSE_NETWORK_MIN_AGENTS]
+        local = np.empty(len(labels), dtype=np.int64)
+        local[order] = np.arange(len(labels)) - starts[labels[order]]
+        for size in np.unique(sizes[small]):
+            same_size = small[sizes[small] == size]
+            members = starts[same_size][:, np.newaxis] + np.arange(size)
+            members = order[members]
+
+            # A closed class has no leaving edges, so its rows hold its whole block
+            slot = np.full(n_components, -1)
+            slot[same_size] = np.arange(len(same_size))
+            edges = slot[labels[rows]] >= 0
+            systems = np.zeros((len(same_size), size, size))
+            systems[slot[labels[rows[edges]]], local[cols[edges]], local[rows[edges]]] = weights[edges]
+            systems -= np.eye(size)
+            systems[:, -1, :] = 1.0
+            rhs = np.zeros((len(same_size), size, 1))
+            rhs[:, -1] = 1.0
+            pis = np.clip(np.linalg.solve(systems, rhs)[..., 0], 0.0, None)
+            pis /= np.sum(pis, axis=1, keepdims=True)
+            classes.extend(zip(members, pis))
+
+        for component in np.setdiff1d(closed_classes, small):
+            members = order[starts[component]:starts[component + 1]]
+            pi = self.stationary_distribution(network[members][:, members], tol, max_iter)
+            classes.append((members, pi))
+
+        transient = np.flatnonzero(~closed)
+        absorbing = np.flatnonzero(closed)
+        solver = coupling = None
+        if len(transient):
+            network_t = network[transient]
+            coupling = network_t[:, absorbing]
+            solver = splu(sp.identity(len(transient), format='csc') - network_t[:, transient].tocsc())
+
+        self._limit_structure = (classes, transient, absorbing, coupling, solver)
+        return self._limit_structure
+
+    def limit(self, preferences: np.ndarray, tol: float = 1e-12,
+              max_iter: int = 100000) -> np.ndarray:
+        """
+        Return lim_{t→∞} M^t @ preferences without iterating over t.
+
+        The strongly connected components of W with no outgoing edges are
+        closed: each settles on its own consensus π_C · p_C, except agents
+        with no neighbours, whose preferences decay to 0. Every other agent
+        ends at the solution x_T of (I - W_TT) x_T = W_TC x_C, the average of
+        the closed-class limits it eventually listens to. On a strongly
+        connected network this is a single consensus π · p_0.
+
+        The decomposition depends only on the network and is reused across calls.
+        """
+        classes, transient, absorbing, coupling, solver = self._limit_parts(tol, max_iter)
+        shape = np.shape(preferences)
+        preferences = np.ravel(preferences)
+
+        limit = np.zeros(len(preferences))
+        for members, pi in classes:
+            limit[members] = pi @ preferences[members]
+
+        if len(transient):
+            rhs = coupling @ limit[absorbing]
+            # Typical for sparse ER graphs: only agents without neighbours are
+            # closed, so everything drains to 0 and the solve can be skipped
+            if np.any(rhs):
+                limit[transient] = solver.solve(rhs)
+
+        return limit.reshape(shape)
+
+
+def run_social_mode_long_horizon(mechanism: ConsentMechanism, n_agents: int,
+                                 checkpoints, influence_strength: float = 0.1,
+                                 connection_prob: float = 0.1,
+                                 avg_degree: float = None,
+                                 sparse: bool = None,
+                                 include_limit: bool = False,
+                                 rng: np.random.Generator = None) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Social mode evaluated only at the requested timesteps.
+
+    Society and network are drawn as in run_social_mode. Metrics at
+    checkpoint t are those run_social_mode would record at timestep t (decision
+    from p_t, preferences p_{t+1}), with one consent allocation per checkpoint.
+    For deterministic mechanisms they therefore match the step-by-step values.
+    Stateful mechanisms learn from every period and are stepped through all
+    of them, at O(t) cost.
+
+    Args:
+        mechanism: Consent allocation mechanism
+        n_agents: Population size
+        checkpoints: Timesteps to evaluate (0-based, any order, e.g. up to 10⁶)
+        influence_strength, connection_prob, avg_degree, sparse: As in run_social_mode
+        include_limit: Append the t → ∞ consensus limit as a final entry
+        rng: Random stream (global state if None)
+
+    Returns:
+        alpha, friction: Arrays with one entry per checkpoint (plus the limit)
+    """
+    rng = resolve_rng(rng)
+    mechanism.reset()
+
+    stakes = generate_heterogeneous_stakes(n_agents, distribution_type='mixed', rng=rng)
+    wealth = rng.pareto(a=1.16, size=n_agents) + 0.5
+    rng.shuffle(wealth)
+    preferences = rng.normal(0, 1, n_agents)
+
+    social_network = build_social_network(n_agents, connection_prob, avg_degree, sparse, rng=rng)
+    propagator = DeGrootPropagator(social_network, influence_strength)
+
+    checkpoints = np.asarray(checkpoints, dtype=np.int64)
+    n_points = len(checkpoints) + int(include_limit)
+    alpha = np.zeros(n_points)
+    friction = np.zeros(n_points)
+
+    if mechanism.stateful:
+        # Every period's outcome feeds the mechanism, so none can be skipped
+        positions = {}
+        for index, t in enumerate(checkpoints):
+            positions.setdefault(int(t), []).append(index)
+
+        for t in range(int(checkpoints.max()) + 1 if len(checkpoints) else 0):
+            consent = mechanism.allocate_consent(stakes, wealth, rng=rng)
+            decision = np.sum(consent * preferences)
+            preferences = propagator.advance(preferences, 1)
+            metrics = compute_metrics(decision, preferences, stakes, consent)
+            mechanism.observe(decision, preferences, stakes)
+            for index in positions.get(t, ()):
+                alpha[index] = metrics.alpha
+                friction[index] = metrics.friction
+    else:
+        # Visit checkpoints in increasing order, advancing from the previous one
+        t = 0
+        for index in np.argsort(checkpoints, kind='stable'):
+            preferences = propagator.advance(preferences, int(checkpoints[index]) - t)
+            t = int(checkpoints[index])
+
+            consent = mechanism.allocate_consent(stakes, wealth, rng=rng)
+            decision = np.sum(consent * preferences)
+            metrics = compute_metrics(decision, propagator.advance(preferences, 1), stakes, consent)
+            alpha[index] = metrics.alpha
+            friction[index] = metrics.friction
+
+    if include_limit:
+        preferences = propagator.limit(preferences)
+        consent = mechanism.allocate_consent(stakes, wealth, rng=rng)
+        metrics = compute_metrics(np.sum(consent * preferences), preferences, stakes, consent)
+        alpha[-1] = metrics.alpha
+        friction[-1] = metrics.friction
+
+    return alpha, friction
+
+
+def run_social_mode_long_horizon_batch(mechanism: ConsentMechanism, n_runs: int, n_agents: int,
+                                       checkpoints, influence_strength: float = 0.1,
+                                       connection_prob: float = 0.1,
+                                       avg_degree: float = None,
+                                       sparse: bool = None,
+                                       include_limit: bool = False,
+                                       rng: np.random.Generator = None) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Batched run_social_mode_long_horizon.
+
+    Networks are drawn as in run_social_mode_batch. Below
+    SPARSE_NETWORK_MIN_AGENTS agents they are propagated as a stack of dense
+    matrices, with every run and every checkpoint a column of one matmul
+    per squaring (DeGrootPropagator.powers); above it, as one block-diagonal
+    sparse matrix advanced by matvec until every run has reached its limit.
+
+    Returns:
+        alpha, friction: Arrays of shape (n_runs, n_checkpoints [+ 1 for the limit])
+    """
+    rng = resolve_rng(rng)
+    mechanism.reset()
+
+    stakes = generate_heterogeneous_stakes_batch(n_runs, n_agents, distribution_type='mixed', rng=rng)
+    wealth = rng.pareto(a=1.16, size=(n_runs, n_agents)) + 0.5
+    preferences = rng.normal(0, 1, (n_runs, n_agents))
+
+    if avg_degree is not None:
+        connection_prob = avg_degree / max(n_agents - 1, 1)
+    if sparse is None:
+        sparse = n_agents >= SPARSE_NETWORK_MIN_AGENTS
+    social_network = erdos_renyi_network(n_agents, connection_prob, rng=rng, n_blocks=n_runs)
+    if sparse:
+        preferences = preferences.ravel()
+    else:
+        # Unpack the diagonal blocks into one dense network per run
+        coo = social_network.tocoo()
+        blocks = np.zeros((n_runs, n_agents, n_agents))
+        blocks[coo.row // n_agents, coo.row % n_agents, coo.col % n_agents] = coo.data
+        social_network = blocks
+    propagator = DeGrootPropagator(social_network, influence_strength)
+
+    checkpoints = np.asarray(checkpoints, dtype=np.int64)
+    n_points = len(checkpoints) + int(include_limit)
+    alpha = np.zeros((n_runs, n_points))
+    friction = np.zeros((n_runs, n_points))
+
+    def evaluate(decision_preferences, outcome_preferences):
+        consent = mechanism.allocate_consent_batch(stakes, wealth, rng=rng)
+        decisions = np.sum(consent * decision_preferences.reshape(n_runs, n_agents), axis=1)
+        outcome_preferences = outcome_preferences.reshape(n_runs, n_agents)
+        return decisions, outcome_preferences, compute_metrics_batch(
+            decisions, outcome_preferences, stakes, consent)
+
+    if mechanism.stateful:
+        # Every period's outcome feeds the mechanism, so none can be skipped
+        positions = {}
+        for index, t in enumerate(checkpoints):
+            positions.setdefault(int(t), []).append(index)
+
+        for t in range(int(checkpoints.max()) + 1 if len(checkpoints) else 0):
+            next_preferences = propagator.advance(preferences, 1)
+            decisions, outcome, metrics = evaluate(preferences, next_preferences)
+            mechanism.observe(decisions, outcome, stakes)
+            preferences = next_preferences
+            for index in positions.get(t, ()):
+                alpha[:, index] = metrics.alpha
+                friction[:, index] = metrics.friction
+    else:
+        # Preferences at every checkpoint t (decision), then one step on (outcome)
+        at = propagator.powers(preferences, checkpoints)
+        after = propagator.step_all(at)
+        for index in np.argsort(checkpoints, kind='stable'):
+            _, _, metrics = evaluate(at[index], after[index])
+            alpha[:, index] = metrics.alpha
+            friction[:, index] = metrics.friction
+
+    if include_limit:
+        preferences = propagator.limit(preferences)
+        _, _, metrics = evaluate(preferences, preferences)
+        alpha[:, -1] = metrics.alpha
+        friction[:, -1] = metrics.friction
+
+    return alpha, friction
+
+
+def log_checkpoints(horizon: int, per_decade: int = 3) -> np.ndarray:
+    """Timesteps 0 and roughly log-spaced points up to horizon - 1"""
+    if horizon <= 1:
+        return np.zeros(1, dtype=np.int64)
+    n_points = int(np.ceil(np.log10(horizon) * per_decade)) + 1
+    points = np.unique(np.round(np.logspace(0, np.log10(horizon), n_points)).astype(np.int64) - 1)
+    return np.union1d([0], points[points < horizon])
+
+
+def run_long_horizon_social(mechanisms: List[ConsentMechanism], horizon: int,
+                            n_runs: int = N_RUNS, n_agents: int = N_AGENTS,
+                            seed: int = SEED, include_limit: bool = True) -> Dict:
+    """
+    Mean social-mode α and friction at log-spaced checkpoints up to horizon.
+
+    Each mechanism's runs are simulated as one batch (see
+    run_social_mode_long_horizon_batch) drawn from its block_rng stream.
+
+    Returns:
+        Dict with 'checkpoints' and, per mechanism name, arrays of mean alpha
+        and friction (one entry per checkpoint, plus the limit if requested)
+    """
+    checkpoints = log_checkpoints(horizon)
+    summary = {'checkpoints': checkpoints}
+
+    for mechanism in mechanisms:
+        rng = block_rng(seed, mechanism.name, 'social', 0, n_runs)
+        alpha, friction = run_social_mode_long_horizon_batch(
+            mechanism, n_runs, n_agents, checkpoints, include_limit=include_limit, rng=rng
+        )
+        summary[mechanism.name] = {'alpha': alpha.mean(axis=0), 'friction': friction.mean(axis=0)}
+
+    return summary
+
+
+def print_long_horizon_table(summary: Dict, include_limit: bool = True):
+    """Print mean α per mechanism at each long-horizon checkpoint"""
+    labels = [f"t={t}" for t in summary['checkpoints']] + (['t=∞'] if include_limit else [])
+    names = [name for name in summary if name != 'checkpoints']
+
+    print("\n" + "="*90)
+    print("LONG-HORIZON SOCIAL DYNAMICS - MEAN α")
+    print("="*90)
+    print(f"{'Checkpoint':<12}" + "".join(f"{name:>19}" for name in names))
+    print("-"*90)
+    for i, label in enumerate(labels):
+        print(f"{label:<12}" + "".join(f"{summary[name]['alpha'][i]:>19.4f}" for name in names))
+    print("="*90)
+
+
+# ==============================================================================
+# PARALLEL GRID EXECUTION
+# ==============================================================================
+
+def build_mechanisms(adaptive: bool = False) -> List[ConsentMechanism]:
+    """The five mechanisms compared by the simulation, in grid order, plus AdaptiveConsent if requested"""
+    mechanisms = [
+        EqualVoice(),
+        StakesWeighted(),
+        Plutocracy(),
+        RandomAssignment(),
+        ExpertRule()
+    ]
+    if adaptive:
+        mechanisms.append(AdaptiveConsent())
+    return mechanisms
+
+
+def _run_chunk(task: Tuple) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Simulate one chunk of runs for one (mechanism, mode) cell.
+
+    Runs draw from streams keyed by the master seed, cell and run index, so
+    output does not depend on which process runs the chunk or what ran
+    before it.
+
+    Returns:
+        alpha_trajectory, friction_trajectory, final_legitimacy and
+        population_trajectory (None outside exit mode) for the chunk, or its
+        TrajectoryAggregate in aggregate mode
+    """
+    mechanism, dynamic_mode, first_run, n_runs, n_agents, n_timesteps, engine, seed, aggregate = task
+
+    if aggregate is not None:
+        # aggregate is the reservoir size; only the folded statistics travel back
+        return run_mechanism_aggregate(mechanism, dynamic_mode=dynamic_mode, n_runs=n_runs,
+                                       n_agents=n_agents, n_timesteps=n_timesteps, engine=engine,
+                                       seed=seed, first_run=first_run,
+                                       reservoir_size=aggregate).stats
+
+    results = run_mechanism_simulation(mechanism, dynamic_mode=dynamic_mode, n_runs=n_runs,
+                                       n_agents=n_agents, n_timesteps=n_timesteps, engine=engine,
+                                       seed=seed, first_run=first_run)
+    return (results.alpha_trajectory, results.friction_trajectory, results.final_legitimacy,
+            results.population_trajectory)
+
+
+def run_simulation_grid(mechanisms: List[ConsentMechanism],
+                        modes: List[str],
+                        n_runs: int = N_RUNS,
+                        n_agents: int = N_AGENTS,
+                        n_timesteps: int = N_TIMESTEPS,
+                        engine: str = 'scalar',
+                        seed: int = SEED,
+                        workers: int = 1,
+                        chunk_runs: int = None,
+                        aggregate: bool = False,
+                        reservoir_size: int = 0):
+    """
+    Run every (mode, mechanism) cell, optionally across a process pool.
+
+    Each cell is split into chunks of chunk_runs runs. Under the scalar
+    engine every run has its own stream, so results for a given seed are
+    bitwise identical for any number of workers and any chunk size; the
+    batched engine draws one stream per chunk, so only the chunk size matters.
+
+    Args:
+        mechanisms: Mechanisms to simulate (their names key the streams)
+        modes: Dynamic modes to simulate, a subset of DYNAMIC_MODES
+        n_runs: Monte Carlo iterations per cell
+        n_agents: Population size
+        n_timesteps: Time periods for convergence
+        engine: 'scalar' or 'batched'
+        seed: Master seed; None draws every cell from the global stream in
+            grid order (the original script's output), which needs
+            workers=1 and whole-cell chunks
+        workers: Number of worker processes (1 runs in-process)
+        chunk_runs: Runs per job; defaults to the whole cell
+        aggregate: Keep only streaming per-timestep statistics (see
+            run_mechanism_aggregate); chunks are merged per cell
+        reservoir_size: Whole runs per cell to keep in aggregate mode
+
+    Yields:
+        (mode, mechanism, SimulationResults), or AggregateResults in
+        aggregate mode, in mode-major grid order
+    """
+    chunk_runs = chunk_runs or n_runs
+    chunks = [(start, min(chunk_runs, n_runs - start)) for start in range(0, n_runs, chunk_runs)]
+
+    cells = [(mode, mechanism) for mode in modes for mechanism in mechanisms]
+    tasks = [(mechanism, mode, first_run, chunk_size, n_agents, n_timesteps, engine, seed,
+              reservoir_size if aggregate else None)
+             for mode, mechanism in cells
+             for first_run, chunk_size in chunks]
+
+    executor = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+    try:
+        # map() returns chunks in submission order, so cells reassemble in grid order
+        chunk_results = executor.map(_run_chunk, tasks) if executor else map(_run_chunk, tasks)
+
+        for mode, mechanism in cells:
+            cell_chunks = [next(chunk_results) for _ in chunks]
+            if aggregate:
+                stats = cell_chunks[0]
+                for chunk in cell_chunks[1:]:
+                    stats.merge(chunk)
+                yield mode, mechanism, AggregateResults(mechanism_name=mechanism.name,
+                                                        dynamic_mode=mode, stats=stats)
+                continue
+
+            alpha_traj_all = np.concatenate([chunk[0] for chunk in cell_chunks])
+            friction_traj_all = np.concatenate([chunk[1] for chunk in cell_chunks])
+            final_legitimacy = np.concatenate([chunk[2] for chunk in cell_chunks])
+            population_traj_all = (np.concatenate([chunk[3] for chunk in cell_chunks])
+                                   if cell_chunks[0][3] is not None else None)
+
+            yield mode, mechanism, SimulationResults(
+                mechanism_name=mechanism.name,
+                dynamic_mode=mode,
+                alpha_trajectory=alpha_traj_all,
+                friction_trajectory=friction_traj_all,
+                final_legitimacy=final_legitimacy,
+                mean_alpha=np.mean(alpha_traj_all[:, -1]),
+                mean_friction=np.mean(friction_traj_all[:, -1]),
+                mean_legitimacy=np.mean(final_legitimacy),
+                std_legitimacy=np.std(final_legitimacy),
+                population_trajectory=population_traj_all
+            )
+    finally:
+        if executor:
+            executor.shutdown(cancel_futures=True)
+
+
+def regenerate_run(mechanism: ConsentMechanism, run: int,
+                   dynamic_mode: str = 'static',
+                   n_agents: int = N_AGENTS,
+                   n_timesteps: int = N_TIMESTEPS,
+                   seed: int = SEED) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Reproduce a single run of a scalar-engine simulation without replaying
+    the runs before it, e.g. to debug an outlier trajectory.
+
+    Returns:
+        alpha_trajectory, friction_trajectory for that run
+    """
+    results = run_mechanism_simulation(mechanism, dynamic_mode=dynamic_mode, n_runs=1,
+                                       n_agents=n_agents, n_timesteps=n_timesteps,
+                                       seed=seed, first_run=run)
+    return results.alpha_trajectory[0], results.friction_trajectory[0]
+
+
+def _csv_field_strings(values: np.ndarray) -> List[str]:
+    """
+    Format array elements exactly as csv.writer does (str() of each element).
+
+    str() of a float64 is its shortest round-trip repr, which is also what
+    str() gives for the Python float from tolist(), so float64 and integer
+    arrays convert in one C-level pass; other dtypes go element by element.
+    """
+    values = np.asarray(values).ravel()
+    if values.dtype == np.float64 or values.dtype.kind in 'iub':
+        return list(map(str, values.tolist()))
+    return list(map(str, values))
+
+
+def save_results_csv(results: SimulationResults, output_path: str, compress: bool = None):
+    """
+    Save trajectory results to CSV (with a population column in exit mode).
+
+    Rows are built column-wise from the trajectory arrays and written
+    CSV_CHUNK_ROWS at a time; the bytes are the same as writing each row
+    with csv.writer (str() fields, \\r\\n line endings).
+
+    Args:
+        results: Simulation results for one mechanism and mode
+        output_path: CSV path
+        compress: gzip the file (default: when output_path ends in .gz)
+    """
+    population = results.population_trajectory
+    n_runs, n_timesteps = results.alpha_trajectory.shape
+    if compress is None:
+        compress = output_path.endswith('.gz')
+
+    # Labels and header go through csv.writer once so any quoting matches
+    labels = io.StringIO()
+    writer = csv.writer(labels)
+    header = ['mechanism', 'dynamic_mode', 'run', 'timestep', 'alpha', 'friction']
+    writer.writerow(header + (['population'] if population is not None else []))
+    header_line = labels.getvalue()
+    labels.seek(0)
+    labels.truncate()
+    writer.writerow([results.mechanism_name, results.dynamic_mode, ''])
+    prefix = labels.getvalue()[:-len(writer.dialect.lineterminator)]
+
+    # gzip with a fixed mtime so identical results give identical files
+    f = (gzip.GzipFile(output_path, 'wb', compresslevel=6, mtime=0) if compress
+         else open(output_path, 'wb'))
+    with f:
+        f.write(header_line.encode('utf-8'))
+
+        timestep_strings = _csv_field_strings(np.arange(n_timesteps))
+        chunk_runs = max(1, CSV_CHUNK_ROWS // max(n_timesteps, 1))
+        for start in range(0, n_runs, chunk_runs):
+            stop = min(start + chunk_runs, n_runs)
+            run_strings = _csv_field_strings(np.arange(start, stop))
+            columns = [
+                [prefix + run for run in run_strings for _ in range(n_timesteps)],
+                timestep_strings * (stop - start),
+                _csv_field_strings(results.alpha_trajectory[start:stop]),
+                _csv_field_strings(results.friction_trajectory[start:stop])
+            ]
+            if population is not None:
+                columns.append(_csv_field_strings(population[start:stop]))
+
+            rows = map(','.join, zip(*columns))
+            f.write(('\r\n'.join(rows) + '\r\n').encode('utf-8'))
+
+    print(f"✓ Saved results to {output_path}")
+
+
+def save_results_npz(results: SimulationResults, output_path: str, compress: bool = False):
+    """
+    Save trajectory results as a columnar .npz archive (see results_store).
+
+    Trajectories are stored as (run, timestep) arrays and the mechanism and
+    mode as metadata, so the file is ~8 bytes per value and loads without parsing.
+
+    Args:
+        results: Simulation results for one mechanism and mode
+        output_path: Archive path (.npz)
+        compress: Deflate the arrays (smaller, but not memory-mapped on load)
+    """
+    arrays = {
+        'alpha': results.alpha_trajectory,
+        'friction': results.friction_trajectory,
+        'final_legitimacy': results.final_legitimacy
+    }
+    if results.population_trajectory is not None:
+        arrays['population'] = results.population_trajectory
+
+    save_columns(output_path, arrays, metadata={
+        'mechanism': results.mechanism_name,
+        'dynamic_mode': results.dynamic_mode,
+        'mean_alpha': results.mean_alpha,
+        'mean_friction': results.mean_friction,
+        'mean_legitimacy': results.mean_legitimacy,
+        'std_legitimacy': results.std_legitimacy
+    }, compress=compress)
 
     print(f"✓ Saved results to {output_path}")
 
 
+def load_results_npz(path: str, mmap: bool = True) -> SimulationResults:
+    """
+    Load results written by save_results_npz.
+
+    Args:
+        path: Archive path
+        mmap: Memory-map the trajectories (read-only) instead of reading them
+
+    Returns:
+        results: SimulationResults
+    """
+    arrays, metadata = load_columns(path, mmap=mmap)
+    return SimulationResults(
+        mechanism_name=metadata['mechanism'],
+        dynamic_mode=metadata['dynamic_mode'],
+        alpha_trajectory=arrays['alpha'],
+        friction_trajectory=arrays['friction'],
+        final_legitimacy=arrays['final_legitimacy'],
+        mean_alpha=metadata['mean_alpha'],
+        mean_friction=metadata['mean_friction'],
+        mean_legitimacy=metadata['mean_legitimacy'],
+        std_legitimacy=metadata['std_legitimacy'],
+        population_trajectory=arrays.get('population')
+    )
+
+
 def plot_dynamic_comparison(results_by_mode: Dict[str, Dict[str, SimulationResults]],
                             output_path: str = 'dynamics_comparison.pdf'):
     """
@@ -569,13 +1978,17 @@ def plot_dynamic_comparison(results_by_mode: Dict[str, Dict[str, SimulationResul
     Args:
         results_by_mode: {mode: {mechanism_name: SimulationResults}}
     """
-    mechanisms = ['Equal Voice', 'Stakes-Weighted DoCS', 'Plutocracy', 'Random Assignment', 'Expert Rule']
+    mechanisms = ['Equal Voice', 'Stakes-Weighted DoCS', 'Plutocracy', 'Random Assignment', 'Expert Rule',
+                  'Adaptive Consent']
     modes = list(results_by_mode.keys())
+    mechanisms = [name for name in mechanisms
+                  if any(name in results_by_mode[mode] for mode in modes)]
 
     fig, axes = plt.subplots(2, 3, figsize=(15, 10))
     axes = axes.flatten()
 
-    colors = {'static': '#888888', 'learning': '#FF6B35', 'social': '#004E89', 'stakes': '#06A77D'}
+    colors = {'static': '#888888', 'learning': '#FF6B35', 'social': '#004E89', 'stakes': '#06A77D',
+              'exit': '#A4243B'}
 
     for i, mech_name in enumerate(mechanisms):
         ax = axes[i]
@@ -583,7 +1996,10 @@ def plot_dynamic_comparison(results_by_mode: Dict[str, Dict[str, SimulationResul
         for mode in modes:
             if mech_name in results_by_mode[mode]:
                 results = results_by_mode[mode][mech_name]
-                mean_alpha = np.mean(results.alpha_trajectory, axis=0)
+                if isinstance(results, AggregateResults):
+                    mean_alpha = results.stats.mean('alpha')
+                else:
+                    mean_alpha = np.mean(results.alpha_trajectory, axis=0)
                 timesteps = np.arange(N_TIMESTEPS)
 
                 ax.plot(timesteps, mean_alpha, label=mode, color=colors.get(mode, 'gray'), linewidth=2)
@@ -595,8 +2011,9 @@ def plot_dynamic_comparison(results_by_mode: Dict[str, Dict[str, SimulationResul
         ax.grid(True, alpha=0.3)
         ax.set_ylim([0, 1])
 
-    # Remove extra subplot
-    fig.delaxes(axes[5])
+    # Remove extra subplots
+    for ax in axes[len(mechanisms):]:
+        fig.delaxes(ax)
 
     plt.tight_layout()
     plt.savefig(output_path, dpi=300, bbox_inches='tight')
@@ -604,10 +2021,16 @@ def plot_dynamic_comparison(results_by_mode: Dict[str, Dict[str, SimulationResul
     plt.close()
 
 
-def print_results_table(results_dict: Dict[str, SimulationResults]):
-    """Print summary statistics table"""
+def print_results_table(results_dict: Dict[str, SimulationResults], n_runs: int = N_RUNS):
+    """
+    Print summary statistics table
+
+    Args:
+        results_dict: Results (or AggregateResults) per cell
+        n_runs: Runs simulated per cell
+    """
     print("\n" + "="*90)
-    print(f"MONTE CARLO SIMULATION RESULTS ({N_RUNS} runs, {N_AGENTS} agents, {N_TIMESTEPS} timesteps)")
+    print(f"MONTE CARLO SIMULATION RESULTS ({n_runs} runs, {N_AGENTS} agents, {N_TIMESTEPS} timesteps)")
     print("="*90)
     print(f"{'Mechanism':<25} {'Mode':<10} {'Mean α':<12} {'Mean F':<12} {'Mean L':<12} {'Std L':<10}")
     print("-"*90)
@@ -628,12 +2051,49 @@ def main():
     """Run full Monte Carlo simulation suite"""
     parser = argparse.ArgumentParser(description='DoCS Monte Carlo Simulation with Dynamics')
     parser.add_argument('--dynamics', type=str, default='all',
-                       choices=['static', 'learning', 'social', 'stakes', 'all'],
-                       help='Dynamic mode to run (default: all)')
+                       choices=['static', 'learning', 'social', 'stakes', 'exit', 'all'],
+                       help='Dynamic mode to run (default: all = static, learning, social, '
+                            'stakes; exit only when selected)')
+    parser.add_argument('--engine', type=str, default='scalar',
+                       choices=['scalar', 'batched'],
+                       help='Simulation engine: one run at a time or all runs at once (default: scalar)')
+    parser.add_argument('--workers', type=int, default=1,
+                       help='Worker processes for the mechanism x mode grid (default: 1)')
+    parser.add_argument('--chunk-runs', type=int, default=None,
+                       help='Split each cell into jobs of this many runs (default: whole cell)')
+    parser.add_argument('--seed', type=int, default=None,
+                       help='Master seed for per-run random streams (default: the legacy global '
+                            f'stream seeded with 42, as in the original script; {SEED} for '
+                            '--target-ci and --long-horizon)')
+    parser.add_argument('--runs', type=int, default=N_RUNS,
+                       help=f'Monte Carlo runs per cell, or the first batch with --target-ci '
+                            f'(default: {N_RUNS})')
+    parser.add_argument('--aggregate', action='store_true',
+                       help='Keep only per-timestep streaming statistics instead of every trajectory')
+    parser.add_argument('--reservoir', type=int, default=0,
+                       help='With --aggregate, keep a uniform sample of this many whole runs per cell (default: 0)')
+    parser.add_argument('--target-ci', type=float, default=None,
+                       help='Run each cell until the 95%% CI half-width is below this (sequential stopping)')
+    parser.add_argument('--max-runs', type=int, default=10 * N_RUNS,
+                       help=f'Run cap per cell with --target-ci (default: {10 * N_RUNS})')
+    parser.add_argument('--stop-on', type=str, default='mean', choices=['mean', 'paired'],
+                       help='--target-ci applies to mean final α and L, or to the paired '
+                            'difference vs Equal Voice (default: mean)')
+    parser.add_argument('--adaptive', action='store_true',
+                       help='Also simulate the AdaptiveConsent mechanism')
+    parser.add_argument('--long-horizon', type=int, default=None, metavar='T',
+                       help='Only run social mode to horizon T at log-spaced checkpoints (e.g. 1000000)')
+    parser.add_argument('--format', type=str, default='csv', choices=['csv', 'csv.gz', 'npz', 'npz-compressed'],
+                       help='Per-cell results file: CSV rows (optionally gzipped), or columnar '
+                            '.npz (memory-mappable unless compressed)')
     parser.add_argument('--output-dir', type=str,
                        default='/home/kawaiikali/Resurrexi/projects/need-work/consent-theory',
                        help='Output directory for results')
     args = parser.parse_args()
+    legacy_grid = args.seed is None and args.target_ci is None and args.long_horizon is None
+    if legacy_grid and (args.workers > 1 or args.chunk_runs is not None):
+        # The global stream is shared state: chunks and workers need per-run streams
+        parser.error('--workers and --chunk-runs require --seed')
 
     print("\n" + "="*90)
     print("DOCTRINE OF CONSENSUAL SOVEREIGNTY - MONTE CARLO VALIDATION WITH DYNAMICS")
@@ -641,26 +2101,44 @@ def main():
 
     print(f"Simulation parameters:")
     print(f"  - Agents per society: {N_AGENTS}")
-    print(f"  - Monte Carlo runs: {N_RUNS}")
+    print(f"  - Monte Carlo runs: {args.runs}")
     print(f"  - Time periods: {N_TIMESTEPS}")
-    print(f"  - Random seed: 42 (reproducible)")
-    print(f"  - Dynamic modes: {args.dynamics}\n")
+    if args.seed is None:
+        print(f"  - Random seed: 42 (reproducible, global stream)")
+    else:
+        print(f"  - Random seed: {args.seed} (reproducible, per-run streams)")
+    print(f"  - Dynamic modes: {args.dynamics}")
+    print(f"  - Engine: {args.engine}")
+    print(f"  - Workers: {args.workers}")
+    print(f"  - Output: {'streaming aggregates' if args.aggregate else 'full trajectories'}\n")
 
     # Initialize mechanisms
-    mechanisms = [
-        EqualVoice(),
-        StakesWeighted(),
-        Plutocracy(),
-        RandomAssignment(),
-        ExpertRule()
-    ]
+    mechanisms = build_mechanisms(adaptive=args.adaptive)
+
+    if args.long_horizon is not None:
+        summary = run_long_horizon_social(mechanisms, args.long_horizon, n_runs=args.runs,
+                                          seed=SEED if args.seed is None else args.seed)
+        print_long_horizon_table(summary)
+        return summary, {}
 
     # Determine which modes to run
     if args.dynamics == 'all':
-        modes = ['static', 'learning', 'social', 'stakes']
+        modes = DEFAULT_DYNAMIC_MODES
     else:
         modes = [args.dynamics]
 
+    if args.target_ci is not None:
+        precision = {}
+        for mode in modes:
+            cell_results = run_until_precise(mechanisms, mode, target_ci=args.target_ci,
+                                             max_runs=args.max_runs, criterion=args.stop_on,
+                                             engine=args.engine,
+                                             seed=SEED if args.seed is None else args.seed,
+                                             initial_runs=args.runs, workers=args.workers)
+            precision.update({f"{name}_{mode}": result for name, result in cell_results.items()})
+        print_precision_table(precision, args.target_ci)
+        return precision, {}
+
     # Run simulations
     results_dict = {}
     results_by_mode = {mode: {} for mode in modes}
@@ -668,25 +2146,40 @@ def main():
     total_sims = len(mechanisms) * len(modes)
     sim_count = 0
 
-    for mode in modes:
-        print(f"\n=== Running {mode.upper()} mode ===")
-        for mechanism in mechanisms:
-            sim_count += 1
-            print(f"[{sim_count}/{total_sims}] {mechanism.name} ({mode})...", end=' ', flush=True)
-
-            results = run_mechanism_simulation(mechanism, dynamic_mode=mode)
-            key = f"{mechanism.name}_{mode}"
-            results_dict[key] = results
-            results_by_mode[mode][mechanism.name] = results
-
+    grid = run_simulation_grid(mechanisms, modes, n_runs=args.runs, engine=args.engine,
+                               seed=args.seed, workers=args.workers, chunk_runs=args.chunk_runs,
+                               aggregate=args.aggregate, reservoir_size=args.reservoir)
+
+    for mode, mechanism, results in grid:
+        if mechanism is mechanisms[0]:
+            print(f"\n=== Running {mode.upper()} mode ===")
+        sim_count += 1
+        print(f"[{sim_count}/{total_sims}] {mechanism.name} ({mode})...", end=' ', flush=True)
+
+        key = f"{mechanism.name}_{mode}"
+        results_dict[key] = results
+        results_by_mode[mode][mechanism.name] = results
+
+        if mode == 'exit':
+            final_population = (results.stats.mean('population')[-1] if args.aggregate
+                                else np.mean(results.population_trajectory[:, -1]))
+            print(f"✓ α={results.mean_alpha:.4f}, L={results.mean_legitimacy:.4f}, "
+                  f"N={final_population:.1f}")
+        else:
             print(f"✓ α={results.mean_alpha:.4f}, L={results.mean_legitimacy:.4f}")
 
-            # Save individual CSV
-            csv_path = f"{args.output_dir}/dynamics_results_{mode}_{mechanism.name.lower().replace(' ', '_').replace('-', '')}.csv"
-            save_results_csv(results, csv_path)
+        # Save individual results file
+        file_key = f"{mode}_{mechanism.name.lower().replace(' ', '_').replace('-', '')}"
+        if args.aggregate:
+            save_aggregate_csv(results, f"{args.output_dir}/dynamics_summary_{file_key}.csv")
+        elif args.format in ('csv', 'csv.gz'):
+            save_results_csv(results, f"{args.output_dir}/dynamics_results_{file_key}.{args.format}")
+        else:
+            save_results_npz(results, f"{args.output_dir}/dynamics_results_{file_key}.npz",
+                             compress=args.format == 'npz-compressed')
 
     # Print consolidated results
-    print_results_table(results_dict)
+    print_results_table(results_dict, n_runs=args.runs)
 
     # Generate comparison figures
     if len(modes) > 1:
@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""
+On-Disk Result Cache for DoCS Simulation Cells
+
+Sweeps evaluate the same (mechanism, parameters) cells over and over. A cell
+that was run with an explicit seed is fully determined by its description,
+so its results can be stored once and reused:
+
+1. Key: sha256 of the canonical JSON of the cell description (mechanism class
+   and constructor parameters, dynamic mode and its parameters, n_agents,
+   n_timesteps, n_runs, seed, ...) plus ENGINE_VERSION and the numpy version
+2. Value: one .npz file per cell holding the result arrays
+3. Eviction: least recently used files first once the directory exceeds
+   max_bytes (hits refresh a file's modification time)
+4. Corruption: an entry that cannot be read back (truncated, not a zip, or
+   missing arrays) counts as a miss and its file is deleted
+
+Cells drawn from the global random state (seed=None) are not reproducible
+and are never cached.
+
+Author: Farzulla (2025)
+"""
+
+import hashlib
+import inspect
+import json
+import os
+import tempfile
+import zipfile
+import numpy as np
+from dataclasses import fields
+from typing import Callable, Dict, Optional, Union
+
+from monte_carlo_simulation import ConsentMechanism, SimulationResults
+
+# Bump whenever a change to the engines alters results for the same inputs;
+# entries written under another version are never read again
+ENGINE_VERSION = 2
+
+DEFAULT_CACHE_BYTES = 512 * 2**20
+
+
+def mechanism_spec(mechanism: ConsentMechanism) -> Dict:
+    """
+    Class and constructor parameters of a mechanism (not its run-time state).
+
+    Args:
+        mechanism: Consent mechanism
+
+    Returns:
+        spec: {'class': ..., 'name': ..., <parameter>: <value>, ...}
+    """
+    spec = {'class': type(mechanism).__name__, 'name': mechanism.name}
+    for parameter in inspect.signature(type(mechanism).__init__).parameters:
+        if parameter != 'self' and hasattr(mechanism, parameter):
+            spec[parameter] = getattr(mechanism, parameter)
+    return spec
+
+
+def cell_key(spec: Dict) -> str:
+    """
+    Hex sha256 of a cell description.
+
+    Args:
+        spec: JSON-serialisable description of everything the results depend on
+
+    Returns:
+        key: 64-character hex digest
+    """
+    payload = {'engine_version': ENGINE_VERSION, 'numpy': np.__version__, 'cell': spec}
+    canonical = json.dumps(payload, sort_keys=True, separators=(',', ':'), default=float)
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
+class ResultCache:
+    """
+    Directory of .npz result files keyed by cell_key, bounded by size.
+
+    Writes go through a temporary file and os.replace, so concurrent sweeps
+    sharing a directory never read a partial entry.
+    """
+
+    def __init__(self, directory: str, max_bytes: int = DEFAULT_CACHE_BYTES):
+        """
+        Args:
+            directory: Cache directory (created if missing)
+            max_bytes: Total size above which the oldest entries are evicted
+        """
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.npz")
+
+    def get(self, spec: Dict) -> Optional[Union[SimulationResults, np.ndarray]]:
+        """
+        Cached value of a cell, or None on a miss.
+
+        Args:
+            spec: Cell description
+
+        Returns:
+            value: SimulationResults or array as stored by put, or None
+        """
+        path = self._path(cell_key(spec))
+        try:
+            with np.load(path, allow_pickle=False) as archive:
+                stored = {name: archive[name] for name in archive.files}
+            if stored.pop('__kind__') == 'array':
+                value = stored['values']
+            else:
+                value = SimulationResults(**{
+                    field.name: stored[field.name].item() if stored[field.name].ndim == 0
+                    else stored[field.name]
+                    for field in fields(SimulationResults)
+                })
+        except FileNotFoundError:
+            # Never stored, or evicted in the meantime: recompute
+            self.misses += 1
+            return None
+        except (OSError, ValueError, KeyError, zipfile.BadZipFile):
+            # Truncated or corrupt entry: drop it so put can replace it
+            self._discard(path)
+            self.misses += 1
+            return None
+
+        os.utime(path)
+        self.hits += 1
+        return value
+
+    @staticmethod
+    def _discard(path: str):
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            pass
+
+    def put(self, spec: Dict, value: Union[SimulationResults, np.ndarray]):
+        """
+        Store a cell and evict old entries if the cache is over its size.
+
+        Args:
+            spec: Cell description
+            value: SimulationResults or a plain array
+        """
+        if isinstance(value, SimulationResults):
+            arrays = {field.name: np.asarray(getattr(value, field.name))
+                      for field in fields(SimulationResults)}
+            arrays['__kind__'] = np.array('results')
+        else:
+            arrays = {'values': np.asarray(value), '__kind__': np.array('array')}
+        arrays['__spec__'] = np.array(json.dumps(spec, sort_keys=True, default=float))
+
+        handle, temporary = tempfile.mkstemp(suffix='.npz', dir=self.directory)
+        try:
+            with os.fdopen(handle, 'wb') as f:
+                np.savez(f, **arrays)
+            os.replace(temporary, self._path(cell_key(spec)))
+        except BaseException:
+            os.unlink(temporary)
+            raise
+
+        self.evict()
+
+    def fetch(self, spec: Dict, compute: Callable[[], Union[SimulationResults, np.ndarray]]):
+        """
+        Cached value of a cell, computing and storing it on a miss.
+
+        Args:
+            spec: Cell description
+            compute: Zero-argument function producing the value
+
+        Returns:
+            value: SimulationResults or array
+        """
+        value = self.get(spec)
+        if value is None:
+            value = compute()
+            self.put(spec, value)
+        return value
+
+    def evict(self):
+        """Delete least recently used entries until the cache fits in max_bytes"""
+        entries = []
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith('.npz') and len(entry.name) == 68:
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+
+    def summary(self) -> str:
+        """One-line hit/miss count"""
+        return f"result cache {self.directory}: {self.hits} hits, {self.misses} misses"
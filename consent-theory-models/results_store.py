@@ -0,0 +1,342 @@
+#!/usr/bin/env python3
+"""
+Columnar Binary Store for DoCS Simulation Results
+
+A results cell (one mechanism in one dynamic mode) is a handful of numeric
+arrays — alpha and friction as (run, timestep) float64, final legitimacy per
+run — plus a few labels. Instead of one CSV row per (run, timestep) with the
+labels repeated on every row, a cell is stored as a single .npz archive:
+
+1. One member per array, written by a single np.savez call
+2. Labels and scalars in a JSON '__metadata__' member
+3. Uncompressed members are memory-mapped on load, so reading one cell (or a
+   slice of runs from it) costs no parsing and only touches the pages used
+
+compress=True trades the memory mapping for deflated members (smaller files
+that are read fully into memory).
+
+Archived CSVs (the dynamics_results_<mode>_<mechanism>.csv schema) are
+consolidated by ingest_csvs into one TrajectoryStore directory: a raw
+float64 file holding every cell as contiguous (run, timestep) blocks, and an
+index.json mapping (mode, mechanism) to byte offsets, with both labels
+dictionary-encoded. Re-ingesting a cell appends its new block and then
+compacts the data file, so superseded blocks do not accumulate. Command line:
+
+    python results_store.py ../data/dynamics_results_*.csv --store ../data/trajectory_store
+
+Author: Farzulla (2025)
+"""
+
+import argparse
+import json
+import os
+import struct
+import zipfile
+import numpy as np
+import numpy.lib.format as npy_format
+import pandas as pd
+from typing import Dict, List, Tuple
+
+STORE_VERSION = 1
+
+METADATA_MEMBER = '__metadata__'
+
+# Trajectory store layout
+STORE_INDEX = 'index.json'
+STORE_DATA = 'trajectories.f8'
+STORE_DTYPE = np.dtype('<f8')
+
+# CSV rows parsed per chunk during ingestion
+INGEST_CHUNK_ROWS = 1 << 17
+
+# Explicit dtypes of the dynamics_results CSV schema
+CSV_DTYPES = {
+    'mechanism': 'category',
+    'dynamic_mode': 'category',
+    'run': np.int64,
+    'timestep': np.int64,
+    'alpha': np.float64,
+    'friction': np.float64,
+    'population': np.float64
+}
+TRAJECTORY_COLUMNS = ['alpha', 'friction', 'population']
+
+# Fixed part of a zip local file header: signature, versions, flags,
+# compression, times, crc, sizes, then the name and extra-field lengths
+_LOCAL_HEADER = struct.Struct('<4s5H3L2H')
+
+
+def save_columns(path: str, arrays: Dict[str, np.ndarray], metadata: Dict = None,
+                 compress: bool = False):
+    """
+    Write named arrays and JSON metadata to one .npz archive.
+
+    Args:
+        path: Output path (.npz)
+        arrays: {name: array}; object arrays are not supported
+        metadata: JSON-serialisable labels and scalars
+        compress: Deflate members (disables memory mapping on load)
+    """
+    members = {name: np.asarray(array) for name, array in arrays.items()}
+    members[METADATA_MEMBER] = np.array(json.dumps(
+        {'store_version': STORE_VERSION, **(metadata or {})}, default=float))
+
+    save = np.savez_compressed if compress else np.savez
+    save(path, **members)
+
+
+def _memmap_member(f, path: str, info: zipfile.ZipInfo) -> np.ndarray:
+    """Memory-map a stored (uncompressed) .npy member of an open zip file"""
+    f.seek(info.header_offset)
+    header = _LOCAL_HEADER.unpack(f.read(_LOCAL_HEADER.size))
+    name_length, extra_length = header[-2], header[-1]
+    f.seek(info.header_offset + _LOCAL_HEADER.size + name_length + extra_length)
+
+    version = npy_format.read_magic(f)
+    if version == (1, 0):
+        shape, fortran_order, dtype = npy_format.read_array_header_1_0(f)
+    else:
+        shape, fortran_order, dtype = npy_format.read_array_header_2_0(f)
+
+    if dtype.hasobject or int(np.prod(shape)) == 0:
+        return None
+    return np.memmap(path, dtype=dtype, mode='r', shape=shape,
+                     order='F' if fortran_order else 'C', offset=f.tell())
+
+
+def load_columns(path: str, mmap: bool = True) -> Tuple[Dict[str, np.ndarray], Dict]:
+    """
+    Read an archive written by save_columns.
+
+    Args:
+        path: Archive path
+        mmap: Memory-map uncompressed members (read-only) instead of loading them
+
+    Returns:
+        arrays: {name: array}
+        metadata: Decoded JSON metadata
+    """
+    arrays = {}
+    with zipfile.ZipFile(path) as archive, open(path, 'rb') as f:
+        for info in archive.infolist():
+            name = info.filename[:-len('.npy')]
+            array = None
+            if mmap and info.compress_type == zipfile.ZIP_STORED:
+                array = _memmap_member(f, path, info)
+            if array is None:
+                with archive.open(info) as member:
+                    array = npy_format.read_array(member, allow_pickle=False)
+            arrays[name] = array
+
+    metadata = json.loads(str(arrays.pop(METADATA_MEMBER)[()]))
+    return arrays, metadata
+
+
+# ==============================================================================
+# TRAJECTORY STORE
+# ==============================================================================
+
+def _grow(values: np.ndarray, n_runs: int, n_timesteps: int) -> np.ndarray:
+    """Return values enlarged (NaN-filled) to at least (n_runs, n_timesteps), doubling rows"""
+    rows, columns = values.shape
+    if n_runs <= rows and n_timesteps <= columns:
+        return values
+    grown = np.full((max(n_runs, 2 * rows) if n_runs > rows else rows, max(n_timesteps, columns)),
+                    np.nan, dtype=STORE_DTYPE)
+    grown[:rows, :columns] = values
+    return grown
+
+
+def _read_csv_cells(path: str, chunk_rows: int) -> Dict[Tuple[str, str], Dict[str, np.ndarray]]:
+    """
+    Stream one CSV in chunks and scatter it into (run, timestep) arrays per cell.
+
+    Each chunk is scattered into the cell arrays as soon as it is parsed
+    (growing them when a chunk reaches a new run or timestep), so memory is
+    the binary cells plus one chunk. Rows may come in any order; (run,
+    timestep) pairs missing from the file are left as NaN.
+    """
+    cells = {}
+    extents = {}
+    reader = pd.read_csv(path, chunksize=chunk_rows, dtype=CSV_DTYPES)
+    for chunk in reader:
+        columns = [name for name in TRAJECTORY_COLUMNS if name in chunk.columns]
+        for (mechanism, mode), rows in chunk.groupby(['mechanism', 'dynamic_mode'], observed=True):
+            key = (mode, mechanism)
+            runs = rows['run'].to_numpy()
+            timesteps = rows['timestep'].to_numpy()
+            n_runs = max(extents.get(key, (0, 0))[0], int(runs.max()) + 1)
+            n_timesteps = max(extents.get(key, (0, 0))[1], int(timesteps.max()) + 1)
+            extents[key] = (n_runs, n_timesteps)
+
+            cell = cells.setdefault(key, {name: np.full((0, 0), np.nan, dtype=STORE_DTYPE)
+                                          for name in columns})
+            for name in columns:
+                cell[name] = _grow(cell[name], n_runs, n_timesteps)
+                cell[name][runs, timesteps] = rows[name].to_numpy()
+
+    # Trim the doubling slack
+    return {key: {name: values[:extents[key][0], :extents[key][1]]
+                  for name, values in cell.items()}
+            for key, cell in cells.items()}
+
+
+def _block_bytes(entry: Dict) -> int:
+    """Size in bytes of one cell's columns in the data file"""
+    return entry['n_runs'] * entry['n_timesteps'] * len(entry['columns']) * STORE_DTYPE.itemsize
+
+
+def _compact(data_path: str, index: Dict):
+    """
+    Rewrite the data file with only the blocks the index refers to.
+
+    Live blocks are copied in index order to a temporary file that then
+    replaces the data file; offsets in index are updated in place.
+    """
+    temporary = data_path + '.compact'
+    with open(data_path, 'rb') as source, open(temporary, 'wb') as data:
+        for entry in index['cells']:
+            source.seek(entry['offset'])
+            size = _block_bytes(entry)
+            entry['offset'] = data.tell()
+            data.write(source.read(size))
+    os.replace(temporary, data_path)
+
+
+def ingest_csvs(paths: List[str], store_dir: str, append: bool = False,
+                chunk_rows: int = INGEST_CHUNK_ROWS) -> Dict:
+    """
+    Convert dynamics_results CSVs into a TrajectoryStore.
+
+    Each CSV is parsed in chunks of chunk_rows with CSV_DTYPES; only one
+    file's cells are held in memory at a time. A cell's columns are written
+    back to back as (n_runs, n_timesteps) float64 blocks.
+
+    Args:
+        paths: CSV files (each may hold one or more (mode, mechanism) cells)
+        store_dir: Store directory (created if missing)
+        append: Add to an existing store; a re-ingested cell replaces the
+            earlier one, whose block is dropped by compacting the data file
+            (rewriting every live block) once all paths are ingested
+        chunk_rows: Rows parsed per chunk
+
+    Returns:
+        index: The written index
+    """
+    os.makedirs(store_dir, exist_ok=True)
+    index_path = os.path.join(store_dir, STORE_INDEX)
+    data_path = os.path.join(store_dir, STORE_DATA)
+
+    if append and os.path.exists(index_path):
+        with open(index_path) as f:
+            index = json.load(f)
+    else:
+        index = {'store_version': STORE_VERSION, 'dtype': STORE_DTYPE.str,
+                 'dictionaries': {'dynamic_mode': [], 'mechanism': []}, 'cells': []}
+    dictionaries = index['dictionaries']
+
+    def encode(field, value):
+        if value not in dictionaries[field]:
+            dictionaries[field].append(value)
+        return dictionaries[field].index(value)
+
+    superseded = False
+    with open(data_path, 'ab' if append else 'wb') as data:
+        for path in paths:
+            for (mode, mechanism), cell in _read_csv_cells(path, chunk_rows).items():
+                codes = {'dynamic_mode': encode('dynamic_mode', mode),
+                         'mechanism': encode('mechanism', mechanism)}
+                live = [entry for entry in index['cells']
+                        if {k: entry[k] for k in codes} != codes]
+                superseded |= len(live) < len(index['cells'])
+                index['cells'] = live
+
+                n_runs, n_timesteps = next(iter(cell.values())).shape
+                index['cells'].append({**codes, 'offset': data.tell(), 'n_runs': n_runs,
+                                       'n_timesteps': n_timesteps, 'columns': list(cell),
+                                       'source': os.path.basename(path)})
+                for values in cell.values():
+                    data.write(values.tobytes())
+
+                print(f"✓ Ingested {mode}/{mechanism} ({n_runs}x{n_timesteps}) from {path}")
+
+    if superseded:
+        _compact(data_path, index)
+        print(f"✓ Compacted {data_path} ({os.path.getsize(data_path)} bytes)")
+
+    with open(index_path, 'w') as f:
+        json.dump(index, f, indent=1)
+    return index
+
+
+class TrajectoryStore:
+    """
+    Read-only random access to a store written by ingest_csvs.
+
+    The data file is memory-mapped once; cell() and run() return views into
+    it, so opening a cell or a single run reads only the pages it covers.
+    """
+
+    def __init__(self, store_dir: str):
+        """
+        Args:
+            store_dir: Directory containing index.json and the data file
+        """
+        with open(os.path.join(store_dir, STORE_INDEX)) as f:
+            index = json.load(f)
+        self.dictionaries = index['dictionaries']
+        self._data = np.memmap(os.path.join(store_dir, STORE_DATA),
+                               dtype=np.dtype(index['dtype']), mode='r')
+        self._cells = {
+            (self.dictionaries['dynamic_mode'][entry['dynamic_mode']],
+             self.dictionaries['mechanism'][entry['mechanism']]): entry
+            for entry in index['cells']
+        }
+
+    def keys(self) -> List[Tuple[str, str]]:
+        """(dynamic_mode, mechanism) pairs in the store"""
+        return list(self._cells)
+
+    def __contains__(self, key: Tuple[str, str]) -> bool:
+        return key in self._cells
+
+    def cell(self, dynamic_mode: str, mechanism: str) -> Dict[str, np.ndarray]:
+        """
+        All trajectories of one cell.
+
+        Args:
+            dynamic_mode: e.g. 'learning'
+            mechanism: e.g. 'Stakes-Weighted DoCS'
+
+        Returns:
+            columns: {'alpha': (n_runs, n_timesteps), 'friction': ..., ['population': ...]}
+        """
+        entry = self._cells[(dynamic_mode, mechanism)]
+        shape = (entry['n_runs'], entry['n_timesteps'])
+        size = shape[0] * shape[1]
+        start = entry['offset'] // self._data.itemsize
+        return {name: self._data[start + i * size:start + (i + 1) * size].reshape(shape)
+                for i, name in enumerate(entry['columns'])}
+
+    def run(self, dynamic_mode: str, mechanism: str, run: int) -> Dict[str, np.ndarray]:
+        """
+        Trajectories of a single run.
+
+        Returns:
+            columns: {'alpha': (n_timesteps,), 'friction': ..., ['population': ...]}
+        """
+        return {name: values[run] for name, values in self.cell(dynamic_mode, mechanism).items()}
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description='Ingest dynamics_results CSVs into an indexed trajectory store')
+    parser.add_argument('csv', nargs='+', help='CSV files to ingest')
+    parser.add_argument('--store', required=True, help='Store directory')
+    parser.add_argument('--append', action='store_true', help='Add to an existing store')
+    parser.add_argument('--chunk-rows', type=int, default=INGEST_CHUNK_ROWS,
+                        help='CSV rows parsed per chunk')
+    args = parser.parse_args()
+
+    index = ingest_csvs(args.csv, args.store, append=args.append, chunk_rows=args.chunk_rows)
+    print(f"\n✓ Store {args.store}: {len(index['cells'])} cells")
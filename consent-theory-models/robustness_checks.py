@@ -22,11 +22,14 @@ warnings.filterwarnings('ignore')
 # Import from main simulation
 from monte_carlo_simulation import (
     EqualVoice, StakesWeighted, Plutocracy, RandomAssignment, ExpertRule,
-    run_mechanism_simulation, SimulationResults
+    run_common_random_numbers, SimulationResults, resolve_rng, run_rng,
+    estimate_mean, sobol_run_count, SAMPLING_METHODS
 )
+from result_cache import ResultCache, mechanism_spec
 
 # Reproducibility
 np.random.seed(42)
+SEED = 42  # Master seed for per-run streams
 
 
 @dataclass
@@ -56,33 +59,56 @@ def compute_gini(values: np.ndarray) -> float:
     return gini
 
 
-def generate_stakes_by_gini(n_agents: int, target_gini: float = 0.4) -> np.ndarray:
+def paired_difference_ci(a: np.ndarray, b: np.ndarray,
+                         confidence: float = 0.95) -> Tuple[float, float, float]:
+    """
+    Mean of the paired differences a - b with a t-based confidence interval.
+
+    Args:
+        a, b: Per-run outcomes evaluated on the same societies
+        confidence: Confidence level of the interval
+
+    Returns:
+        mean_diff, ci_lower, ci_upper
+    """
+    diff = np.asarray(a) - np.asarray(b)
+    mean_diff = np.mean(diff)
+    half_width = stats.t.ppf(0.5 + confidence / 2, len(diff) - 1) * stats.sem(diff)
+    return mean_diff, mean_diff - half_width, mean_diff + half_width
+
+
+def generate_stakes_by_gini(n_agents: int, target_gini: float = 0.4,
+                            rng: np.random.Generator = None) -> np.ndarray:
     """
     Generate stakes distribution targeting specific Gini coefficient.
 
     Args:
         n_agents: Number of agents
         target_gini: Target Gini coefficient (0 = equal, 1 = maximally unequal)
+        rng: Random stream (global state if None)
 
     Returns:
         stakes: Distribution with approximate target Gini
     """
+    rng = resolve_rng(rng)
+
     if target_gini < 0.2:
         # Low inequality: uniform-ish distribution
-        stakes = np.random.uniform(0.9, 1.1, n_agents)
+        stakes = rng.uniform(0.9, 1.1, n_agents)
     elif target_gini < 0.5:
         # Medium inequality: mild Pareto
-        stakes = np.random.pareto(a=3.0, size=n_agents) + 0.5
+        stakes = rng.pareto(a=3.0, size=n_agents) + 0.5
     else:
         # High inequality: extreme Pareto (few high-stakes, many low)
-        stakes = np.random.pareto(a=1.2, size=n_agents) + 0.05
+        stakes = rng.pareto(a=1.2, size=n_agents) + 0.05
         n_high = int(0.1 * n_agents)
         stakes[:n_high] *= 10.0  # Top 10% dominate
 
     return stakes / np.mean(stakes)
 
 
-def generate_stakes_pareto(n_agents: int, alpha: float = 1.5) -> np.ndarray:
+def generate_stakes_pareto(n_agents: int, alpha: float = 1.5,
+                           rng: np.random.Generator = None) -> np.ndarray:
     """
     Generate stakes using Pareto distribution with parameter alpha.
 
@@ -92,15 +118,17 @@ def generate_stakes_pareto(n_agents: int, alpha: float = 1.5) -> np.ndarray:
                alpha ≈ 1.2: extreme inequality (Gini ≈ 0.6-0.8)
                alpha ≈ 2.0: moderate inequality (Gini ≈ 0.4)
                alpha ≈ 4.0: low inequality (Gini ≈ 0.2)
+        rng: Random stream (global state if None)
 
     Returns:
         stakes: Pareto-distributed stakes
     """
-    stakes = np.random.pareto(a=alpha, size=n_agents) + 0.1
+    stakes = resolve_rng(rng).pareto(a=alpha, size=n_agents) + 0.1
     return stakes / np.mean(stakes)
 
 
-def parameter_sensitivity_sweep() -> pd.DataFrame:
+def parameter_sensitivity_sweep(sampling: str = 'pseudo', seed: int = None,
+                                cache: ResultCache = None) -> pd.DataFrame:
     """
     Test robustness across population sizes and time horizons.
 
@@ -109,6 +137,24 @@ def parameter_sensitivity_sweep() -> pd.DataFrame:
         - T ∈ {25, 50, 100}
         - 200 runs per combo (fast execution)
 
+    All mechanisms in a combo are evaluated on the same 200 societies, so
+    each row also carries the per-run paired legitimacy difference against
+    Equal Voice with its 95% CI.
+
+    With sampling='antithetic' or 'sobol' the societies come from
+    antithetic pairs or scrambled Sobol points; the CI then uses the matching
+    estimator and variance_reduction reports how much narrower it is than
+    independent sampling would give for the same runs.
+
+    Given a seed and a cache, each (mechanism, N, T) cell is looked up
+    first and only the missing mechanisms are simulated; they still share
+    the combo's societies because those come from the seed alone.
+
+    Args:
+        sampling: Society sampling method (see SAMPLING_METHODS)
+        seed: Master seed (legacy global stream if None; such runs are not cached)
+        cache: Optional ResultCache
+
     Returns:
         results_df: DataFrame with legitimacy by mechanism & parameters
     """
@@ -119,6 +165,8 @@ def parameter_sensitivity_sweep() -> pd.DataFrame:
     population_sizes = [50, 100, 200]
     time_periods = [25, 50, 100]
     n_runs = 200  # Reduced from 1000 for speed
+    if sampling == 'sobol':
+        n_runs = sobol_run_count(n_runs)  # Balanced replicates (256)
 
     mechanisms = [
         ('Equal Voice', EqualVoice()),
@@ -128,23 +176,56 @@ def parameter_sensitivity_sweep() -> pd.DataFrame:
         ('Expert Rule', ExpertRule())
     ]
 
+    if cache is not None and seed is None:
+        print("Warning: no seed given, so the parameter sweep runs on the global stream and is not cached\n")
+
     results_list = []
     total_combos = len(population_sizes) * len(time_periods) * len(mechanisms)
     counter = 0
 
     for N in population_sizes:
         for T in time_periods:
+            specs = {mech.name: {'engine': 'common_random_numbers',
+                                 'mechanism': mechanism_spec(mech),
+                                 'dynamic_mode': 'static', 'n_agents': N,
+                                 'n_timesteps': T, 'n_runs': n_runs, 'seed': seed,
+                                 'sampling': sampling}
+                     for _, mech in mechanisms}
+            use_cache = cache is not None and seed is not None
+            paired_results = {name: cache.get(spec) for name, spec in specs.items()} if use_cache else {}
+            missing = [mech for _, mech in mechanisms if paired_results.get(mech.name) is None]
+
+            # One set of societies per combo, shared by every mechanism
+            if missing:
+                computed = run_common_random_numbers(
+                    missing,
+                    n_runs=n_runs,
+                    n_agents=N,
+                    n_timesteps=T,
+                    seed=seed,
+                    sampling=sampling
+                )
+                paired_results.update(computed)
+                if use_cache:
+                    for name, results in computed.items():
+                        cache.put(specs[name], results)
+            baseline = paired_results['Equal Voice'].final_legitimacy
+
             for mech_name, mech in mechanisms:
                 counter += 1
                 print(f"[{counter}/{total_combos}] N={N}, T={T}, {mech_name}...", end=' ', flush=True)
 
-                # Run simulation with custom parameters
-                results = run_mechanism_simulation(
-                    mechanism=mech,
-                    n_runs=n_runs,
-                    n_agents=N,
-                    n_timesteps=T
-                )
+                results = paired_results[mech.name]
+                if sampling == 'pseudo':
+                    diff, diff_lower, diff_upper = paired_difference_ci(results.final_legitimacy, baseline)
+                    variance_reduction = 1.0
+                else:
+                    estimate = estimate_mean(results.final_legitimacy - baseline, sampling)
+                    diff = estimate.mean
+                    diff_lower = diff - estimate.ci_half_width
+                    diff_upper = diff + estimate.ci_half_width
+                    variance_reduction = estimate_mean(results.final_legitimacy,
+                                                       sampling).variance_reduction
 
                 results_list.append({
                     'population_size': N,
@@ -153,17 +234,27 @@ def parameter_sensitivity_sweep() -> pd.DataFrame:
                     'mean_legitimacy': results.mean_legitimacy,
                     'std_legitimacy': results.std_legitimacy,
                     'mean_alpha': results.mean_alpha,
-                    'mean_friction': results.mean_friction
+                    'mean_friction': results.mean_friction,
+                    'diff_vs_equal_voice': diff,
+                    'diff_ci_95_lower': diff_lower,
+                    'diff_ci_95_upper': diff_upper,
+                    'variance_reduction': variance_reduction
                 })
 
                 print(f"L={results.mean_legitimacy:.4f}")
 
     df = pd.DataFrame(results_list)
-    print(f"\n✓ Parameter sweep complete ({len(df)} conditions tested)\n")
+    print(f"\n✓ Parameter sweep complete ({len(df)} conditions tested)")
+    if cache is not None:
+        print(f"  {cache.summary()}")
+    if sampling != 'pseudo':
+        print(f"  {sampling} sampling: mean-legitimacy variance reduced "
+              f"{df['variance_reduction'].median():.2f}x (median over conditions)")
+    print()
     return df
 
 
-def distribution_sensitivity_sweep() -> pd.DataFrame:
+def distribution_sensitivity_sweep(seed: int = SEED, cache: ResultCache = None) -> pd.DataFrame:
     """
     Test robustness across different stakes distributions.
 
@@ -173,6 +264,10 @@ def distribution_sensitivity_sweep() -> pd.DataFrame:
         - High Gini (≈0.7): extreme concentration
         - Pareto α ∈ {1.2, 2.0, 4.0}
 
+    Args:
+        seed: Master seed for the society and mechanism streams
+        cache: Optional ResultCache for the per-run legitimacy of each cell
+
     Returns:
         results_df: DataFrame with legitimacy by mechanism & distribution
     """
@@ -181,13 +276,14 @@ def distribution_sensitivity_sweep() -> pd.DataFrame:
     print("="*80 + "\n")
 
     # Distribution configurations
+    # (name, generator, generator parameters)
     distributions = [
-        ('Low Gini (≈0.2)', lambda n: generate_stakes_by_gini(n, target_gini=0.15)),
-        ('Medium Gini (≈0.4)', lambda n: generate_stakes_by_gini(n, target_gini=0.4)),
-        ('High Gini (≈0.7)', lambda n: generate_stakes_by_gini(n, target_gini=0.7)),
-        ('Pareto α=1.2 (extreme)', lambda n: generate_stakes_pareto(n, alpha=1.2)),
-        ('Pareto α=2.0 (moderate)', lambda n: generate_stakes_pareto(n, alpha=2.0)),
-        ('Pareto α=4.0 (mild)', lambda n: generate_stakes_pareto(n, alpha=4.0))
+        ('Low Gini (≈0.2)', generate_stakes_by_gini, {'target_gini': 0.15}),
+        ('Medium Gini (≈0.4)', generate_stakes_by_gini, {'target_gini': 0.4}),
+        ('High Gini (≈0.7)', generate_stakes_by_gini, {'target_gini': 0.7}),
+        ('Pareto α=1.2 (extreme)', generate_stakes_pareto, {'alpha': 1.2}),
+        ('Pareto α=2.0 (moderate)', generate_stakes_pareto, {'alpha': 2.0}),
+        ('Pareto α=4.0 (mild)', generate_stakes_pareto, {'alpha': 4.0})
     ]
 
     mechanisms = [
@@ -206,48 +302,86 @@ def distribution_sensitivity_sweep() -> pd.DataFrame:
     total_combos = len(distributions) * len(mechanisms)
     counter = 0
 
-    for dist_name, dist_func in distributions:
+    from monte_carlo_simulation import (
+        compute_alpha, compute_performance, compute_legitimacy
+    )
+
+    def draw_societies(dist_name, dist_func):
+        # Draw each society once; every mechanism is evaluated on the same runs
+        societies = []
+        for run in range(n_runs):
+            # Streams are keyed by distribution in place of the dynamic mode
+            rng = run_rng(seed, 'society', dist_name, run)
+
+            # Generate custom stakes
+            stakes = dist_func(n_agents, rng)
+
+            # Wealth (decoupled from stakes)
+            wealth = rng.pareto(a=1.16, size=n_agents) + 0.5
+            rng.shuffle(wealth)
+
+            # Preferences
+            if rng.random() > 0.5:
+                preferences = rng.normal(0, 1, n_agents)
+            else:
+                cluster = rng.choice([0, 1], size=n_agents)
+                preferences = np.where(cluster == 0,
+                                      rng.normal(-1.5, 0.5, n_agents),
+                                      rng.normal(1.5, 0.5, n_agents))
+
+            societies.append((stakes, wealth, preferences))
+        return societies
+
+    def evaluate(mech_name, mech, dist_name, societies):
+        # Custom simulation with specified distribution
+        legitimacy_values = []
+
+        for run, (stakes, wealth, preferences) in enumerate(societies):
+            # Allocate consent and compute legitimacy
+            rng = run_rng(seed, mech_name, dist_name, run)
+            consent = mech.allocate_consent(stakes, wealth, rng=rng)
+            decision = np.sum(consent * preferences)
+
+            alpha = compute_alpha(decision, preferences, stakes, consent)
+            performance = compute_performance(decision, preferences, stakes)
+            legitimacy = compute_legitimacy(alpha, performance)
+
+            legitimacy_values.append(legitimacy)
+        return np.array(legitimacy_values)
+
+    for dist_name, generator, dist_params in distributions:
+        def dist_func(n, rng=None):
+            return generator(n, rng=rng, **dist_params)
+
+        # Societies are only drawn once something misses the cache
+        societies = None
+        society_spec = {'engine': 'distribution_sweep',
+                        'distribution': {'name': dist_name, 'generator': generator.__name__,
+                                         **dist_params},
+                        'n_agents': n_agents, 'n_runs': n_runs, 'seed': seed}
+
+        # Actual Gini of the simulated stakes: mean over the shared societies
+        ginis = cache.get({**society_spec, 'statistic': 'gini'}) if cache is not None else None
+        if ginis is None:
+            societies = draw_societies(dist_name, dist_func)
+            ginis = np.array([compute_gini(stakes) for stakes, _, _ in societies])
+            if cache is not None:
+                cache.put({**society_spec, 'statistic': 'gini'}, ginis)
+        actual_gini = float(np.mean(ginis))
+
         for mech_name, mech in mechanisms:
             counter += 1
             print(f"[{counter}/{total_combos}] {dist_name}, {mech_name}...", end=' ', flush=True)
 
-            # Custom simulation with specified distribution
-            legitimacy_values = []
-
-            for run in range(n_runs):
-                # Generate custom stakes
-                stakes = dist_func(n_agents)
-
-                # Wealth (decoupled from stakes)
-                wealth = np.random.pareto(a=1.16, size=n_agents) + 0.5
-                np.random.shuffle(wealth)
-
-                # Preferences
-                if np.random.rand() > 0.5:
-                    preferences = np.random.normal(0, 1, n_agents)
-                else:
-                    cluster = np.random.choice([0, 1], size=n_agents)
-                    preferences = np.where(cluster == 0,
-                                          np.random.normal(-1.5, 0.5, n_agents),
-                                          np.random.normal(1.5, 0.5, n_agents))
-
-                # Allocate consent and compute legitimacy
-                from monte_carlo_simulation import (
-                    compute_alpha, compute_performance, compute_legitimacy
-                )
-
-                consent = mech.allocate_consent(stakes, wealth)
-                decision = np.sum(consent * preferences)
-
-                alpha = compute_alpha(decision, preferences, stakes, consent)
-                performance = compute_performance(decision, preferences, stakes)
-                legitimacy = compute_legitimacy(alpha, performance)
-
-                legitimacy_values.append(legitimacy)
-
-            # Compute actual Gini for this distribution sample
-            sample_stakes = dist_func(n_agents)
-            actual_gini = compute_gini(sample_stakes)
+            spec = {**society_spec, 'mechanism': mechanism_spec(mech),
+                    'dynamic_mode': 'static', 'n_timesteps': n_timesteps}
+            legitimacy_values = cache.get(spec) if cache is not None else None
+            if legitimacy_values is None:
+                if societies is None:
+                    societies = draw_societies(dist_name, dist_func)
+                legitimacy_values = evaluate(mech_name, mech, dist_name, societies)
+                if cache is not None:
+                    cache.put(spec, legitimacy_values)
 
             results_list.append({
                 'distribution': dist_name,
@@ -260,7 +394,10 @@ def distribution_sensitivity_sweep() -> pd.DataFrame:
             print(f"L={np.mean(legitimacy_values):.4f}, Gini={actual_gini:.3f}")
 
     df = pd.DataFrame(results_list)
-    print(f"\n✓ Distribution sweep complete ({len(df)} conditions tested)\n")
+    print(f"\n✓ Distribution sweep complete ({len(df)} conditions tested)")
+    if cache is not None:
+        print(f"  {cache.summary()}")
+    print()
     return df
 
 
@@ -308,6 +445,11 @@ def statistical_significance_tests(param_df: pd.DataFrame) -> Dict:
     # One-sided test: Stakes-Weighted > Equal Voice
     t_stat_onesided, p_value_onesided = stats.ttest_rel(stakes_weighted, equal_voice, alternative='greater')
 
+    # Per-run paired CIs within each condition (common random numbers)
+    stakes_rows = param_df[param_df['mechanism'] == 'Stakes-Weighted DoCS']
+    paired_half_widths = (stakes_rows['diff_ci_95_upper'] - stakes_rows['diff_ci_95_lower']).values / 2
+    paired_significant = int(np.sum(stakes_rows['diff_ci_95_lower'].values > 0))
+
     results = {
         'paired_t_statistic': t_stat,
         'p_value_two_sided': p_value,
@@ -317,7 +459,9 @@ def statistical_significance_tests(param_df: pd.DataFrame) -> Dict:
         'ci_95_lower': ci_lower,
         'ci_95_upper': ci_upper,
         'rank_consistency_pct': rank_consistency * 100,
-        'n_conditions': len(stakes_weighted)
+        'n_conditions': len(stakes_weighted),
+        'paired_ci_half_width_mean': np.mean(paired_half_widths),
+        'paired_conditions_significant': paired_significant
     }
 
     # Print results
@@ -329,6 +473,8 @@ def statistical_significance_tests(param_df: pd.DataFrame) -> Dict:
     print(f"  Mean legitimacy difference: {mean_diff:.4f}")
     print(f"  95% CI: [{ci_lower:.4f}, {ci_upper:.4f}]")
     print(f"  Rank consistency: {rank_consistency*100:.1f}% ({int(rank_consistency*len(stakes_weighted))}/{len(stakes_weighted)} conditions)")
+    print(f"  Per-run paired 95% CI half-width: ±{np.mean(paired_half_widths):.4f} (mean over conditions)")
+    print(f"  Paired CI excludes zero: {paired_significant}/{len(stakes_rows)} conditions")
     print()
 
     # Interpretation
@@ -664,18 +810,26 @@ def save_text_results(param_df: pd.DataFrame, dist_df: pd.DataFrame,
     print(f"✓ Saved comprehensive results to {output_path}")
 
 
-def main():
-    """Run full robustness check suite"""
+def main(sampling: str = 'pseudo', seed: int = SEED, cache: ResultCache = None):
+    """
+    Run full robustness check suite
+
+    Args:
+        sampling: Society sampling method for the parameter sweep
+        seed: Master seed for both sweeps (None runs the parameter sweep on
+            the global stream, uncached)
+        cache: Optional ResultCache shared by both sweeps
+    """
     print("\n" + "="*80)
     print("ROBUSTNESS CHECKS FOR DOCTRINE OF CONSENSUAL SOVEREIGNTY")
     print("Testing mechanism rankings across parameters & distributions")
     print("="*80 + "\n")
 
     # 1. Parameter sensitivity sweep
-    param_df = parameter_sensitivity_sweep()
+    param_df = parameter_sensitivity_sweep(sampling=sampling, seed=seed, cache=cache)
 
     # 2. Distribution sensitivity sweep
-    dist_df = distribution_sensitivity_sweep()
+    dist_df = distribution_sensitivity_sweep(seed=SEED if seed is None else seed, cache=cache)
 
     # 3. Statistical significance tests
     stat_tests = statistical_significance_tests(param_df)
@@ -736,4 +890,19 @@ def main():
 
 
 if __name__ == '__main__':
-    results = main()
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Robustness checks for DoCS')
+    parser.add_argument('--sampling', choices=SAMPLING_METHODS, default='pseudo',
+                        help='Society sampling for the parameter sweep (variance reduction)')
+    parser.add_argument('--seed', type=int, default=SEED,
+                        help='Master seed for both sweeps (default: %(default)s)')
+    parser.add_argument('--cache-dir', default=None,
+                        help='Reuse cell results stored in this directory')
+    parser.add_argument('--cache-mb', type=int, default=512,
+                        help='Size bound of the result cache in MB (LRU eviction)')
+    args = parser.parse_args()
+
+    cache = None if args.cache_dir is None else ResultCache(args.cache_dir,
+                                                            max_bytes=args.cache_mb * 2**20)
+    results = main(sampling=args.sampling, seed=args.seed, cache=cache)
@@ -0,0 +1,335 @@
+#!/usr/bin/env python3
+"""
+Streaming Statistics for DoCS Monte Carlo Trajectories
+
+Per-timestep summaries that are built one run (or one batch of runs) at a
+time, so sweeps over 10⁵+ runs need O(n_timesteps) memory instead of the
+dense (n_runs, n_timesteps) arrays held by SimulationResults:
+
+1. RunningMoments: Welford mean and variance, merged with Chan's formula
+2. QuantileSketch: DDSketch-style log-bucketed quantiles with bounded relative error
+3. ReservoirSample: uniform sample of whole runs, e.g. for plotting trajectories
+4. TrajectoryAggregate: the above for several named series at once
+
+Every accumulator has merge(), so chunks simulated in separate processes
+combine into the same summary as a single pass.
+
+Author: Farzulla (2025)
+"""
+
+import numpy as np
+from scipy import stats
+from typing import Dict
+
+
+class RunningMoments:
+    """
+    Mean and variance per timestep, updated one batch of runs at a time.
+
+    A batch of k runs is reduced to its own count, mean and sum of squared
+    deviations M2, then combined with the running values (Chan et al.):
+
+        δ = mean_b - mean_a,   n = n_a + n_b
+        mean = mean_a + δ n_b / n
+        M2 = M2_a + M2_b + δ² n_a n_b / n
+
+    With k = 1 this is Welford's update. Merging two accumulators is the same step.
+    """
+
+    def __init__(self, length: int):
+        """
+        Args:
+            length: Values per run (e.g. n_timesteps)
+        """
+        self.count = 0
+        self.mean = np.zeros(length)
+        self.m2 = np.zeros(length)
+
+    def _combine(self, count: int, mean: np.ndarray, m2: np.ndarray):
+        if count == 0:
+            return
+        total = self.count + count
+        delta = mean - self.mean
+        self.mean = self.mean + delta * (count / total)
+        self.m2 = self.m2 + m2 + delta ** 2 * (self.count * count / total)
+        self.count = total
+
+    def update(self, values: np.ndarray):
+        """
+        Fold in runs.
+
+        Args:
+            values: Array of shape (length,) for one run or (k, length) for k runs
+        """
+        values = np.atleast_2d(values)
+        mean = np.mean(values, axis=0)
+        self._combine(len(values), mean, np.sum((values - mean) ** 2, axis=0))
+
+    def merge(self, other: 'RunningMoments'):
+        """Fold in another accumulator over the same timesteps"""
+        self._combine(other.count, other.mean, other.m2)
+
+    def variance(self, ddof: int = 1) -> np.ndarray:
+        """Per-timestep variance (NaN until more than ddof runs are seen)"""
+        if self.count <= ddof:
+            return np.full(self.mean.shape, np.nan)
+        return self.m2 / (self.count - ddof)
+
+    def std(self, ddof: int = 1) -> np.ndarray:
+        """Per-timestep standard deviation"""
+        return np.sqrt(self.variance(ddof))
+
+    def ci_half_width(self, confidence: float = 0.95) -> np.ndarray:
+        """Half-width of the t-based confidence interval for the mean"""
+        if self.count < 2:
+            return np.full(self.mean.shape, np.nan)
+        t_crit = stats.t.ppf((1 + confidence) / 2, self.count - 1)
+        return t_crit * self.std() / np.sqrt(self.count)
+
+
+class QuantileSketch:
+    """
+    Mergeable quantile sketch per timestep for non-negative values (DDSketch).
+
+    With γ = (1 + a) / (1 - a), a positive value x falls in bucket
+    k = ceil(log_γ x) and is reported as 2γ^k / (γ + 1), which is within
+    relative error a of every value in the bucket. Values at or below
+    min_value count as 0. Buckets for all timesteps share one key range, held
+    as a (length, n_buckets) count array that grows as needed. Beyond
+    max_buckets the lowest buckets are collapsed together, which only coarsens
+    the smallest quantiles.
+    """
+
+    def __init__(self, length: int, relative_accuracy: float = 0.01,
+                 max_buckets: int = 2048, min_value: float = 1e-12):
+        """
+        Args:
+            length: Values per run (e.g. n_timesteps)
+            relative_accuracy: Relative error bound a of reported quantiles
+            max_buckets: Bucket limit per timestep
+            min_value: Values at or below this are counted as zero
+        """
+        self.length = length
+        self.relative_accuracy = relative_accuracy
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = np.log(self.gamma)
+        self.max_buckets = max_buckets
+        self.min_value = min_value
+
+        self.key_offset = 0
+        self.counts = np.zeros((length, 0), dtype=np.int64)
+        self.zero_counts = np.zeros(length, dtype=np.int64)
+
+    def _extend(self, key_min: int, key_max: int):
+        """Grow the bucket range to cover [key_min, key_max], collapsing from below if too wide"""
+        n_buckets = self.counts.shape[1]
+        if n_buckets == 0:
+            self.key_offset = key_min
+            self.counts = np.zeros((self.length, key_max - key_min + 1), dtype=np.int64)
+        else:
+            low = min(key_min, self.key_offset)
+            high = max(key_max, self.key_offset + n_buckets - 1)
+            if low < self.key_offset or high >= self.key_offset + n_buckets:
+                counts = np.zeros((self.length, high - low + 1), dtype=np.int64)
+                start = self.key_offset - low
+                counts[:, start:start + n_buckets] = self.counts
+                self.counts, self.key_offset = counts, low
+
+        excess = self.counts.shape[1] - self.max_buckets
+        if excess > 0:
+            self.counts[:, excess] += np.sum(self.counts[:, :excess], axis=1)
+            self.counts = self.counts[:, excess:].copy()
+            self.key_offset += excess
+
+    def update(self, values: np.ndarray):
+        """
+        Fold in runs.
+
+        Args:
+            values: Array of shape (length,) for one run or (k, length) for k runs
+        """
+        values = np.atleast_2d(values)
+        positive = values > self.min_value
+        self.zero_counts += np.sum(~positive & ~np.isnan(values), axis=0)
+        if not positive.any():
+            return
+
+        keys = np.ceil(np.log(values[positive]) / self._log_gamma).astype(np.int64)
+        self._extend(int(keys.min()), int(keys.max()))
+
+        # Keys below a collapsed range land in its lowest bucket
+        n_buckets = self.counts.shape[1]
+        buckets = np.clip(keys - self.key_offset, 0, n_buckets - 1)
+        timesteps = np.nonzero(positive)[1]
+        self.counts += np.bincount(timesteps * n_buckets + buckets,
+                                   minlength=self.length * n_buckets).reshape(self.length, n_buckets)
+
+    def merge(self, other: 'QuantileSketch'):
+        """Fold in another sketch with the same length and accuracy"""
+        self.zero_counts += other.zero_counts
+        n_other = other.counts.shape[1]
+        if n_other == 0:
+            return
+        self._extend(other.key_offset, other.key_offset + n_other - 1)
+        start = max(other.key_offset - self.key_offset, 0)
+        # Any part of other below a collapsed range joins its lowest bucket
+        clipped = self.key_offset - other.key_offset
+        if clipped > 0:
+            self.counts[:, 0] += np.sum(other.counts[:, :min(clipped, n_other)], axis=1)
+            self.counts[:, :max(n_other - clipped, 0)] += other.counts[:, clipped:]
+        else:
+            self.counts[:, start:start + n_other] += other.counts
+
+    def quantile(self, q: float) -> np.ndarray:
+        """Per-timestep q-quantile (NaN where nothing was observed)"""
+        totals = self.zero_counts + np.sum(self.counts, axis=1)
+        rank = q * (totals - 1)
+
+        result = np.full(self.length, np.nan)
+        result[totals > 0] = 0.0
+        in_buckets = (totals > 0) & (rank >= self.zero_counts)
+        if in_buckets.any():
+            cumulative = self.zero_counts[:, np.newaxis] + np.cumsum(self.counts, axis=1)
+            bucket = np.argmax(cumulative > rank[:, np.newaxis], axis=1)
+            keys = bucket + self.key_offset
+            values = 2 * self.gamma ** keys.astype(float) / (self.gamma + 1)
+            result[in_buckets] = values[in_buckets]
+        return result
+
+
+class ReservoirSample:
+    """
+    Uniform sample of at most size runs from a stream (Algorithm R).
+
+    Run j (0-based) replaces a random slot with probability size / (j + 1).
+    Two reservoirs merge exactly: the number of slots taken from the first is
+    hypergeometric in the two stream lengths.
+    """
+
+    def __init__(self, size: int, width: int, seed=None):
+        """
+        Args:
+            size: Runs to keep
+            width: Values per run
+            seed: Seed for the replacement decisions
+        """
+        self.size = size
+        self.seen = 0
+        self.rows = np.empty((0, width))
+        self.rng = np.random.default_rng(seed)
+
+    def update(self, values: np.ndarray):
+        """
+        Fold in runs.
+
+        Args:
+            values: Array of shape (width,) for one run or (k, width) for k runs
+        """
+        values = np.atleast_2d(values)
+        n_fill = max(0, min(self.size - len(self.rows), len(values)))
+        if n_fill:
+            self.rows = np.concatenate([self.rows, values[:n_fill]])
+
+        rest = values[n_fill:]
+        if len(rest):
+            positions = self.seen + n_fill + np.arange(len(rest))
+            slots = self.rng.integers(0, positions + 1)
+            keep = slots < self.size
+            # A slot replaced twice keeps the later run
+            slots, rows = slots[keep][::-1], rest[keep][::-1]
+            slots, first = np.unique(slots, return_index=True)
+            self.rows[slots] = rows[first]
+
+        self.seen += len(values)
+
+    def merge(self, other: 'ReservoirSample'):
+        """Fold in another reservoir over a disjoint set of runs"""
+        if other.seen == 0:
+            return
+        if self.seen == 0:
+            self.rows, self.seen = other.rows.copy(), other.seen
+            return
+
+        n_keep = min(self.size, self.seen + other.seen)
+        n_self = self.rng.hypergeometric(self.seen, other.seen, n_keep)
+        rows_self = self.rows[self.rng.choice(len(self.rows), n_self, replace=False)]
+        rows_other = other.rows[self.rng.choice(len(other.rows), n_keep - n_self, replace=False)]
+        self.rows = np.concatenate([rows_self, rows_other])
+        self.seen += other.seen
+
+
+class TrajectoryAggregate:
+    """
+    Streaming summary of several named per-run series, e.g. alpha and friction
+    trajectories plus final legitimacy.
+
+    Each series gets RunningMoments and a QuantileSketch; optionally a shared
+    reservoir keeps whole runs (all series of the same run together).
+    """
+
+    def __init__(self, lengths: Dict[str, int], reservoir_size: int = 0,
+                 relative_accuracy: float = 0.01, seed=None):
+        """
+        Args:
+            lengths: Series name -> values per run
+            reservoir_size: Whole runs to keep (0 for none)
+            relative_accuracy: Quantile sketch accuracy
+            seed: Seed for the reservoir
+        """
+        self.lengths = dict(lengths)
+        self.moments = {name: RunningMoments(length) for name, length in self.lengths.items()}
+        self.sketches = {name: QuantileSketch(length, relative_accuracy)
+                         for name, length in self.lengths.items()}
+        self.reservoir = (ReservoirSample(reservoir_size, sum(self.lengths.values()), seed)
+                          if reservoir_size > 0 else None)
+
+    @property
+    def count(self) -> int:
+        """Runs folded in so far"""
+        return next(iter(self.moments.values())).count
+
+    def update(self, **series: np.ndarray):
+        """
+        Fold in runs; every series must be given, each as (length,) or (k, length).
+        """
+        for name in self.lengths:
+            values = np.asarray(series[name], dtype=float).reshape(-1, self.lengths[name])
+            self.moments[name].update(values)
+            self.sketches[name].update(values)
+
+        if self.reservoir is not None:
+            self.reservoir.update(np.concatenate(
+                [np.asarray(series[name], dtype=float).reshape(-1, self.lengths[name])
+                 for name in self.lengths], axis=1
+            ))
+
+    def merge(self, other: 'TrajectoryAggregate'):
+        """Fold in an aggregate over a disjoint set of runs"""
+        for name in self.lengths:
+            self.moments[name].merge(other.moments[name])
+            self.sketches[name].merge(other.sketches[name])
+        if self.reservoir is not None and other.reservoir is not None:
+            self.reservoir.merge(other.reservoir)
+
+    def mean(self, name: str) -> np.ndarray:
+        return self.moments[name].mean
+
+    def std(self, name: str, ddof: int = 1) -> np.ndarray:
+        return self.moments[name].std(ddof)
+
+    def ci_half_width(self, name: str, confidence: float = 0.95) -> np.ndarray:
+        return self.moments[name].ci_half_width(confidence)
+
+    def quantile(self, name: str, q: float) -> np.ndarray:
+        return self.sketches[name].quantile(q)
+
+    def sample(self, name: str) -> np.ndarray:
+        """Reservoir runs of one series, shape (n_kept, length)"""
+        if self.reservoir is None:
+            return np.empty((0, self.lengths[name]))
+        start = 0
+        for series, length in self.lengths.items():
+            if series == name:
+                return self.reservoir.rows[:, start:start + length]
+            start += length
+        raise KeyError(name)
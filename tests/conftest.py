@@ -0,0 +1,15 @@
+"""
+Shared pytest setup: the simulation scripts are flat modules, so their
+directories are put on sys.path, and figures render off-screen.
+"""
+
+import os
+import sys
+
+os.environ.setdefault('MPLBACKEND', 'Agg')
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+for directory in ('consent-theory-models', 'code'):
+    path = os.path.join(ROOT, directory)
+    if path not in sys.path:
+        sys.path.insert(0, path)
@@ -0,0 +1,67 @@
+"""Vectorized convergence statistics against the per-run loops they replaced."""
+
+import numpy as np
+import pytest
+
+from convergence_analytics import summarize_mode
+from trajectory_data import TrajectoryCell
+
+
+def _cell(rng, n_runs, n_timesteps, first_timestep=0):
+    # Noisy rising alpha; some runs dip, and some never reach 90% of the final mean
+    alpha = np.clip(np.linspace(0.3, 0.9, n_timesteps) + rng.normal(0, 0.004, (n_runs, n_timesteps)),
+                    0, 1)
+    alpha[:3] *= 0.5
+    alpha[3, 4] -= 0.1
+    friction = 10 - 5 * alpha + rng.random((n_runs, n_timesteps))
+    return TrajectoryCell(runs=np.arange(n_runs),
+                          timesteps=np.arange(first_timestep, first_timestep + n_timesteps),
+                          metrics={'alpha': alpha.astype(np.float32),
+                                   'friction': friction.astype(np.float32)})
+
+
+def _reference(cell, horizon):
+    """The statistics as generate_learning_figures computed them run by run"""
+    alpha, friction = cell['alpha'], cell['friction']
+    final_alpha = alpha[:, -1].mean(dtype=np.float64)
+    initial_alpha = alpha[:, 0].mean(dtype=np.float64)
+    final_friction = friction[:, -1].mean(dtype=np.float64)
+    initial_friction = friction[:, 0].mean(dtype=np.float64)
+
+    times = []
+    for run_alpha in alpha:
+        converged = np.flatnonzero(run_alpha >= 0.9 * final_alpha)
+        times.append(cell.timesteps[converged[0]] if len(converged) > 0 else horizon)
+
+    monotonic_count = sum((np.diff(run_alpha) >= -0.001).all() for run_alpha in alpha)
+    return {
+        'initial_alpha': initial_alpha,
+        'final_alpha': final_alpha,
+        'final_alpha_std': alpha[:, -1].std(ddof=1, dtype=np.float64),
+        'improvement_pct': 100 * (final_alpha - initial_alpha) / initial_alpha,
+        'initial_friction': initial_friction,
+        'final_friction': final_friction,
+        'friction_reduction_pct': 100 * (initial_friction - final_friction) / initial_friction,
+        'monotonic_pct': 100 * monotonic_count / cell.n_runs,
+        'mean_convergence_time': np.mean(times),
+    }
+
+
+@pytest.mark.parametrize('same_grid', [True, False])
+def test_summarize_mode_matches_per_run_loops(same_grid):
+    rng = np.random.default_rng(0)
+    data = {'equal_voice': _cell(rng, 40, 50),
+            'stakes_weighted': _cell(rng, 40, 50),
+            # A different grid forces the per-cell fallback
+            'plutocracy': _cell(rng, 40, 50) if same_grid else _cell(rng, 25, 30, first_timestep=1)}
+
+    summaries = summarize_mode(data, fraction=0.9)
+    for key, cell in data.items():
+        expected = _reference(cell, horizon=len(cell.timesteps))
+        for field, value in expected.items():
+            assert getattr(summaries[key], field) == pytest.approx(value, rel=1e-12, abs=1e-12), \
+                (key, field)
+
+
+def test_summarize_mode_of_no_cells():
+    assert summarize_mode({}) == {}
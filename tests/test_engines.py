@@ -0,0 +1,128 @@
+"""Scalar engine against the baseline code, and batched against scalar."""
+
+import importlib.util
+import subprocess
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+import monte_carlo_simulation as mcs
+import monte_carlo_simulation_dynamic as dynamic
+
+ROOT = Path(__file__).resolve().parents[1]
+BASELINE_COMMIT = 'f253f85'
+
+LEGACY_SEED = 42
+ALL_MODES = ['static', 'learning', 'social', 'stakes', 'exit']
+
+# Batched and scalar engines consume the streams in different orders, so
+# only their means agree; 4.5 standard errors over ~90 comparisons keeps
+# the family-wise false alarm rate negligible
+MEAN_TOLERANCE_SE = 4.5
+
+
+def _load_baseline(module_name):
+    """Import a module as it was in the baseline commit (skip without git history)"""
+    path = f'consent-theory-models/{module_name}.py'
+    try:
+        source = subprocess.run(['git', 'show', f'{BASELINE_COMMIT}:{path}'], cwd=ROOT,
+                                capture_output=True, check=True).stdout
+    except (OSError, subprocess.CalledProcessError):
+        pytest.skip(f'baseline commit {BASELINE_COMMIT} not available')
+
+    spec = importlib.util.spec_from_loader(f'baseline_{module_name}', loader=None)
+    module = importlib.util.module_from_spec(spec)
+    exec(compile(source, path, 'exec'), module.__dict__)
+    return module
+
+
+@pytest.fixture(scope='module')
+def baseline_static():
+    return _load_baseline('monte_carlo_simulation')
+
+
+@pytest.fixture(scope='module')
+def baseline_dynamic():
+    return _load_baseline('monte_carlo_simulation_dynamic')
+
+
+def _baseline_mechanisms(module):
+    """The five baseline mechanisms in grid order"""
+    return [module.EqualVoice(), module.StakesWeighted(), module.Plutocracy(),
+            module.RandomAssignment(), module.ExpertRule()]
+
+
+def _assert_same_results(actual, expected):
+    np.testing.assert_allclose(actual.alpha_trajectory, expected.alpha_trajectory, rtol=0, atol=1e-12)
+    np.testing.assert_allclose(actual.friction_trajectory, expected.friction_trajectory, rtol=0, atol=1e-12)
+    np.testing.assert_allclose(actual.final_legitimacy, expected.final_legitimacy, rtol=0, atol=1e-12)
+
+
+@pytest.mark.parametrize('index', range(5))
+def test_scalar_engine_reproduces_baseline_static(baseline_static, index):
+    baseline_mechanism = _baseline_mechanisms(baseline_static)[index]
+    mechanism = dynamic.build_mechanisms()[index]
+
+    np.random.seed(LEGACY_SEED)
+    expected = baseline_static.run_mechanism_simulation(
+        baseline_mechanism, n_runs=10, n_agents=40, n_timesteps=10)
+    np.random.seed(LEGACY_SEED)
+    actual = mcs.run_mechanism_simulation(mechanism, n_runs=10, n_agents=40, n_timesteps=10)
+
+    _assert_same_results(actual, expected)
+
+
+@pytest.mark.parametrize('mode', ['static', 'learning', 'social', 'stakes'])
+@pytest.mark.parametrize('index', range(5))
+def test_scalar_engine_reproduces_baseline_dynamic(baseline_dynamic, mode, index):
+    baseline_mechanism = _baseline_mechanisms(baseline_dynamic)[index]
+    mechanism = dynamic.build_mechanisms()[index]
+
+    np.random.seed(LEGACY_SEED)
+    expected = baseline_dynamic.run_mechanism_simulation(
+        baseline_mechanism, mode, n_runs=8, n_agents=40, n_timesteps=10)
+    np.random.seed(LEGACY_SEED)
+    actual = dynamic.run_mechanism_simulation(mechanism, mode, n_runs=8, n_agents=40, n_timesteps=10)
+
+    _assert_same_results(actual, expected)
+
+
+def _mean_and_se(values):
+    return np.mean(values), np.std(values, ddof=1) / np.sqrt(len(values))
+
+
+@pytest.mark.parametrize('mode', ALL_MODES)
+def test_batched_means_agree_with_scalar(mode):
+    for scalar_mechanism, batched_mechanism in zip(dynamic.build_mechanisms(adaptive=True),
+                                                   dynamic.build_mechanisms(adaptive=True)):
+        scalar = dynamic.run_mechanism_simulation(scalar_mechanism, mode, n_runs=300, n_agents=50,
+                                                  n_timesteps=20, engine='scalar', seed=7)
+        batched = dynamic.run_mechanism_simulation(batched_mechanism, mode, n_runs=300, n_agents=50,
+                                                   n_timesteps=20, engine='batched', seed=7)
+
+        for metric in ('alpha_trajectory', 'friction_trajectory'):
+            for t in (0, -1):
+                scalar_mean, scalar_se = _mean_and_se(getattr(scalar, metric)[:, t])
+                batched_mean, batched_se = _mean_and_se(getattr(batched, metric)[:, t])
+                assert abs(scalar_mean - batched_mean) <= \
+                    MEAN_TOLERANCE_SE * np.hypot(scalar_se, batched_se) + 1e-12, \
+                    (mode, scalar_mechanism.name, metric, t)
+
+        scalar_mean, scalar_se = _mean_and_se(scalar.final_legitimacy)
+        batched_mean, batched_se = _mean_and_se(batched.final_legitimacy)
+        assert abs(scalar_mean - batched_mean) <= \
+            MEAN_TOLERANCE_SE * np.hypot(scalar_se, batched_se) + 1e-12, (mode, scalar_mechanism.name)
+
+
+def test_sequential_stopping_initial_batch_and_workers():
+    mechanisms = dynamic.build_mechanisms()[:3]
+    kwargs = dict(target_ci=0.035, max_runs=90, batch_runs=20, n_agents=30, n_timesteps=5,
+                  engine='batched', seed=11, initial_runs=50)
+    serial = dynamic.run_until_precise(mechanisms, 'static', **kwargs)
+    parallel = dynamic.run_until_precise(mechanisms, 'static', workers=2, **kwargs)
+
+    for name, result in serial.items():
+        # The first check comes after initial_runs, later ones every batch_runs
+        assert result.n_runs in (50, 70, 90)
+        assert parallel[name] == result
@@ -0,0 +1,194 @@
+"""Fast kernels checked against the direct computations they replace."""
+
+import numpy as np
+import scipy.sparse as sp
+
+import monte_carlo_simulation as mcs
+import monte_carlo_simulation_dynamic as dynamic
+
+
+def _population(rng, n_agents):
+    stakes = rng.pareto(1.5, n_agents) + 0.1
+    preferences = rng.normal(0, 1, n_agents)
+    return preferences, stakes
+
+
+def test_friction_oracle_matches_direct_friction():
+    rng = np.random.default_rng(0)
+    preferences, stakes = _population(rng, 257)
+    oracle = mcs.FrictionOracle(preferences, stakes)
+
+    # Inside, at and beyond the preference range
+    decisions = np.concatenate([rng.normal(0, 1.5, 50), preferences[:5],
+                                [preferences.min() - 1, preferences.max() + 1]])
+    for decision in decisions:
+        expected = mcs.compute_friction(decision, preferences, stakes)
+        assert np.isclose(oracle.friction(decision), expected, rtol=1e-12, atol=1e-9)
+    np.testing.assert_allclose(
+        oracle.friction(decisions),
+        [mcs.compute_friction(d, preferences, stakes) for d in decisions], rtol=1e-12, atol=1e-9)
+
+    metrics = oracle.compute_metrics(decisions[0])
+    direct = mcs.compute_metrics(decisions[0], preferences, stakes)
+    for field in ('alpha', 'friction', 'performance', 'legitimacy'):
+        assert np.isclose(getattr(metrics, field), getattr(direct, field), rtol=1e-12, atol=1e-12)
+
+
+def test_batched_friction_oracle_matches_per_run_oracles():
+    rng = np.random.default_rng(1)
+    populations = [_population(rng, 64) for _ in range(6)]
+    preferences = np.stack([p for p, _ in populations])
+    stakes = np.stack([s for _, s in populations])
+    decisions = rng.normal(0, 1, (6, 9))
+
+    batched = mcs.FrictionOracle(preferences, stakes)
+    expected = np.stack([mcs.FrictionOracle(p, s).friction(d)
+                         for (p, s), d in zip(populations, decisions)])
+    np.testing.assert_allclose(batched.friction(decisions), expected, rtol=1e-12, atol=1e-9)
+    np.testing.assert_array_equal(batched.weighted_median(),
+                                  [mcs.weighted_median(p, s) for p, s in populations])
+
+
+def test_weighted_quickselect_matches_sorted_median():
+    rng = np.random.default_rng(2)
+    for n in (1, 65, 1000, mcs.WEIGHTED_SELECT_MIN_SIZE + 1):
+        values = rng.normal(0, 1, n)
+        weights = rng.pareto(1.2, n)
+        # Repeated values and zero weights exercise the pivot and the boundary
+        values[: n // 4] = values[0]
+        weights[n // 3: n // 2] = 0.0
+
+        expected = mcs.weighted_median(values, weights, sorter=np.argsort(values))
+        assert mcs._weighted_quickselect(values, weights, np.sum(weights) / 2.0) == expected
+        assert mcs.weighted_median(values, weights) == expected
+
+
+def test_weighted_median_batch_matches_rows():
+    rng = np.random.default_rng(3)
+    values = rng.normal(0, 1, (20, 101))
+    weights = rng.pareto(1.2, (20, 101))
+    np.testing.assert_array_equal(mcs.weighted_median_batch(values, weights),
+                                  [mcs.weighted_median(v, w) for v, w in zip(values, weights)])
+
+
+def _learning_reference(prior_mean, stakes, consent, noise):
+    """The learning-mode Bayesian update, one period at a time"""
+    preferences, precision = prior_mean.copy(), 1.0
+    decisions, history = [], []
+    for c, e in zip(consent, noise):
+        decision = np.sum(c * preferences, axis=-1)
+        observed = decision + e
+        posterior_precision = precision + stakes
+        preferences = (precision * preferences + stakes * observed[..., np.newaxis]) / posterior_precision
+        precision = posterior_precision
+        decisions.append(decision)
+        history.append(preferences)
+    return np.array(decisions), np.array(history)
+
+
+def test_learning_scan_matches_recurrence():
+    rng = np.random.default_rng(4)
+    n_steps, n_runs, n_agents = 12, 3, 40
+    prior_mean = rng.normal(0, 1, (n_runs, n_agents))
+    stakes = rng.pareto(1.5, (n_runs, n_agents)) + 0.1
+    consent = rng.dirichlet(np.ones(n_agents), (n_steps, n_runs))
+    noise = rng.normal(0, 0.1, (n_steps, n_runs))
+    expected_decisions, expected_preferences = _learning_reference(prior_mean, stakes, consent, noise)
+
+    decisions, preferences = dynamic.LearningScan(prior_mean, stakes).advance(consent, noise)
+    np.testing.assert_allclose(decisions, expected_decisions, rtol=1e-10, atol=1e-12)
+    np.testing.assert_allclose(preferences, expected_preferences, rtol=1e-10, atol=1e-12)
+
+    # Consecutive blocks continue where the previous one stopped
+    scan = dynamic.LearningScan(prior_mean, stakes)
+    blocks = [scan.advance(consent[a:b], noise[a:b]) for a, b in ((0, 5), (5, 6), (6, 12))]
+    np.testing.assert_allclose(np.concatenate([d for d, _ in blocks]), expected_decisions,
+                               rtol=1e-10, atol=1e-12)
+    np.testing.assert_allclose(np.concatenate([p for _, p in blocks]), expected_preferences,
+                               rtol=1e-10, atol=1e-12)
+
+
+def _two_class_network():
+    """Two closed classes {0, 1, 2} and {3, 4}, transient agents 5 and 6, isolated agent 7"""
+    edges = {0: [1], 1: [2], 2: [0, 1], 3: [4], 4: [3], 5: [0, 3, 6], 6: [5, 4], 7: []}
+    network = np.zeros((8, 8))
+    for agent, neighbours in edges.items():
+        network[agent, neighbours] = 1.0 / len(neighbours) if neighbours else 0.0
+    return network
+
+
+def test_degroot_advance_matches_matrix_power():
+    rng = np.random.default_rng(5)
+    network = _two_class_network()
+    preferences = rng.normal(0, 1, 8)
+    dense = dynamic.DeGrootPropagator(network, influence_strength=0.3)
+    sparse = dynamic.DeGrootPropagator(sp.csr_matrix(network), influence_strength=0.3)
+
+    for n_steps in (0, 1, 13, 100):
+        expected = np.linalg.matrix_power(dense.matrix, n_steps) @ preferences
+        np.testing.assert_allclose(dense.advance(preferences, n_steps), expected, rtol=1e-10, atol=1e-12)
+        np.testing.assert_allclose(sparse.advance(preferences, n_steps), expected, rtol=1e-10, atol=1e-12)
+
+
+def test_degroot_limit_matches_long_iteration():
+    rng = np.random.default_rng(6)
+    network = _two_class_network()
+    preferences = rng.normal(0, 1, 8)
+    propagator = dynamic.DeGrootPropagator(network, influence_strength=0.3)
+
+    expected = np.linalg.matrix_power(propagator.matrix, 1 << 16) @ preferences
+    np.testing.assert_allclose(propagator.limit(preferences), expected, rtol=1e-8, atol=1e-10)
+    assert propagator.limit(preferences)[7] == 0.0
+
+
+def test_batched_learning_blocks_over_runs(monkeypatch):
+    for mechanism in (dynamic.EqualVoice(), dynamic.RandomAssignment()):
+        whole = dynamic.run_learning_mode_batch(mechanism, 7, 30, 12, rng=np.random.default_rng(8))
+        # Blocks of two runs: the scan must not depend on how runs are split
+        monkeypatch.setattr(dynamic, 'LEARNING_SCAN_BLOCK_SIZE', 2 * 12 * 30)
+        blocked = dynamic.run_learning_mode_batch(mechanism, 7, 30, 12, rng=np.random.default_rng(8))
+        monkeypatch.undo()
+        for expected, actual in zip(whole, blocked):
+            np.testing.assert_allclose(actual, expected, rtol=1e-12, atol=1e-12)
+
+
+def test_degroot_powers_of_a_network_stack():
+    rng = np.random.default_rng(7)
+    network = dynamic.erdos_renyi_network(30, 0.15, rng=rng, n_blocks=3).tocoo()
+    blocks = np.zeros((3, 30, 30))
+    blocks[network.row // 30, network.row % 30, network.col % 30] = network.data
+    preferences = rng.normal(0, 1, (3, 30))
+    steps = [5000, 0, 1, 37, 100, 10**6]
+
+    stack = dynamic.DeGrootPropagator(blocks, influence_strength=0.2)
+    powers = stack.powers(preferences, steps)
+    limit = stack.limit(preferences)
+    for i, n_steps in enumerate(steps):
+        for run in range(3):
+            single = dynamic.DeGrootPropagator(blocks[run], influence_strength=0.2)
+            expected = np.linalg.matrix_power(single.matrix, min(n_steps, 5000)) @ preferences[run]
+            np.testing.assert_allclose(powers[i, run], expected, rtol=1e-9, atol=1e-9)
+            np.testing.assert_allclose(single.limit(preferences[run]), limit[run], rtol=1e-9, atol=1e-9)
+    np.testing.assert_allclose(stack.step_all(powers), [stack.advance(p, 1) for p in powers])
+
+
+def test_sparse_degroot_advance_stops_at_the_limit():
+    rng = np.random.default_rng(8)
+    network = dynamic.erdos_renyi_network(200, 0.05, rng=rng, n_blocks=4)
+    preferences = rng.normal(0, 1, 800)
+    propagator = dynamic.DeGrootPropagator(network, influence_strength=0.2)
+
+    # 10^9 matvecs would not finish; the iterate reaches the limit long before
+    far = propagator.advance(preferences, 10**9)
+    np.testing.assert_allclose(far, propagator.limit(preferences), rtol=0, atol=1e-10)
+    np.testing.assert_allclose(propagator.advance(far, 10**9), far, rtol=0, atol=1e-10)
+
+
+def test_long_horizon_batch_dense_and_sparse_agree():
+    checkpoints = [0, 3, 20]
+    results = [dynamic.run_social_mode_long_horizon_batch(
+                   dynamic.StakesWeighted(), 6, 40, checkpoints, sparse=sparse, include_limit=True,
+                   rng=np.random.default_rng(9))
+               for sparse in (False, True)]
+    for dense, sparse in zip(*results):
+        np.testing.assert_allclose(sparse, dense, rtol=1e-9, atol=1e-12)
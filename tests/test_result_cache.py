@@ -0,0 +1,98 @@
+"""ResultCache round trips, keying and eviction."""
+
+import os
+import time
+
+import numpy as np
+
+import monte_carlo_simulation as mcs
+from result_cache import ResultCache, cell_key, mechanism_spec
+
+
+def _results(seed=0):
+    rng = np.random.default_rng(seed)
+    legitimacy = rng.random(4)
+    return mcs.SimulationResults(
+        mechanism_name='Equal Voice',
+        alpha_trajectory=rng.random((4, 3)),
+        friction_trajectory=rng.random((4, 3)),
+        final_legitimacy=legitimacy,
+        mean_alpha=0.5, mean_friction=1.5,
+        mean_legitimacy=float(np.mean(legitimacy)), std_legitimacy=float(np.std(legitimacy)))
+
+
+def test_results_and_arrays_round_trip(tmp_path):
+    cache = ResultCache(str(tmp_path))
+    spec = {'mechanism': mechanism_spec(mcs.StakesWeighted()), 'n_runs': 4, 'seed': 1}
+    results = _results()
+
+    assert cache.get(spec) is None
+    cache.put(spec, results)
+    cached = cache.get(spec)
+    assert cached.mechanism_name == results.mechanism_name
+    assert cached.mean_legitimacy == results.mean_legitimacy
+    np.testing.assert_array_equal(cached.alpha_trajectory, results.alpha_trajectory)
+    np.testing.assert_array_equal(cached.final_legitimacy, results.final_legitimacy)
+
+    values = np.arange(6.0).reshape(2, 3)
+    np.testing.assert_array_equal(cache.fetch({'sweep': 'array'}, lambda: values), values)
+    np.testing.assert_array_equal(cache.fetch({'sweep': 'array'}, lambda: 1 / 0), values)
+    assert (cache.hits, cache.misses) == (2, 2)
+
+
+def test_key_depends_on_every_parameter():
+    spec = {'mechanism': mechanism_spec(mcs.StakesWeighted()), 'n_runs': 4, 'seed': 1}
+    assert cell_key(spec) == cell_key(dict(reversed(list(spec.items()))))
+    assert cell_key(spec) != cell_key({**spec, 'seed': 2})
+    assert cell_key(spec) != cell_key({**spec, 'n_runs': 5})
+    assert cell_key({'mechanism': mechanism_spec(mcs.AdaptiveConsent(learning_rate=0.1))}) != \
+        cell_key({'mechanism': mechanism_spec(mcs.AdaptiveConsent(learning_rate=0.2))})
+
+
+def test_eviction_drops_least_recently_used(tmp_path):
+    cache = ResultCache(str(tmp_path), max_bytes=10**9)
+    for i in range(3):
+        cache.put({'cell': i}, np.zeros(1000))
+    size = os.path.getsize(os.path.join(str(tmp_path), f"{cell_key({'cell': 0})}.npz"))
+
+    # Age the entries, then touch cell 0 so cell 1 is the least recently used
+    now = time.time()
+    for i in range(3):
+        path = os.path.join(str(tmp_path), f"{cell_key({'cell': i})}.npz")
+        os.utime(path, (now - 100 + i, now - 100 + i))
+    assert cache.get({'cell': 0}) is not None
+
+    cache.max_bytes = 2 * size
+    cache.evict()
+    assert cache.get({'cell': 1}) is None
+    assert cache.get({'cell': 0}) is not None
+    assert cache.get({'cell': 2}) is not None
+
+
+def test_corrupt_entries_are_misses_and_deleted(tmp_path):
+    cache = ResultCache(str(tmp_path))
+    path = os.path.join(str(tmp_path), f"{cell_key({'cell': 0})}.npz")
+
+    # Not a zip archive at all
+    with open(path, 'wb') as f:
+        f.write(b'not an npz')
+    assert cache.get({'cell': 0}) is None
+    assert not os.path.exists(path)
+
+    # Truncated archive
+    cache.put({'cell': 0}, np.zeros(1000))
+    with open(path, 'rb') as f:
+        head = f.read(64)
+    with open(path, 'wb') as f:
+        f.write(head)
+    assert cache.get({'cell': 0}) is None
+    assert not os.path.exists(path)
+
+    # A valid archive without the entries put writes
+    np.savez(path, other=np.zeros(3))
+    assert cache.get({'cell': 0}) is None
+    assert not os.path.exists(path)
+
+    np.testing.assert_array_equal(cache.fetch({'cell': 0}, lambda: np.ones(3)), np.ones(3))
+    np.testing.assert_array_equal(cache.get({'cell': 0}), np.ones(3))
+    assert (cache.hits, cache.misses) == (1, 4)
@@ -0,0 +1,147 @@
+"""Round trips through the columnar results store and the trajectory store."""
+
+import csv
+import gzip
+import os
+
+import numpy as np
+import pandas as pd
+
+import monte_carlo_simulation_dynamic as dynamic
+from results_store import ingest_csvs, load_columns, save_columns, TrajectoryStore
+
+
+def _exit_results():
+    return dynamic.run_mechanism_simulation(dynamic.Plutocracy(), 'exit', n_runs=6, n_agents=30,
+                                            n_timesteps=8, engine='batched', seed=3)
+
+
+def test_columns_round_trip_memory_mapped_and_compressed(tmp_path):
+    arrays = {'alpha': np.random.default_rng(0).random((5, 7)),
+              'population': np.arange(35, dtype=np.int64).reshape(5, 7),
+              'empty': np.zeros((0, 3))}
+    metadata = {'mechanism': 'Equal Voice', 'mean_alpha': 0.25}
+
+    for compress, mmap in ((False, True), (False, False), (True, True)):
+        path = str(tmp_path / f'cell_{compress}_{mmap}.npz')
+        save_columns(path, arrays, metadata, compress=compress)
+        loaded, loaded_metadata = load_columns(path, mmap=mmap)
+
+        assert loaded_metadata['mechanism'] == 'Equal Voice'
+        assert loaded_metadata['mean_alpha'] == 0.25
+        for name, values in arrays.items():
+            np.testing.assert_array_equal(loaded[name], values)
+            assert loaded[name].dtype == values.dtype
+        # Only uncompressed, non-empty members can be mapped
+        assert isinstance(loaded['alpha'], np.memmap) == (mmap and not compress)
+        assert not isinstance(loaded['empty'], np.memmap)
+
+
+def test_results_npz_round_trip(tmp_path):
+    results = _exit_results()
+    for compress in (False, True):
+        path = str(tmp_path / f'results_{compress}.npz')
+        dynamic.save_results_npz(results, path, compress=compress)
+        loaded = dynamic.load_results_npz(path)
+
+        assert (loaded.mechanism_name, loaded.dynamic_mode) == ('Plutocracy', 'exit')
+        assert loaded.mean_legitimacy == results.mean_legitimacy
+        np.testing.assert_array_equal(loaded.alpha_trajectory, results.alpha_trajectory)
+        np.testing.assert_array_equal(loaded.friction_trajectory, results.friction_trajectory)
+        np.testing.assert_array_equal(loaded.final_legitimacy, results.final_legitimacy)
+        np.testing.assert_array_equal(loaded.population_trajectory, results.population_trajectory)
+
+
+
+def _reference_csv(results, path):
+    """save_results_csv as a csv.writer row loop"""
+    with open(path, 'w', newline='') as f:
+        writer = csv.writer(f)
+        header = ['mechanism', 'dynamic_mode', 'run', 'timestep', 'alpha', 'friction']
+        population = results.population_trajectory
+        writer.writerow(header + (['population'] if population is not None else []))
+        for run in range(results.alpha_trajectory.shape[0]):
+            for t in range(results.alpha_trajectory.shape[1]):
+                row = [results.mechanism_name, results.dynamic_mode, run, t,
+                       results.alpha_trajectory[run, t], results.friction_trajectory[run, t]]
+                writer.writerow(row + ([population[run, t]] if population is not None else []))
+
+
+def test_results_csv_matches_csv_writer(tmp_path, monkeypatch):
+    # Small chunks so the writer crosses several chunk boundaries
+    monkeypatch.setattr(dynamic, 'CSV_CHUNK_ROWS', 20)
+    static = dynamic.run_mechanism_simulation(dynamic.EqualVoice(), 'static', n_runs=6, n_agents=30,
+                                              n_timesteps=8, engine='batched', seed=3)
+    # A label that needs quoting
+    static.mechanism_name = 'Equal Voice, "quoted"'
+
+    for results in (static, _exit_results()):
+        _reference_csv(results, tmp_path / 'reference.csv')
+        dynamic.save_results_csv(results, str(tmp_path / 'results.csv'))
+        dynamic.save_results_csv(results, str(tmp_path / 'results.csv.gz'))
+        compressed = (tmp_path / 'results.csv.gz').read_bytes()
+
+        expected = (tmp_path / 'reference.csv').read_bytes()
+        assert (tmp_path / 'results.csv').read_bytes() == expected
+        assert gzip.decompress(compressed) == expected
+        # gzip output is reproducible (no timestamp in the header)
+        dynamic.save_results_csv(results, str(tmp_path / 'results.csv.gz'))
+        assert (tmp_path / 'results.csv.gz').read_bytes() == compressed
+
+
+def _trajectory_frame(mechanism, mode, n_runs=7, n_timesteps=5, seed=0):
+    rng = np.random.default_rng(seed)
+    runs, timesteps = np.divmod(np.arange(n_runs * n_timesteps), n_timesteps)
+    return pd.DataFrame({
+        'mechanism': mechanism,
+        'dynamic_mode': mode,
+        'run': runs,
+        'timestep': timesteps,
+        # Dyadic values survive the CSV text round trip exactly
+        'alpha': rng.integers(0, 2**10, n_runs * n_timesteps) / 2**10,
+        'friction': rng.integers(0, 2**16, n_runs * n_timesteps) / 2**8,
+    })
+
+
+def test_ingest_round_trips_shuffled_chunked_csvs(tmp_path):
+    frames = [_trajectory_frame('Equal Voice', 'static', seed=1),
+              _trajectory_frame('Plutocracy', 'learning', n_runs=11, seed=2)]
+    paths = []
+    for i, frame in enumerate(frames):
+        path = tmp_path / f'cell{i}.csv'
+        # Row order must not matter; small chunks force several scatters per cell
+        frame.sample(frac=1, random_state=i).to_csv(path, index=False)
+        paths.append(str(path))
+
+    ingest_csvs(paths, str(tmp_path / 'store'), chunk_rows=4)
+    store = TrajectoryStore(str(tmp_path / 'store'))
+
+    assert sorted(store.keys()) == [('learning', 'Plutocracy'), ('static', 'Equal Voice')]
+    for frame in frames:
+        key = (frame['dynamic_mode'][0], frame['mechanism'][0])
+        n_runs = frame['run'].max() + 1
+        cell = store.cell(*key)
+        np.testing.assert_array_equal(cell['alpha'], frame['alpha'].to_numpy().reshape(n_runs, -1))
+        np.testing.assert_array_equal(cell['friction'], frame['friction'].to_numpy().reshape(n_runs, -1))
+        np.testing.assert_array_equal(store.run(*key, 3)['alpha'], cell['alpha'][3])
+
+
+def test_ingest_append_replaces_a_cell(tmp_path):
+    first = _trajectory_frame('Equal Voice', 'static', seed=1)
+    other = _trajectory_frame('Plutocracy', 'static', n_runs=4, seed=2)
+    second = _trajectory_frame('Equal Voice', 'static', n_runs=3, seed=5)
+    pd.concat([first, other]).to_csv(tmp_path / 'a.csv', index=False)
+    second.to_csv(tmp_path / 'b.csv', index=False)
+
+    ingest_csvs([str(tmp_path / 'a.csv')], str(tmp_path / 'store'))
+    ingest_csvs([str(tmp_path / 'b.csv')], str(tmp_path / 'store'), append=True)
+    store = TrajectoryStore(str(tmp_path / 'store'))
+
+    assert sorted(store.keys()) == [('static', 'Equal Voice'), ('static', 'Plutocracy')]
+    np.testing.assert_array_equal(store.cell('static', 'Equal Voice')['alpha'].ravel(),
+                                  second['alpha'].to_numpy())
+    np.testing.assert_array_equal(store.cell('static', 'Plutocracy')['friction'].ravel(),
+                                  other['friction'].to_numpy())
+    # The replaced block is compacted away: only the live cells remain on disk
+    live_values = 2 * (len(other) + len(second))
+    assert os.path.getsize(tmp_path / 'store' / 'trajectories.f8') == 8 * live_values
@@ -0,0 +1,103 @@
+"""Merges of the streaming accumulators agree with a single pass."""
+
+import copy
+
+import numpy as np
+import pytest
+
+from streaming_stats import RunningMoments, QuantileSketch, TrajectoryAggregate
+
+
+def _chunks(seed=0, length=6):
+    rng = np.random.default_rng(seed)
+    return [rng.pareto(1.3, size=(k, length)) + 0.05 for k in (7, 1, 19)]
+
+
+def test_running_moments_merge_is_associative():
+    chunks = _chunks()
+    parts = []
+    for chunk in chunks:
+        moments = RunningMoments(chunk.shape[1])
+        moments.update(chunk)
+        parts.append(moments)
+
+    left = copy.deepcopy(parts[0])
+    left.merge(parts[1])
+    left.merge(parts[2])
+
+    right = copy.deepcopy(parts[1])
+    right.merge(parts[2])
+    grouped = copy.deepcopy(parts[0])
+    grouped.merge(right)
+
+    values = np.concatenate(chunks)
+    for merged in (left, grouped):
+        assert merged.count == len(values)
+        np.testing.assert_allclose(merged.mean, values.mean(axis=0), rtol=1e-12)
+        np.testing.assert_allclose(merged.variance(), values.var(axis=0, ddof=1), rtol=1e-10)
+
+
+@pytest.mark.parametrize('max_buckets', [8, 2048])
+def test_quantile_sketch_merge_is_associative(max_buckets):
+    parts = []
+    for chunk in _chunks(seed=1):
+        sketch = QuantileSketch(chunk.shape[1], relative_accuracy=0.05, max_buckets=max_buckets)
+        sketch.update(chunk)
+        parts.append(sketch)
+
+    left = copy.deepcopy(parts[0])
+    left.merge(parts[1])
+    left.merge(parts[2])
+
+    right = copy.deepcopy(parts[1])
+    right.merge(parts[2])
+    grouped = copy.deepcopy(parts[0])
+    grouped.merge(right)
+
+    assert left.key_offset == grouped.key_offset
+    np.testing.assert_array_equal(left.counts, grouped.counts)
+    np.testing.assert_array_equal(left.zero_counts, grouped.zero_counts)
+
+
+def _collapsed_sketch():
+    # Keys 0 and 12 need 13 buckets; with 8 the range collapses to keys 5..12
+    sketch = QuantileSketch(1, relative_accuracy=0.5, max_buckets=8)
+    sketch.update(np.array([[1.0], [3.0 ** 12]]))
+    assert sketch.key_offset == 5
+    return sketch
+
+
+@pytest.mark.parametrize('values', [
+    [1.0, 9.0],          # other entirely below the collapsed range
+    [27.0, 3.0 ** 7],    # other partly below it
+])
+def test_quantile_sketch_merge_below_collapsed_range(values):
+    other = QuantileSketch(1, relative_accuracy=0.5, max_buckets=8)
+    other.update(np.array(values)[:, np.newaxis])
+
+    merged = _collapsed_sketch()
+    merged.merge(other)
+
+    # Same as folding the raw values in: keys below the range join bucket 0
+    expected = _collapsed_sketch()
+    expected.update(np.array(values)[:, np.newaxis])
+
+    assert merged.key_offset == expected.key_offset
+    np.testing.assert_array_equal(merged.counts, expected.counts)
+    assert merged.counts.sum() == 4
+
+
+def test_trajectory_aggregate_merge_matches_single_pass():
+    chunks = _chunks(seed=2)
+    single = TrajectoryAggregate({'alpha': 6})
+    merged = TrajectoryAggregate({'alpha': 6})
+    for chunk in chunks:
+        single.update(alpha=chunk)
+        part = TrajectoryAggregate({'alpha': 6})
+        part.update(alpha=chunk)
+        merged.merge(part)
+
+    assert merged.count == single.count
+    np.testing.assert_allclose(merged.mean('alpha'), single.mean('alpha'), rtol=1e-12)
+    np.testing.assert_allclose(merged.std('alpha'), single.std('alpha'), rtol=1e-10)
+    np.testing.assert_array_equal(merged.quantile('alpha', 0.5), single.quantile('alpha', 0.5))
@@ -0,0 +1,37 @@
+"""Pivoting and caching of the shared trajectory loader."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import trajectory_data
+
+
+def test_load_cell_pivots_shuffled_rows(tmp_path):
+    n_runs, n_timesteps = 4, 6
+    runs, timesteps = np.divmod(np.arange(n_runs * n_timesteps), n_timesteps)
+    alpha = np.arange(n_runs * n_timesteps) / 32
+    frame = pd.DataFrame({'mechanism': 'Equal Voice', 'dynamic_mode': 'learning', 'run': runs,
+                          'timestep': timesteps, 'alpha': alpha, 'friction': 2 * alpha})
+    # Drop one (run, timestep) pair and shuffle the rest
+    frame = frame.drop(index=7).sample(frac=1, random_state=0)
+    path = tmp_path / 'dynamics_results_learning_equal_voice.csv'
+    frame.to_csv(path, index=False)
+
+    trajectory_data.clear_cache()
+    cell = trajectory_data.load_cell(path)
+
+    expected = alpha.reshape(n_runs, n_timesteps).astype(np.float32)
+    expected[1, 1] = np.nan
+    np.testing.assert_array_equal(cell['alpha'], expected)
+    np.testing.assert_array_equal(cell['friction'], 2 * expected)
+    np.testing.assert_array_equal(cell.timesteps, np.arange(n_timesteps))
+    assert cell.n_runs == n_runs
+    with pytest.raises(ValueError):
+        cell['alpha'][0, 0] = 1.0
+
+    # Parsed once per path and column set
+    assert trajectory_data.load_cell(str(path)) is cell
+    assert trajectory_data.load_mode(tmp_path, 'learning', ['equal_voice', 'missing'])['equal_voice'] is cell
+    trajectory_data.clear_cache()
+    assert trajectory_data.load_cell(path) is not cell